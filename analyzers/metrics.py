@@ -0,0 +1,53 @@
+"""
+Role Evaluation Metrics
+
+Normalized metrics used by role evaluation and role recommendations, and
+the Player attributes each one is read from.
+"""
+
+from typing import Tuple
+from models.squad_audit import Player
+
+
+# Normalized role-evaluation metrics and the Player attributes they come
+# from, in fallback order (first non-empty value wins, else 0.0)
+METRIC_SOURCES = {
+    'tackles_90': ('tck_90', 'k_tck_90'),
+    'headers_won_90': ('hdrs_w_90',),
+    'header_win_pct': ('hdr_pct',),
+    'clearances_90': ('clr_90',),
+    'interceptions_90': ('int_90',),
+    'blocks_90': ('shts_blckd_90', 'blk_90'),
+    'prog_passes_90': ('pr_passes_90',),
+    'pressures_90': ('pres_c_90',),
+    'dribbles_90': ('drb_90',),
+    'key_passes_90': ('op_kp_90', 'ch_c_90'),
+    'xassists_90': ('xa_90',),
+    'crosses_90': ('op_crs_c_90',),
+    'sprints_90': ('sprints_90',),
+    'shots_on_target_90': ('sht_90', 'shot_90'),
+    'xg_90': ('np_xg_90', 'xg'),
+    'conversion_pct': ('conv_pct',),
+    'pass_pct': ('pas_pct',),
+    'xgp_90': ('xgp_90', 'xgp'),
+    'conceded_90': ('con_90',),
+    'save_pct': ('sv_pct',),
+}
+
+
+def first_set(player: Player, attributes: Tuple[str, ...]) -> float:
+    """
+    First truthy value among a player's attributes.
+
+    Args:
+        player: Player to read from
+        attributes: Player attribute names in fallback order
+
+    Returns:
+        The first non-empty value, or 0.0 if none is set
+    """
+    for attribute in attributes:
+        value = getattr(player, attribute)
+        if value:
+            return value
+    return 0.0
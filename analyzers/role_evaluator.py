@@ -5,12 +5,19 @@ Calculates how well a player's metrics match each of the 12 defined roles.
 Provides scoring, tier classification, and role recommendations.
 """
 
+from bisect import bisect_right
 from dataclasses import dataclass
+from operator import attrgetter
 from typing import Dict, List, Optional
 from models.squad_audit import Player
 from models.role_definitions import RoleProfile, ROLES
 
 
+# Overall score cut-offs and the tier for each band between them
+TIER_THRESHOLDS = (50, 70, 85)
+TIERS = ('POOR', 'AVERAGE', 'GOOD', 'ELITE')
+
+
 @dataclass
 class RoleScore:
     """
@@ -41,7 +48,12 @@ class RoleEvaluator:
         """Initialize the role evaluator."""
         pass
 
-    def evaluate_player_for_role(self, player: Player, role: RoleProfile) -> RoleScore:
+    def evaluate_player_for_role(
+        self,
+        player: Player,
+        role: RoleProfile,
+        player_metrics: Optional[Dict[str, float]] = None
+    ) -> RoleScore:
         """
         Calculate how well player fits a specific role.
 
@@ -59,14 +71,16 @@ class RoleEvaluator:
         Args:
             player: Player object with metrics
             role: RoleProfile to evaluate against
+            player_metrics: Normalized metrics for the player, if already built
 
         Returns:
             RoleScore object with detailed evaluation
         """
         # Get normalized metrics using external logic
-        from services.player_evaluator_service import PlayerEvaluatorService
-        evaluator_service = PlayerEvaluatorService()
-        player_metrics = evaluator_service.get_normalized_metrics(player)
+        if player_metrics is None:
+            from services.player_evaluator_service import PlayerEvaluatorService
+            evaluator_service = PlayerEvaluatorService()
+            player_metrics = evaluator_service.get_normalized_metrics(player)
 
         # Score PRIMARY KPIs (70% weight)
         primary_score = 0.0
@@ -238,16 +252,15 @@ class RoleEvaluator:
         Returns:
             Tier string (ELITE/GOOD/AVERAGE/POOR)
         """
-        if score >= 85:
-            return 'ELITE'
-        elif score >= 70:
-            return 'GOOD'
-        elif score >= 50:
-            return 'AVERAGE'
-        else:
-            return 'POOR'
-
-    def evaluate_all_roles(self, player: Player, allowed_positions: Optional[List[str]] = None) -> List[RoleScore]:
+        # >= 85 ELITE, >= 70 GOOD, >= 50 AVERAGE, else POOR
+        return TIERS[bisect_right(TIER_THRESHOLDS, score)]
+
+    def evaluate_all_roles(
+        self,
+        player: Player,
+        allowed_positions: Optional[List[str]] = None,
+        player_metrics: Optional[Dict[str, float]] = None
+    ) -> List[RoleScore]:
         """
         Evaluate player against all 12 roles.
 
@@ -255,6 +268,7 @@ class RoleEvaluator:
             player: Player to evaluate
             allowed_positions: Optional list of position strings (e.g. ['GK', 'CB', 'ST'])
                               to restrict evaluation to relevant roles.
+            player_metrics: Normalized metrics for the player, if already built
 
         Returns:
             List of RoleScore objects, sorted by score (best to worst)
@@ -269,11 +283,11 @@ class RoleEvaluator:
                 # logger.debug(f"Skipping role {role_name} (needs {role_profile.primary_position})")
                 continue
 
-            score = self.evaluate_player_for_role(player, role_profile)
+            score = self.evaluate_player_for_role(player, role_profile, player_metrics)
             role_scores.append(score)
 
         # Sort by overall_score descending
-        return sorted(role_scores, key=lambda s: s.overall_score, reverse=True)
+        return sorted(role_scores, key=attrgetter('overall_score'), reverse=True)
 
     def get_best_role(self, player: Player) -> RoleScore:
         """
@@ -289,7 +303,9 @@ class RoleEvaluator:
         return all_roles[0]
 
     def get_role_recommendations(self, player: Player, min_score: float = 65.0,
-                                 score_improvement: float = 10.0) -> List[RoleScore]:
+                                 score_improvement: float = 10.0,
+                                 player_metrics: Optional[Dict[str, float]] = None,
+                                 all_scores: Optional[List[RoleScore]] = None) -> List[RoleScore]:
         """
         Get alternative role recommendations for a player.
 
@@ -302,11 +318,14 @@ class RoleEvaluator:
             player: Player to evaluate
             min_score: Minimum score to recommend (default 65)
             score_improvement: Minimum improvement needed (default 10 points)
+            player_metrics: Normalized metrics for the player, if already built
+            all_scores: Scores for all roles from evaluate_all_roles, if already built
 
         Returns:
             List of recommended RoleScore objects
         """
-        all_roles = self.evaluate_all_roles(player)
+        all_roles = all_scores if all_scores is not None else \
+            self.evaluate_all_roles(player, player_metrics=player_metrics)
         best_role = all_roles[0]
 
         recommendations = []
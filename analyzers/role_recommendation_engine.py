@@ -1,9 +1,97 @@
 import re
-from typing import List, Optional, Dict
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Optional, Dict, Tuple
 from models.squad_audit import Player
 from models.role_definitions import ROLES, RoleProfile
+from analyzers.metrics import METRIC_SOURCES, first_set
 from analyzers.role_evaluator import RoleEvaluator, RoleScore
 
+
+@lru_cache(maxsize=256)
+def _position_roles(position_str: str) -> Tuple[str, ...]:
+    """
+    Map an FM position string to its potential roles.
+
+    Squads repeat a few position strings, so each is mapped once and the
+    result shared by every player with that string.
+    """
+    roles = set()
+    pos = position_str.upper()
+
+    # Parse the position string to extract position-lateral combinations
+    # Split by comma first for multiple positions
+    position_parts = [p.strip() for p in pos.split(',')]
+
+    for part in position_parts:
+        # Extract base positions and lateral positions
+        # Format: "POS (LATERAL)" or "POS/POS (LATERAL)" or just "POS"
+        match = re.match(r'([A-Z/]+)\s*\(([RLC]+)\)?', part)
+
+        if match:
+            base_positions = match.group(1).split('/')  # Handle M/AM
+            laterals = list(match.group(2))  # ['R', 'L', 'C']
+        else:
+            # No parentheses, might be just "GK" or "ST"
+            base_positions = [part.strip()]
+            laterals = ['C']  # Default to center
+
+        for base_pos in base_positions:
+            base_pos = base_pos.strip()
+
+            # Goalkeeper
+            if base_pos == 'GK':
+                roles.add('GK')
+
+            # Defender (central)
+            if base_pos == 'D' and 'C' in laterals:
+                roles.add('CB-STOPPER')
+                roles.add('BCB')
+
+            # Defender (wide) / Wing-back
+            if base_pos in ['D', 'WB'] and ('R' in laterals or 'L' in laterals):
+                roles.add('FB')
+                roles.add('WB')
+
+            # Defensive Midfielder
+            if base_pos == 'DM':
+                roles.add('MD')
+
+            # Central Midfielder
+            if base_pos == 'M' and 'C' in laterals:
+                roles.add('MD')
+                roles.add('MC')
+
+            # Wide Midfielder
+            if base_pos == 'M' and ('R' in laterals or 'L' in laterals):
+                roles.add('WAP')
+                roles.add('WAS')
+
+            # Attacking Midfielder (central)
+            if base_pos == 'AM' and 'C' in laterals:
+                roles.add('AM(C)')
+
+            # Attacking Midfielder (wide) / Winger
+            if base_pos == 'AM' and ('R' in laterals or 'L' in laterals):
+                roles.add('WAP')
+                roles.add('WAS')
+
+            # Striker
+            if base_pos in ['ST', 'S']:
+                roles.add('ST-PROVIDER')
+                roles.add('ST-GS')
+
+    return tuple(roles)
+
+
+@lru_cache(maxsize=None)
+def _detector_name(current_role: str, alternative_role: str) -> str:
+    """RoleChangeDetector method name for a role pair, e.g. 'detect_fb_to_wb'."""
+    def slug(role: str) -> str:
+        return role.lower().replace('-', '_').replace('(', '').replace(')', '')
+    return f"detect_{slug(current_role)}_to_{slug(alternative_role)}"
+
+
 class RoleChangeDetector:
     """Specific logic for detecting when role change is warranted."""
     
@@ -16,7 +104,7 @@ class RoleChangeDetector:
             return False
             
         # Specific detection logic based on role pairs
-        method_name = f"detect_{current_role.role.lower().replace('-', '_').replace('(', '').replace(')', '')}_to_{alternative_role.role.lower().replace('-', '_').replace('(', '').replace(')', '')}"
+        method_name = _detector_name(current_role.role, alternative_role.role)
         
         if hasattr(self, method_name):
             return getattr(self, method_name)(player, current_role, alternative_role)
@@ -34,10 +122,11 @@ class RoleChangeDetector:
         return role2 in role1_profile.interchangeable_with or role1 in role2_profile.interchangeable_with
 
     def _get_metric(self, player, metric_name, default=0.0):
-        from services.player_evaluator_service import PlayerEvaluatorService
-        evaluator_service = PlayerEvaluatorService()
-        metrics = evaluator_service.get_normalized_metrics(player)
-        return metrics.get(metric_name, default)
+        # Read just this metric's source attributes rather than normalizing them all
+        sources = METRIC_SOURCES.get(metric_name)
+        if sources is None:
+            return default
+        return first_set(player, sources)
 
     def detect_cb_stopper_to_bcb(self, player, current, alt) -> bool:
         """
@@ -126,8 +215,15 @@ class RoleRecommendationEngine:
         self.evaluator = RoleEvaluator()
         self.detector = RoleChangeDetector()
 
-    def evaluate_all_roles(self, player: Player, allowed_positions: Optional[List[str]] = None) -> List[RoleScore]:
-        return self.evaluator.evaluate_all_roles(player, allowed_positions=allowed_positions)
+    def evaluate_all_roles(
+        self,
+        player: Player,
+        allowed_positions: Optional[List[str]] = None,
+        player_metrics: Optional[Dict[str, float]] = None
+    ) -> List[RoleScore]:
+        return self.evaluator.evaluate_all_roles(
+            player, allowed_positions=allowed_positions, player_metrics=player_metrics
+        )
     
     def get_best_role(self, player: Player) -> RoleScore:
         return self.evaluator.get_best_role(player)
@@ -148,73 +244,10 @@ class RoleRecommendationEngine:
         - "M/AM (RLC)" - M or AM in Right, Left, Center
         - "M (LC), AM (RLC), ST (C)" - Multiple positions
         - "D/WB (R)" - Defender or Wing-back on Right
+
+        Returns a new list each call; the mapping itself is cached per string.
         """
-        roles = set()
-        pos = position_str.upper()
-
-        # Parse the position string to extract position-lateral combinations
-        # Split by comma first for multiple positions
-        position_parts = [p.strip() for p in pos.split(',')]
-
-        for part in position_parts:
-            # Extract base positions and lateral positions
-            # Format: "POS (LATERAL)" or "POS/POS (LATERAL)" or just "POS"
-            match = re.match(r'([A-Z/]+)\s*\(([RLC]+)\)?', part)
-
-            if match:
-                base_positions = match.group(1).split('/')  # Handle M/AM
-                laterals = list(match.group(2))  # ['R', 'L', 'C']
-            else:
-                # No parentheses, might be just "GK" or "ST"
-                base_positions = [part.strip()]
-                laterals = ['C']  # Default to center
-
-            for base_pos in base_positions:
-                base_pos = base_pos.strip()
-
-                # Goalkeeper
-                if base_pos == 'GK':
-                    roles.add('GK')
-
-                # Defender (central)
-                if base_pos == 'D' and 'C' in laterals:
-                    roles.add('CB-STOPPER')
-                    roles.add('BCB')
-
-                # Defender (wide) / Wing-back
-                if base_pos in ['D', 'WB'] and ('R' in laterals or 'L' in laterals):
-                    roles.add('FB')
-                    roles.add('WB')
-
-                # Defensive Midfielder
-                if base_pos == 'DM':
-                    roles.add('MD')
-
-                # Central Midfielder
-                if base_pos == 'M' and 'C' in laterals:
-                    roles.add('MD')
-                    roles.add('MC')
-
-                # Wide Midfielder
-                if base_pos == 'M' and ('R' in laterals or 'L' in laterals):
-                    roles.add('WAP')
-                    roles.add('WAS')
-
-                # Attacking Midfielder (central)
-                if base_pos == 'AM' and 'C' in laterals:
-                    roles.add('AM(C)')
-
-                # Attacking Midfielder (wide) / Winger
-                if base_pos == 'AM' and ('R' in laterals or 'L' in laterals):
-                    roles.add('WAP')
-                    roles.add('WAS')
-
-                # Striker
-                if base_pos in ['ST', 'S']:
-                    roles.add('ST-PROVIDER')
-                    roles.add('ST-GS')
-
-        return list(roles)
+        return list(_position_roles(position_str))
 
     def get_best_role_in_current_position(self, player: Player, all_scores: List[RoleScore] = None) -> Optional[RoleScore]:
         """
@@ -231,18 +264,29 @@ class RoleRecommendationEngine:
         if not valid_scores:
             return None
             
-        return max(valid_scores, key=lambda s: s.overall_score)
-
-    def get_role_recommendations(self, player: Player) -> List[RoleScore]:
+        return max(valid_scores, key=attrgetter('overall_score'))
+
+    def get_role_recommendations(
+        self,
+        player: Player,
+        player_metrics: Optional[Dict[str, float]] = None,
+        all_scores: Optional[List[RoleScore]] = None
+    ) -> List[RoleScore]:
         """
         Get sophisticated role recommendations using specific intelligence rules.
+
+        all_scores, if given, are the player's scores for every role as
+        returned by evaluate_all_roles, so they are not computed again.
         """
-        all_scores = self.evaluate_all_roles(player)
+        if all_scores is None:
+            all_scores = self.evaluate_all_roles(player, player_metrics=player_metrics)
         current_best_role = self.get_best_role_in_current_position(player, all_scores)
         
         # Fallback if we can't determine current role
         if not current_best_role:
-             return self.evaluator.get_role_recommendations(player)
+             return self.evaluator.get_role_recommendations(
+                 player, player_metrics=player_metrics, all_scores=all_scores
+             )
 
         recommendations = []
         valid_role_names = self._map_position_to_roles(player.position)
@@ -16,6 +16,7 @@ from flask_wtf.csrf import CSRFProtect
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from extensions import csrf, limiter, db
+from utils.parallel import parse_n_jobs
 
 # Initialize extensions (will be attached to app in create_app)
 # csrf and limiter are now imported from extensions.py
@@ -99,6 +100,31 @@ def initialize_division_mappings(app):
         app.config['DIVISION_MAPPINGS'] = None
 
 
+def initialize_squad_upload_dir(app):
+    """
+    Create the squad upload directory once on startup.
+
+    Stores the resolved path in app.config['SQUAD_UPLOAD_DIR'] and whether
+    pickled analyses may be cached there in app.config['SQUAD_ANALYSIS_CACHE'].
+    The directory also holds pickles, so caching is only enabled when it is
+    owned by this user and closed to everyone else (mode 0700).
+    """
+    upload_dir = app.config.get('SQUAD_UPLOAD_DIR') or os.path.join(app.instance_path, 'squad_audit_uploads')
+    os.makedirs(upload_dir, mode=0o700, exist_ok=True)
+    app.config['SQUAD_UPLOAD_DIR'] = upload_dir
+
+    if hasattr(os, 'getuid'):
+        info = os.stat(upload_dir)
+        private = info.st_uid == os.getuid() and not info.st_mode & 0o077
+    else:
+        # No POSIX ownership to check (Windows); rely on the instance folder's ACLs
+        private = True
+
+    app.config['SQUAD_ANALYSIS_CACHE'] = private
+    if not private:
+        app.logger.warning(f"Squad analysis caching disabled: {upload_dir} is not private")
+
+
 def create_app(config_class=None):
     """
     Application Factory Pattern.
@@ -118,6 +144,7 @@ def create_app(config_class=None):
     if config_class is None:
         config_class = get_config()
     app.config.from_object(config_class)
+    app.config['ANALYSIS_WORKERS'] = parse_n_jobs(app.config['ANALYSIS_WORKERS'])
 
     # Initialize extensions
     csrf.init_app(app)
@@ -127,6 +154,11 @@ def create_app(config_class=None):
     # Create database tables if they don't exist
     with app.app_context():
         db.create_all()
+        # create_all skips tables that already exist, so build any index
+        # added to an existing table since the database was created
+        for table in db.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(db.engine, checkfirst=True)
         app.logger.info("Database initialized successfully")
 
     # Setup professional logging
@@ -149,6 +181,7 @@ def create_app(config_class=None):
     # Initialize league baselines and division mappings
     initialize_league_baselines(app)
     initialize_division_mappings(app)
+    initialize_squad_upload_dir(app)
 
     # Initialize global data structures
     initialize_blog_categories()
@@ -37,6 +37,8 @@ class Config:
     # File upload settings
     MAX_CONTENT_LENGTH = int(os.environ.get('MAX_UPLOAD_SIZE', 10 * 1024 * 1024))  # 10MB default
     UPLOAD_EXTENSIONS = {'.xlsx', '.xls'}
+    # Squad audit uploads and cached analyses; None uses instance/squad_audit_uploads
+    SQUAD_UPLOAD_DIR = os.environ.get('SQUAD_UPLOAD_DIR')
 
     # Path configuration
     ARTICLES_DIR = BASE_DIR / 'articles'
@@ -48,6 +50,10 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SQLALCHEMY_ECHO = False  # Set to True for SQL query debugging
 
+    # Worker processes for squad, PEAD and baseline analysis
+    # (1 = serial, -1 = one per CPU); validated in create_app
+    ANALYSIS_WORKERS = os.environ.get('ANALYSIS_WORKERS', '1')
+
     # Application settings
     JSON_SORT_KEYS = False
     JSONIFY_PRETTYPRINT_REGULAR = False
@@ -14,6 +14,24 @@ class PositionCategory(Enum):
     W = "W"
     ST = "ST"
 
+# Aggregated position groups for league wage baselines (GK is never grouped)
+POSITION_GROUPS = {
+    PositionCategory.CB: "Defenders",
+    PositionCategory.FB: "Defenders",
+    PositionCategory.DM: "Midfielders",
+    PositionCategory.CM: "Midfielders",
+    PositionCategory.AM: "Midfielders",
+    PositionCategory.W: "Attackers",
+    PositionCategory.ST: "Attackers",
+}
+
+# Representative category stored on each aggregated baseline
+POSITION_GROUP_REPRESENTATIVES = {
+    "Defenders": PositionCategory.CB,
+    "Midfielders": PositionCategory.CM,
+    "Attackers": PositionCategory.ST,
+}
+
 # Position-specific metrics configuration
 # Each position uses specific key metrics for evaluation
 POSITION_METRICS = {
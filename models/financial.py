@@ -2,7 +2,8 @@
 Financial data models for PEAD screening.
 
 Database schema for FTSE 100/250 earnings analysis with SQLAlchemy ORM.
-Tables: Stock, EarningsReport, SUECalculation, UploadBatch, SectorStatistics
+Tables: Stock, EarningsReport, SUECalculation, UploadBatch, SectorStatistics,
+ScreeningResult
 """
 from extensions import db
 from datetime import datetime, date
@@ -77,9 +78,12 @@ class EarningsReport(db.Model):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
-    # Composite index for time-series queries
+    # Composite indexes for time-series queries and per-batch lookups
+    # Each stock has only a few reports, so sorting them newest-first after the
+    # (stock_id, report_date) lookup is cheap and needs no DESC index
     __table_args__ = (
         Index('idx_stock_report_date', 'stock_id', 'report_date'),
+        Index('idx_report_batch_stock', 'upload_batch_id', 'stock_id'),
     )
 
     def __repr__(self):
@@ -190,3 +194,47 @@ class SectorStatistics(db.Model):
 
     def __repr__(self):
         return f'<SectorStatistics {self.sector} - {self.stock_count} stocks>'
+
+
+class ScreeningResult(db.Model):
+    """
+    Denormalized screening row per SUE calculation.
+
+    Copies the stock, earnings report and SUE fields shown by the screener
+    once per batch, so screening reads one table instead of a three-way join.
+    """
+    __tablename__ = 'screening_results'
+
+    id = Column(Integer, primary_key=True)
+    upload_batch_id = Column(Integer, ForeignKey('upload_batches.id'), nullable=False)
+
+    # Stock fields
+    ticker = Column(String(10), nullable=False)
+    company_name = Column(String(200), nullable=False)
+    sector = Column(String(100), nullable=True)
+    ftse_index = Column(String(10), nullable=False)
+
+    # Earnings report fields
+    report_date = Column(Date, nullable=False)
+    reporting_period = Column(String(20), nullable=False)
+    period_type = Column(String(10), nullable=False)
+    actual_eps = Column(Float, nullable=False)
+
+    # SUE calculation fields
+    expected_eps = Column(Float, nullable=True)
+    sue_score = Column(Float, nullable=True)
+    global_decile = Column(Integer, nullable=True)
+    sector_decile = Column(Integer, nullable=True)
+    quality_score = Column(Float, nullable=True)
+    quality_calculation_method = Column(String(30), nullable=True)
+    accruals_ratio = Column(Float, nullable=True)
+    cash_flow_to_assets = Column(Float, nullable=True)
+    recommendation = Column(String(20), nullable=True)
+    recommendation_explanation = Column(String(500), nullable=True)
+
+    __table_args__ = (
+        Index('idx_screening_batch_quality', 'upload_batch_id', 'quality_score'),
+    )
+
+    def __repr__(self):
+        return f'<ScreeningResult {self.ticker} - {self.report_date} - Quality: {self.quality_score}>'
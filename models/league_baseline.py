@@ -7,7 +7,7 @@ used to compare player wages against league averages by position and division.
 
 from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
-from models.constants import PositionCategory
+from models.constants import PositionCategory, POSITION_GROUPS
 
 
 @dataclass
@@ -42,20 +42,26 @@ class LeagueBaselineCollection:
     gk_wage_multiplier: float  # GK-to-outfield wage ratio from top 5 leagues
     division_metadata: Dict[str, int]  # Division → total player count
     _lookup_cache: Dict[Tuple[str, str], LeagueWageBaseline] = field(default_factory=dict, init=False)
+    _aggregated_cache: Dict[Tuple[str, str], LeagueWageBaseline] = field(default_factory=dict, init=False)
 
     def __post_init__(self):
         """Build O(1) lookup cache on initialization."""
         self._build_lookup_cache()
 
     def _build_lookup_cache(self):
-        """Create lookup cache for fast baseline retrieval."""
+        """Create lookup caches for fast baseline retrieval."""
         self._lookup_cache = {}
+        self._aggregated_cache = {}
         for baseline in self.baselines:
             key = (baseline.division, baseline.position_category.value)
             # Store first match (prefer specific over aggregated if multiple exist)
             if key not in self._lookup_cache or not baseline.is_aggregated:
                 self._lookup_cache[key] = baseline
 
+            # Aggregated baselines keyed by group name ("Defenders", ...)
+            if baseline.is_aggregated:
+                self._aggregated_cache.setdefault((baseline.division, baseline.position), baseline)
+
     def get_baseline(self, division: str, position_category: PositionCategory) -> Optional[LeagueWageBaseline]:
         """
         Get baseline for a specific division and position category.
@@ -98,28 +104,12 @@ class LeagueBaselineCollection:
             return specific
 
         # Map to aggregated group
-        group_map = {
-            PositionCategory.CB: "Defenders",
-            PositionCategory.FB: "Defenders",
-            PositionCategory.DM: "Midfielders",
-            PositionCategory.CM: "Midfielders",
-            PositionCategory.AM: "Midfielders",
-            PositionCategory.W: "Attackers",
-            PositionCategory.ST: "Attackers",
-        }
-
-        group_name = group_map.get(position_category)
+        group_name = POSITION_GROUPS.get(position_category)
         if not group_name:
             return specific  # GK or unknown - return whatever we found
 
-        # Look for aggregated baseline
-        for baseline in self.baselines:
-            if (baseline.division == division and
-                baseline.position == group_name and
-                baseline.is_aggregated):
-                return baseline
-
-        return specific  # Fallback to specific even if <30
+        # Look for aggregated baseline, falling back to specific even if <30
+        return self._aggregated_cache.get((division, group_name), specific)
 
     def get_baseline_with_gk_estimation(
         self,
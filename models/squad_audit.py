@@ -3,11 +3,26 @@ Squad Audit Tracker Data Models - Refactored PODOs.
 """
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Optional, List, Dict, Any
 from enum import Enum
 from datetime import date
 from models.constants import PositionCategory
 
+
+@lru_cache(maxsize=1)
+def _position_evaluator():
+    """
+    Shared PlayerEvaluatorService for Player.get_position_category.
+
+    Templates call the helper several times per player, so one evaluator is
+    reused rather than built per call. The category itself is not cached:
+    it depends on stats that the analysis can adjust in place.
+    """
+    from services.player_evaluator_service import PlayerEvaluatorService
+    return PlayerEvaluatorService()
+
+
 class StatusFlag(Enum):
     """Player status flags."""
     INJURED = "Inj"
@@ -128,9 +143,7 @@ class Player:
 
     def get_position_category(self):
         """Helper for templates to get position category."""
-        from services.player_evaluator_service import PlayerEvaluatorService
-        evaluator = PlayerEvaluatorService()
-        return evaluator.get_position_category(self)
+        return _position_evaluator().get_position_category(self)
 
     def get_contract_expiry_relative(self, reference_date: Optional[date] = None) -> str:
         """
@@ -261,6 +274,7 @@ class PlayerAnalysis:
     value_score: float  # Squad-based value score
     verdict: PerformanceVerdict
     recommendation: Recommendation  # Structured recommendation with badge/icon/color
+    position: PositionCategory  # Best-fit position category, taken after any Bayesian adjustment
     top_metrics: List[str] = field(default_factory=list)
     contract_warning: bool = False
     # League comparison fields
@@ -316,7 +330,7 @@ class SquadAnalysisResult:
     """Complete squad analysis results."""
     squad: Squad
     player_analyses: List[PlayerAnalysis] = field(default_factory=list)
-    position_benchmarks: Dict[str, Dict[str, float]] = field(default_factory=dict)
+    position_benchmarks: Dict[PositionCategory, Dict[str, float]] = field(default_factory=dict)
     squad_avg_wage: float = 0.0
     total_players: int = 0
     selected_division: Optional[str] = None  # Division selected for league comparison
@@ -178,7 +178,8 @@ def squad_audit_tracker():
         elif not file.filename.endswith('.html'):
             errors.append("Please upload an HTML file")
         else:
-            html_content = file.read().decode('utf-8')
+            # Raw bytes: decoded once by the manager, stored without re-encoding
+            html_content = file.read()
             analysis_result, analysis_errors = squad_manager.process_squad_upload(
                 html_content,
                 selected_division=selected_division,
@@ -224,15 +225,18 @@ def export_squad_audit():
 
     from services.squad_audit_service import SquadAuditService
     service = SquadAuditService()
-    csv_data = service.export_to_csv_data(analysis_result)
+    rows = service.iter_csv_rows(analysis_result)
+    first_row = next(rows, None)
 
-    if not csv_data:
+    if first_row is None:
         return "No data to export.", 400
 
+    # Rows are formatted as they are written rather than collected first
     output = StringIO()
-    writer = csv.DictWriter(output, fieldnames=csv_data[0].keys())
+    writer = csv.DictWriter(output, fieldnames=first_row.keys())
     writer.writeheader()
-    writer.writerows(csv_data)
+    writer.writerow(first_row)
+    writer.writerows(rows)
 
     response = make_response(output.getvalue())
     response.headers["Content-Disposition"] = "attachment; filename=squad_audit_analysis.csv"
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Build stored screening results for PEAD batches uploaded before they existed.
+
+Usage:
+    python scripts/backfill_screening_results.py
+
+Run once after upgrading an existing database. New uploads store their
+screening results themselves, so later runs find nothing to do.
+"""
+
+import sys
+import os
+
+# Add project root to path for imports
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, project_root)
+
+from app import create_app
+from services.pead_screening_service import PEADScreeningService
+
+
+def main():
+    app = create_app()
+    with app.app_context():
+        backfilled = PEADScreeningService.backfill_screening_results()
+    print(f"Backfilled screening results for {backfilled} PEAD batches")
+
+
+if __name__ == '__main__':
+    main()
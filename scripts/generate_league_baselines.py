@@ -7,6 +7,14 @@ Usage:
 
 Optional: Add GK-specific data from top 5 leagues:
     python scripts/generate_league_baselines.py wage_player_export.html gk_top5_export.html
+
+Set ANALYSIS_WORKERS (1 = serial, -1 = one per CPU) to build divisions in
+worker processes.
+
+Parsed exports are cached in ~/.cache/fm_baselines, keyed by file contents,
+so rerunning on an unchanged export skips the HTML parse. Set
+WAGE_EXPORT_CACHE_DIR to use another directory, or to an empty value to
+always parse.
 """
 
 import sys
@@ -17,6 +25,7 @@ project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, project_root)
 
 from services.league_baseline_generator import LeagueBaselineGenerator
+from utils.parallel import parse_n_jobs
 
 
 def main():
@@ -33,27 +42,27 @@ def main():
 
     print(f"Processing wage export: {input_file}")
 
-    # Read main wage export file
-    with open(input_file, 'r', encoding='utf-8') as f:
-        html_content = f.read()
+    cache_dir = os.environ.get(
+        'WAGE_EXPORT_CACHE_DIR', os.path.join(os.path.expanduser('~'), '.cache', 'fm_baselines')
+    ) or None
 
     generator = LeagueBaselineGenerator()
     print("Parsing player data...")
-    player_data = generator.parse_wage_export_html(html_content)
+    player_data = generator.parse_wage_export_file(input_file, cache_dir=cache_dir)
     print(f"Parsed {len(player_data)} players")
 
     # Add GK data if provided
     if gk_file:
         print(f"\nProcessing GK data from: {gk_file}")
-        with open(gk_file, 'r', encoding='utf-8') as f:
-            gk_html = f.read()
-        gk_data = generator.parse_wage_export_html(gk_html)
+        gk_data = generator.parse_wage_export_file(gk_file, cache_dir=cache_dir)
         player_data.extend(gk_data)
         print(f"Added {len(gk_data)} GK records")
 
     # Generate baselines
     print("\nGenerating baselines...")
-    baselines = generator.generate_baselines(player_data)
+    baselines = generator.generate_baselines(
+        player_data, n_jobs=parse_n_jobs(os.environ.get('ANALYSIS_WORKERS', '1'))
+    )
 
     # Export to JSON
     generator.export_to_json(baselines, output_file)
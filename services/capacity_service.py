@@ -5,6 +5,7 @@ This service encapsulates all business logic for calculating recruiter
 workload, capacity usage, and team summaries.
 """
 
+from collections import Counter
 from typing import List, Dict
 from models import Vacancy, Recruiter, RoleType, RecruitmentStage
 
@@ -250,12 +251,11 @@ class CapacityService:
         total_capacity = sum(r['capacity_percentage'] for r in recruiters_data)
         average_capacity = round(total_capacity / total_recruiters, 1)
 
-        # Count by status
+        # Count by status in one pass
+        counts = Counter(r['status'] for r in recruiters_data)
         status_counts = {
-            'available': sum(1 for r in recruiters_data if r['status'] == 'available'),
-            'near-capacity': sum(1 for r in recruiters_data if r['status'] == 'near-capacity'),
-            'at-capacity': sum(1 for r in recruiters_data if r['status'] == 'at-capacity'),
-            'overloaded': sum(1 for r in recruiters_data if r['status'] == 'overloaded')
+            status: counts[status]
+            for status in ('available', 'near-capacity', 'at-capacity', 'overloaded')
         }
 
         # Determine overall team health
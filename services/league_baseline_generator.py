@@ -5,15 +5,127 @@ This service parses FM wage export HTML files and generates league-wide
 wage baselines for position-based comparisons.
 """
 
+import hashlib
+import os
 import re
-import json
-from typing import List, Dict, Optional
+import sys
+from functools import lru_cache
+from itertools import chain
+from typing import List, Dict, Optional, Tuple
 from datetime import date
 from bs4 import BeautifulSoup
-import statistics
+import numpy as np
+import orjson
+import pandas as pd
 
 from models.league_baseline import LeagueWageBaseline, LeagueBaselineCollection
-from models.constants import PositionCategory
+from models.constants import PositionCategory, POSITION_GROUPS, POSITION_GROUP_REPRESENTATIVES
+from utils.parallel import process_map
+
+
+@lru_cache(maxsize=128)
+def _classify_position(pos: str) -> Optional[PositionCategory]:
+    """
+    Substring rules for mapping a normalized FM position string to a category.
+
+    Args:
+        pos: Upper-cased, stripped position string
+
+    Returns:
+        PositionCategory if mappable, None otherwise
+    """
+    # GK
+    if pos == "GK":
+        return PositionCategory.GK
+
+    # Center Backs
+    if "D (C)" in pos or "DC" == pos:
+        return PositionCategory.CB
+
+    # Full Backs / Wing Backs
+    if any(x in pos for x in ["D (R)", "D (L)", "D/WB", "WB"]):
+        return PositionCategory.FB
+
+    # Defensive Midfielders
+    if pos == "DM" or "DM (" in pos:
+        return PositionCategory.DM
+
+    # Attacking Midfielders (check before CM to avoid false matches)
+    if "AM" in pos:
+        return PositionCategory.AM
+
+    # Central Midfielders
+    if "M (C)" in pos or pos == "MC" or any(x in pos for x in ["M (R)", "M (L)"]):
+        return PositionCategory.CM
+
+    # Wingers
+    if pos == "W" or "W (" in pos or pos in ["AML", "AMR"]:
+        return PositionCategory.W
+
+    # Strikers
+    if "ST" in pos:
+        return PositionCategory.ST
+
+    return None
+
+
+def _wage_stats(wages: np.ndarray) -> Tuple[float, float, float, float]:
+    """
+    Mean, median and 25th/75th percentiles of a non-empty wage array.
+
+    A single partition selects every order statistic needed, and the mean is
+    reduced from the same partitioned buffer. Quartiles use the same
+    "exclusive" interpolation as statistics.quantiles(n=4): virtual index
+    p * (n + 1) - 1 between its two neighbours. Fewer than 4 wages fall
+    back to min/max.
+
+    Args:
+        wages: float64 wage array
+
+    Returns:
+        (mean, median, percentile_25, percentile_75)
+    """
+    n = wages.size
+    mid_lo, mid_hi = (n - 1) // 2, n // 2
+
+    if n >= 4:
+        pos_25 = 0.25 * (n + 1) - 1
+        pos_75 = 0.75 * (n + 1) - 1
+        lo_25, lo_75 = int(pos_25), int(pos_75)
+        kth = {mid_lo, mid_hi, lo_25, lo_25 + 1, lo_75, lo_75 + 1}
+    else:
+        kth = {0, mid_lo, mid_hi, n - 1}
+
+    # O(n) selection of just the order statistics we need, no full sort
+    part = np.partition(wages, sorted(kth))
+
+    mean = part.sum() / n
+    median = (part[mid_lo] + part[mid_hi]) / 2
+
+    if n >= 4:
+        p25 = part[lo_25] + (part[lo_25 + 1] - part[lo_25]) * (pos_25 - lo_25)
+        p75 = part[lo_75] + (part[lo_75 + 1] - part[lo_75]) * (pos_75 - lo_75)
+    else:
+        p25, p75 = part[0], part[-1]
+
+    return float(mean), float(median), float(p25), float(p75)
+
+
+# Single-position strings that appear in FM wage exports, resolved once at
+# import so the per-row lookup is a plain dict hit.
+_KNOWN_FM_POSITIONS = (
+    "GK",
+    "D (C)", "DC", "D (R)", "D (L)", "D/WB (R)", "D/WB (L)", "WB (R)", "WB (L)",
+    "DM", "DM (C)",
+    "M (C)", "MC", "M (R)", "M (L)",
+    "AM (C)", "AM (R)", "AM (L)", "AM (RLC)", "AML", "AMR",
+    "W", "W (R)", "W (L)",
+    "ST", "ST (C)",
+)
+
+_POSITION_MAP: Dict[str, PositionCategory] = {
+    pos: _classify_position(pos) for pos in _KNOWN_FM_POSITIONS
+}
 
 
 class LeagueBaselineGenerator:
@@ -36,6 +148,10 @@ class LeagueBaselineGenerator:
         "German Bundesliga",
         "French Ligue 1"
     ]
+    TOP_5_SET = frozenset(TOP_5_LEAGUES)
+
+    # Bump when parse_wage_export_html output changes, so cached parses are not reused
+    PARSE_CACHE_VERSION = 1
 
     def _parse_wage(self, wage_str: str) -> float:
         """
@@ -83,6 +199,10 @@ class LeagueBaselineGenerator:
         - "AM (C)", "AM (R)", "AM (L)", "AM (RLC)" → AM
         - "ST (C)", "ST" → ST
 
+        Known FM position strings resolve through a precomputed dict;
+        anything else (e.g. multi-position strings) falls back to the
+        memoized substring rules in _classify_position.
+
         Args:
             fm_position: Position string from FM export
 
@@ -95,39 +215,80 @@ class LeagueBaselineGenerator:
         # Normalize position string
         pos = fm_position.upper().strip()
 
-        # GK
-        if pos == "GK":
-            return PositionCategory.GK
+        category = _POSITION_MAP.get(pos)
+        if category is not None:
+            return category
 
-        # Center Backs
-        if "D (C)" in pos or "DC" == pos:
-            return PositionCategory.CB
+        return _classify_position(pos)
 
-        # Full Backs / Wing Backs
-        if any(x in pos for x in ["D (R)", "D (L)", "D/WB", "WB"]):
-            return PositionCategory.FB
+    def parse_wage_export_file(self, path: str, cache_dir: Optional[str] = None) -> List[Dict]:
+        """
+        Parse a wage export straight from disk.
 
-        # Defensive Midfielders
-        if pos == "DM" or "DM (" in pos:
-            return PositionCategory.DM
+        The file is decoded as UTF-8 in one step and the raw bytes are
+        released before parsing, so only the decoded text is held while
+        the tree is built. Invalid UTF-8 raises rather than being guessed.
 
-        # Attacking Midfielders (check before CM to avoid false matches)
-        if "AM" in pos:
-            return PositionCategory.AM
+        With cache_dir, the parsed rows are stored there as JSON keyed by a
+        hash of the file contents, so rerunning on an unchanged export skips
+        the HTML parse, by far the slowest step of baseline generation.
 
-        # Central Midfielders
-        if "M (C)" in pos or pos == "MC" or any(x in pos for x in ["M (R)", "M (L)"]):
-            return PositionCategory.CM
+        Args:
+            path: Path to the FM wage export HTML file
+            cache_dir: Directory for cached parses, or None to always parse
 
-        # Wingers
-        if pos == "W" or "W (" in pos or pos in ["AML", "AMR"]:
-            return PositionCategory.W
+        Returns:
+            List of player dicts with name, position, wage, division
 
-        # Strikers
-        if "ST" in pos:
-            return PositionCategory.ST
+        Raises:
+            UnicodeDecodeError: If the file is not valid UTF-8
+        """
+        with open(path, 'rb') as f:
+            raw = f.read()
+
+        cache_path = None
+        if cache_dir:
+            digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+            cache_path = os.path.join(cache_dir, f"wage_export_v{self.PARSE_CACHE_VERSION}_{digest}.json")
+            players = self._load_parse_cache(cache_path)
+            if players is not None:
+                return players
+
+        html_content = raw.decode('utf-8')
+        del raw
+        players = self.parse_wage_export_html(html_content)
+
+        if cache_path:
+            self._save_parse_cache(cache_path, players)
+        return players
 
-        return None
+    @staticmethod
+    def _load_parse_cache(cache_path: str) -> Optional[List[Dict]]:
+        """Cached parse rows, or None if missing or unreadable."""
+        try:
+            with open(cache_path, 'rb') as f:
+                players = orjson.loads(f.read())
+            for player in players:
+                player['position_category'] = PositionCategory(player['position_category'])
+        except FileNotFoundError:
+            return None
+        except (ValueError, KeyError, TypeError) as e:
+            print(f"Warning: Ignoring unreadable parse cache {cache_path}: {e}")
+            return None
+        return players
+
+    @staticmethod
+    def _save_parse_cache(cache_path: str, players: List[Dict]) -> None:
+        """Write parse rows to the cache, replacing the file atomically."""
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+            with open(temp_path, 'wb') as f:
+                f.write(orjson.dumps(players))
+            os.replace(temp_path, cache_path)
+        except OSError as e:
+            # Caching is only a speed-up; the parse result is still returned
+            print(f"Warning: Could not write parse cache {cache_path}: {e}")
 
     def parse_wage_export_html(self, html_content: str) -> List[Dict]:
         """
@@ -156,24 +317,24 @@ class LeagueBaselineGenerator:
 
         # Read header row to find column indices
         header_row = all_rows[0]
-        headers = [th.get_text().strip() for th in header_row.find_all('th')]
-
-        # Find critical column indices
-        name_idx = None
-        position_idx = None
-        wage_idx = None
-        division_idx = None
-
+        # Header cells are almost always a single text node; th.string reads
+        # it directly, get_text() is only needed for nested markup.
+        headers = [
+            (th.string or th.get_text()).strip()
+            for th in header_row.find_all('th', recursive=False)
+        ]
+
+        # Find critical column indices (last matching header wins)
+        column_indices = {'name': None, 'position': None, 'wage': None, 'division': None}
         for i, header in enumerate(headers):
             header_lower = header.lower()
-            if header_lower == 'name':
-                name_idx = i
-            elif header_lower == 'position':
-                position_idx = i
-            elif header_lower == 'wage':
-                wage_idx = i
-            elif header_lower == 'division':
-                division_idx = i
+            if header_lower in column_indices:
+                column_indices[header_lower] = i
+
+        name_idx = column_indices['name']
+        position_idx = column_indices['position']
+        wage_idx = column_indices['wage']
+        division_idx = column_indices['division']
 
         # Validate we found all required columns
         if name_idx is None or position_idx is None or wage_idx is None or division_idx is None:
@@ -186,34 +347,46 @@ class LeagueBaselineGenerator:
 
         print(f"Using column indices - Name: {name_idx}, Position: {position_idx}, Wage: {wage_idx}, Division: {division_idx}")
 
-        # Parse data rows
+        # Parse data rows. Only cells up to the right-most column we read are
+        # collected; the remaining attribute columns are never visited.
+        max_idx = max(name_idx, position_idx, wage_idx, division_idx)
         players = []
         for row in all_rows[1:]:  # Skip header
-            cells = row.find_all('td')
-            if len(cells) < max(name_idx, position_idx, wage_idx, division_idx) + 1:
+            cells = row.find_all('td', recursive=False, limit=max_idx + 1)
+            if len(cells) <= max_idx:
                 continue
 
             try:
-                # Extract key fields
-                name = cells[name_idx].get_text().strip() if len(cells) > name_idx else ""
-                fm_position = cells[position_idx].get_text().strip() if len(cells) > position_idx else ""
-                wage_str = cells[wage_idx].get_text().strip() if len(cells) > wage_idx else "0"
-                division = cells[division_idx].get_text().strip() if len(cells) > division_idx else ""
+                # Cheapest rejections first: many rows have no wage ("-") or
+                # an unmappable position, so don't extract the other cells
+                # until those pass.
+                wage_str = cells[wage_idx].get_text().strip()
+                if not wage_str or wage_str == "-":
+                    continue
 
-                # Parse values
-                wage = self._parse_wage(wage_str)
+                fm_position = cells[position_idx].get_text().strip()
                 position_category = self._map_position_to_category(fm_position)
+                if not position_category:
+                    continue
 
-                # Skip if invalid
-                if not name or not division or not position_category or wage == 0:
+                wage = self._parse_wage(wage_str)
+                if wage == 0:
                     continue
 
+                name = cells[name_idx].get_text().strip()
+                division = cells[division_idx].get_text().strip()
+                if not name or not division:
+                    continue
+
+                # Division and position repeat across thousands of rows;
+                # interning shares one string object (and its cached hash)
+                # for every later set/dict/categorical lookup.
                 players.append({
                     'name': name,
-                    'position': fm_position,
+                    'position': sys.intern(fm_position),
                     'position_category': position_category,
                     'wage': wage,
-                    'division': division
+                    'division': sys.intern(division)
                 })
 
             except Exception as e:
@@ -236,32 +409,59 @@ class LeagueBaselineGenerator:
         Returns:
             Multiplier (e.g., 0.75 means GKs earn 75% of outfield players)
         """
-        # Filter to top 5 leagues
-        top5_players = [p for p in player_data if p['division'] in self.TOP_5_LEAGUES]
+        # Single pass: running wage totals for top 5 league GKs / outfielders
+        gk_total = outfield_total = 0.0
+        gk_count = outfield_count = 0
+        for p in player_data:
+            if p['division'] not in self.TOP_5_SET:
+                continue
+            if p['position_category'] == PositionCategory.GK:
+                gk_total += p['wage']
+                gk_count += 1
+            else:
+                outfield_total += p['wage']
+                outfield_count += 1
 
-        if not top5_players:
+        return self._gk_multiplier_from_totals(gk_total, gk_count, outfield_total, outfield_count)
+
+    def _gk_multiplier_from_totals(
+        self,
+        gk_total: float,
+        gk_count: int,
+        outfield_total: float,
+        outfield_count: int
+    ) -> float:
+        """
+        Turn top 5 league wage totals into the GK multiplier.
+
+        Args:
+            gk_total: Sum of top 5 league GK wages
+            gk_count: Number of top 5 league GKs
+            outfield_total: Sum of top 5 league outfield wages
+            outfield_count: Number of top 5 league outfield players
+
+        Returns:
+            Multiplier, or the 0.75 default when data is insufficient
+        """
+        if not gk_count and not outfield_count:
             print(f"Warning: No players found from top 5 leagues. Using default GK multiplier 0.75")
             return 0.75
 
-        # Separate GKs and outfield players
-        gk_wages = [p['wage'] for p in top5_players if p['position_category'] == PositionCategory.GK]
-        outfield_wages = [p['wage'] for p in top5_players if p['position_category'] != PositionCategory.GK]
-
-        if not gk_wages or not outfield_wages:
+        if not gk_count or not outfield_count:
             print(f"Warning: Insufficient GK or outfield data in top 5 leagues. Using default 0.75")
             return 0.75
 
-        avg_gk_wage = statistics.mean(gk_wages)
-        avg_outfield_wage = statistics.mean(outfield_wages)
+        avg_gk_wage = gk_total / gk_count
+        avg_outfield_wage = outfield_total / outfield_count
 
         if avg_outfield_wage == 0:
             return 0.75
 
         multiplier = avg_gk_wage / avg_outfield_wage
-        print(f"Calculated GK multiplier: {multiplier:.3f} (from {len(gk_wages)} GKs, {len(outfield_wages)} outfield)")
+        print(f"Calculated GK multiplier: {multiplier:.3f} (from {gk_count} GKs, {outfield_count} outfield)")
         return multiplier
 
-    def generate_baselines(self, player_data: List[Dict]) -> LeagueBaselineCollection:
+    def generate_baselines(self, player_data: List[Dict], n_jobs: int = 1) -> LeagueBaselineCollection:
         """
         Generate wage baselines from player data.
 
@@ -270,107 +470,115 @@ class LeagueBaselineGenerator:
         - Position aggregation for sample sizes <30
         - Division metadata (total player counts)
 
+        Divisions are independent, so with n_jobs != 1 they are spread over
+        a process pool. Worker start-up outweighs the per-division work for
+        typical exports, hence the serial default.
+
         Args:
             player_data: List of player dicts from parse_wage_export_html
+            n_jobs: Worker processes for per-division baselines
+                    (1 = serial, -1 = one per CPU)
 
         Returns:
             LeagueBaselineCollection with all baselines
         """
-        # Calculate GK multiplier first
-        gk_multiplier = self.calculate_gk_multiplier(player_data)
+        if not player_data:
+            return LeagueBaselineCollection(
+                baselines=[],
+                gk_wage_multiplier=self.calculate_gk_multiplier(player_data),
+                division_metadata={}
+            )
+
+        df = self._player_frame(player_data)
+
+        # GK multiplier from the same frame instead of re-scanning player_data
+        top5 = df[df['division'].isin(self.TOP_5_SET)]
+        top5_gk = top5['position_category'] == PositionCategory.GK
+        gk_multiplier = self._gk_multiplier_from_totals(
+            gk_total=float(top5.loc[top5_gk, 'wage'].sum()),
+            gk_count=int(top5_gk.sum()),
+            outfield_total=float(top5.loc[~top5_gk, 'wage'].sum()),
+            outfield_count=int((~top5_gk).sum())
+        )
 
-        # Group by division and position
-        grouped = {}
-        for player in player_data:
-            key = (player['division'], player['position_category'])
-            if key not in grouped:
-                grouped[key] = []
-            grouped[key].append(player)
+        division_frames = list(df.groupby('division', sort=False, observed=True))
 
         # Calculate division metadata (total players per division)
-        division_metadata = {}
-        for player in player_data:
-            div = player['division']
-            division_metadata[div] = division_metadata.get(div, 0) + 1
+        division_metadata = {division: len(frame) for division, frame in division_frames}
 
-        baselines = []
+        divisions = [division for division, _ in division_frames]
+        frames = [frame for _, frame in division_frames]
+        results = process_map(self._baselines_for_division, divisions, frames, n_jobs=n_jobs)
 
-        # Process each division
-        divisions = set(p['division'] for p in player_data)
-        for division in divisions:
-            division_positions = {}
-
-            # Collect all positions for this division
-            for position_cat in PositionCategory:
-                key = (division, position_cat)
-                if key in grouped:
-                    division_positions[position_cat] = grouped[key]
-
-            # Create specific baselines (for positions with ≥30 players)
-            for position_cat, players in division_positions.items():
-                player_count = len(players)
-                if player_count >= 30:
-                    wages = [p['wage'] for p in players]
-                    baselines.append(self._create_baseline(
-                        division=division,
-                        position=players[0]['position'],  # Use FM position string
-                        position_category=position_cat,
-                        wages=wages,
-                        is_aggregated=False
-                    ))
-
-            # Create aggregated baselines
-            # Defenders (CB + FB)
-            defender_players = []
-            if PositionCategory.CB in division_positions:
-                defender_players.extend(division_positions[PositionCategory.CB])
-            if PositionCategory.FB in division_positions:
-                defender_players.extend(division_positions[PositionCategory.FB])
-            if len(defender_players) >= 5:
-                wages = [p['wage'] for p in defender_players]
-                baselines.append(self._create_baseline(
-                    division=division,
-                    position="Defenders",
-                    position_category=PositionCategory.CB,  # Use CB as representative
-                    wages=wages,
-                    is_aggregated=True
-                ))
+        return LeagueBaselineCollection(
+            baselines=list(chain.from_iterable(results)),
+            gk_wage_multiplier=gk_multiplier,
+            division_metadata=division_metadata
+        )
+
+    def _player_frame(self, player_data: List[Dict]) -> pd.DataFrame:
+        """
+        Build a column-oriented frame from parsed player records.
+
+        Each field is pulled into its own column in one sweep; division and
+        position columns are categorical so grouping runs on integer codes
+        rather than hashing strings and enums per row.
 
-            # Midfielders (DM + CM + AM)
-            midfielder_players = []
-            for pos in [PositionCategory.DM, PositionCategory.CM, PositionCategory.AM]:
-                if pos in division_positions:
-                    midfielder_players.extend(division_positions[pos])
-            if len(midfielder_players) >= 5:
-                wages = [p['wage'] for p in midfielder_players]
+        Args:
+            player_data: List of player dicts from parse_wage_export_html
+
+        Returns:
+            DataFrame with division, position, position_category, wage and
+            position_group (NaN for GKs) columns
+        """
+        categories = [p['position_category'] for p in player_data]
+
+        return pd.DataFrame({
+            'division': pd.Categorical([p['division'] for p in player_data]),
+            'position': [p['position'] for p in player_data],
+            'position_category': pd.Categorical(categories),
+            'wage': np.fromiter((p['wage'] for p in player_data), dtype=np.float64, count=len(player_data)),
+            'position_group': pd.Categorical([POSITION_GROUPS.get(c) for c in categories]),
+        })
+
+    def _baselines_for_division(self, division: str, frame: pd.DataFrame) -> List[LeagueWageBaseline]:
+        """
+        Build the specific and aggregated baselines for one division.
+
+        Args:
+            division: Division name
+            frame: That division's rows (division, position,
+                   position_category, wage, position_group)
+
+        Returns:
+            List of baselines for the division
+        """
+        baselines = []
+
+        # Create specific baselines (for positions with ≥30 players)
+        for position_cat, group in frame.groupby('position_category', sort=False, observed=True):
+            if len(group) >= 30:
                 baselines.append(self._create_baseline(
                     division=division,
-                    position="Midfielders",
-                    position_category=PositionCategory.CM,  # Use CM as representative
-                    wages=wages,
-                    is_aggregated=True
+                    position=group['position'].iat[0],  # Use FM position string
+                    position_category=position_cat,
+                    wages=group['wage'].to_numpy(),
+                    is_aggregated=False
                 ))
 
-            # Attackers (W + ST)
-            attacker_players = []
-            for pos in [PositionCategory.W, PositionCategory.ST]:
-                if pos in division_positions:
-                    attacker_players.extend(division_positions[pos])
-            if len(attacker_players) >= 5:
-                wages = [p['wage'] for p in attacker_players]
+        # Create aggregated baselines (Defenders, Midfielders, Attackers).
+        # GKs map to no group and are dropped by the groupby.
+        for group_name, group in frame.groupby('position_group', sort=False, observed=True):
+            if len(group) >= 5:
                 baselines.append(self._create_baseline(
                     division=division,
-                    position="Attackers",
-                    position_category=PositionCategory.ST,  # Use ST as representative
-                    wages=wages,
+                    position=group_name,
+                    position_category=POSITION_GROUP_REPRESENTATIVES[group_name],
+                    wages=group['wage'].to_numpy(),
                     is_aggregated=True
                 ))
 
-        return LeagueBaselineCollection(
-            baselines=baselines,
-            gk_wage_multiplier=gk_multiplier,
-            division_metadata=division_metadata
-        )
+        return baselines
 
     def _create_baseline(
         self,
@@ -393,14 +601,18 @@ class LeagueBaselineGenerator:
         Returns:
             LeagueWageBaseline
         """
+        average_wage, median_wage, percentile_25, percentile_75 = _wage_stats(
+            np.asarray(wages, dtype=np.float64)
+        )
+
         return LeagueWageBaseline(
             division=division,
             position=position,
             position_category=position_category,
-            average_wage=statistics.mean(wages),
-            median_wage=statistics.median(wages),
-            percentile_25=statistics.quantiles(wages, n=4)[0] if len(wages) >= 4 else min(wages),
-            percentile_75=statistics.quantiles(wages, n=4)[2] if len(wages) >= 4 else max(wages),
+            average_wage=average_wage,
+            median_wage=median_wage,
+            percentile_25=percentile_25,
+            percentile_75=percentile_75,
             player_count=len(wages),
             is_aggregated=is_aggregated
         )
@@ -434,8 +646,9 @@ class LeagueBaselineGenerator:
             ]
         }
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # orjson emits UTF-8 bytes directly, so write in binary mode
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
 
         print(f"Exported {len(collection.baselines)} baselines to {output_path}")
 
@@ -453,8 +666,8 @@ class LeagueBaselineGenerator:
             FileNotFoundError: If file doesn't exist
             ValueError: If JSON format is invalid
         """
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_path, 'rb') as f:
+            data = orjson.loads(f.read())
 
         # Validate required fields
         if 'baselines' not in data or 'gk_wage_multiplier' not in data:
@@ -463,7 +676,7 @@ class LeagueBaselineGenerator:
         baselines = []
         for b_data in data['baselines']:
             baselines.append(LeagueWageBaseline(
-                division=b_data['division'],
+                division=sys.intern(b_data['division']),
                 position=b_data['position'],
                 position_category=PositionCategory(b_data['position_category']),
                 average_wage=b_data['average_wage'],
@@ -2,28 +2,37 @@
 Parser Factory for Football Manager HTML Exports.
 """
 
-from bs4 import BeautifulSoup
+import re
 from typing import Union
 from services.fm_parser import FMHTMLParser
 from services.fm_parser_v2 import FMHTMLParserV2
 
+# Tag scanners for format detection; no DOM is built just to count columns
+_TABLE_OPEN = re.compile(r'<table\b', re.IGNORECASE)
+_TABLE_CLOSE = re.compile(r'</table\s*>', re.IGNORECASE)
+_HEADER_CELL = re.compile(r'<th\b', re.IGNORECASE)
+
+
 class ParserFactory:
     """Detects the appropriate parser based on the HTML structure."""
-    
+
     @staticmethod
     def get_parser(html_content: str) -> Union[FMHTMLParser, FMHTMLParserV2]:
         """
         Detects column count and returns the appropriate parser instance.
+
+        Counts <th> tags inside the first table with a regex scan rather than
+        parsing the whole document, since the chosen parser re-parses anyway.
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
-        table = soup.find('table')
-        
-        if not table:
+        table_open = _TABLE_OPEN.search(html_content)
+        if not table_open:
             raise ValueError("No table found in HTML content")
-            
-        headers = [th.get_text().strip() for th in table.find_all('th')]
-        column_count = len(headers)
-        
+
+        table_close = _TABLE_CLOSE.search(html_content, table_open.end())
+        table_end = table_close.start() if table_close else len(html_content)
+
+        column_count = len(_HEADER_CELL.findall(html_content, table_open.end(), table_end))
+
         if column_count == 32:
             return FMHTMLParserV2()
         else:
@@ -13,17 +13,73 @@ Orchestrates the complete PEAD screening workflow:
 Handles transaction management, error recovery, and session persistence.
 """
 import uuid
-from typing import List, Dict, Tuple, Optional
+from bisect import bisect_right
+from itertools import groupby
+from operator import attrgetter
+from typing import List, Dict, Tuple, Optional, NamedTuple
 from datetime import date
+import numpy as np
 from flask import session, current_app, has_request_context
-from models.financial import Stock, EarningsReport, SUECalculation, UploadBatch
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm.attributes import set_committed_value
+from models.financial import Stock, EarningsReport, SUECalculation, UploadBatch, ScreeningResult
 from services.csv_parser_service import CSVParserService
 from services.sue_calculation_service import SUECalculationService
 from services.earnings_quality_service import EarningsQualityService
+from utils.parallel import configured_n_jobs, process_map
 from services.pead_screening_service import PEADScreeningService
 from extensions import db
 
 
+class _EPSReport(NamedTuple):
+    """Plain copy of the EarningsReport fields used by the SUE calculation."""
+    report_date: date
+    reporting_period: str
+    period_type: str
+    actual_eps: float
+    upload_batch_id: int
+
+
+def _calculate_stock_sue(
+    stock_id: int,
+    all_reports: List[_EPSReport],
+    batch_id: int
+) -> List[Tuple[_EPSReport, Optional[float], Dict]]:
+    """
+    Calculate SUE for every report of one stock that belongs to the batch.
+
+    Module-level and ORM-free so it can run in a worker process.
+
+    Args:
+        stock_id: Stock database ID
+        all_reports: All reports for the stock (ordered desc by date)
+        batch_id: Upload batch ID
+
+    Returns:
+        List of (current_report, sue_score, metadata) tuples
+    """
+    results = []
+
+    # Get current batch reports
+    current_batch_reports = [r for r in all_reports if r.upload_batch_id == batch_id]
+
+    for current_report in current_batch_reports:
+        # Get historical reports (excluding current)
+        historical_reports = [r for r in all_reports if r.report_date < current_report.report_date]
+
+        # Calculate SUE
+        sue_score, metadata = SUECalculationService.calculate_sue_for_stock(
+            stock_id,
+            current_report,
+            historical_reports
+        )
+        results.append((current_report, sue_score, metadata))
+
+    return results
+
+
 class PEADScreeningManager:
     """
     PEAD screening orchestrator.
@@ -32,8 +88,25 @@ class PEADScreeningManager:
     actionable screening results.
     """
 
-    def __init__(self):
-        """Initialize manager with all required services."""
+    # Rows per bulk INSERT/UPDATE statement batch
+    BULK_CHUNK_SIZE = 10000
+
+    # Dialect INSERT constructs that support ON CONFLICT upserts
+    _UPSERT_INSERTS = {
+        'postgresql': postgresql_insert,
+        'sqlite': sqlite_insert,
+    }
+
+    def __init__(self, n_jobs: Optional[int] = None):
+        """
+        Initialize manager with all required services.
+
+        Args:
+            n_jobs: Worker processes for per-stock SUE calculation
+                    (1 = serial, -1 = one per CPU); None uses the app's
+                    ANALYSIS_WORKERS setting
+        """
+        self.n_jobs = n_jobs
         self.csv_parser = CSVParserService()
         self.sue_service = SUECalculationService()
         self.quality_service = EarningsQualityService()
@@ -98,12 +171,13 @@ class PEADScreeningManager:
                 current_app.logger.warning("No valid data in CSV upload")
                 return None, errors
 
-            # Update stock count
-            batch.stock_count = len(set(d['ticker'] for d in parsed_data))
+            # Update stock count (distinct tickers are reused by persistence)
+            tickers = {d['ticker'] for d in parsed_data}
+            batch.stock_count = len(tickers)
             current_app.logger.info(f"Parsed {len(parsed_data)} earnings reports for {batch.stock_count} stocks")
 
             # Step 3: Persist stocks + earnings reports
-            self._persist_data(parsed_data, ftse_index, batch.id)
+            self._persist_data(parsed_data, ftse_index, batch.id, tickers)
             current_app.logger.info("Persisted stocks and earnings reports to database")
 
             # Step 4: Calculate SUE for all stocks
@@ -122,6 +196,13 @@ class PEADScreeningManager:
             self._generate_recommendations(sue_calculations, default_drift_window)
             current_app.logger.info("Generated investment recommendations")
 
+            # Step 7b: Store denormalized screening rows for fast reads, and
+            # carry this upload's stock metadata into earlier batches' rows
+            db.session.flush()
+            PEADScreeningService.refresh_stock_fields(tickers)
+            PEADScreeningService.build_screening_results(batch.id)
+            current_app.logger.info("Stored screening results")
+
             # Step 8: Commit all changes
             db.session.commit()
             current_app.logger.info(f"Successfully committed batch {batch.batch_uuid}")
@@ -155,77 +236,192 @@ class PEADScreeningManager:
         self,
         parsed_data: List[Dict],
         ftse_index: str,
-        batch_id: int
+        batch_id: int,
+        tickers: Optional[set] = None
     ) -> None:
         """
         Persist stocks and earnings reports to database.
 
-        Handles duplicate stocks (upsert pattern).
+        Handles duplicate stocks (upsert pattern). Existing stocks are
+        prefetched with a single IN query, new stocks are flushed together,
+        and earnings reports are written with one bulk insert instead of a
+        SELECT + INSERT round-trip per CSV row.
 
         Args:
             parsed_data: List of parsed stock dictionaries from CSV
             ftse_index: FTSE index filter
             batch_id: Upload batch ID
+            tickers: Distinct tickers in parsed_data, if already collected
         """
+        if tickers is None:
+            tickers = {data['ticker'] for data in parsed_data}
+
+        stock_ids = self._upsert_stocks(parsed_data, ftse_index, tickers)
+
+        total_accruals, operating_accruals, return_on_assets = self._derive_report_metrics(parsed_data)
+
+        reports = [
+            {
+                'stock_id': stock_ids[data['ticker']],
+                'report_date': data['report_date'],
+                'reporting_period': data['reporting_period'],
+                'period_type': data['period_type'],
+                'fiscal_year_end_month': data.get('fiscal_year_end_month'),
+                'actual_eps': data['actual_eps'],
+                'net_income': data['net_income'],
+                'operating_cash_flow': data['operating_cash_flow'],
+                'total_assets': data['total_assets'],
+                'change_in_receivables': data.get('change_in_receivables'),
+                'change_in_inventory': data.get('change_in_inventory'),
+                'change_in_payables': data.get('change_in_payables'),
+                'depreciation': data.get('depreciation'),
+                'total_debt': data.get('total_debt'),
+                'total_accruals': total_accruals[i],
+                'operating_accruals': operating_accruals[i],
+                'return_on_assets': return_on_assets[i],
+                'upload_batch_id': batch_id
+            }
+            for i, data in enumerate(parsed_data)
+        ]
+
+        db.session.bulk_insert_mappings(EarningsReport, reports)
+
+    def _upsert_stocks(
+        self,
+        parsed_data: List[Dict],
+        ftse_index: str,
+        tickers: set
+    ) -> Dict[str, int]:
+        """
+        Insert new stocks and refresh metadata of existing ones in one statement.
+
+        New stocks take company name from their first CSV row; sector and
+        fiscal year end month take the last non-empty value in the upload,
+        and existing stocks keep their stored value when the upload has none.
+        Uses INSERT ... ON CONFLICT (ticker) DO UPDATE where the database
+        supports it, falling back to an ORM get-or-create otherwise.
+
+        Args:
+            parsed_data: List of parsed stock dictionaries from CSV
+            ftse_index: FTSE index filter
+            tickers: Distinct tickers in parsed_data
+
+        Returns:
+            Dict mapping ticker to stock ID
+        """
+        # One row per ticker, in first-appearance order
+        stock_rows = {}
         for data in parsed_data:
-            # Get or create stock
-            stock = Stock.query.filter_by(ticker=data['ticker']).first()
-
-            if not stock:
-                # Create new stock
-                stock = Stock(
-                    ticker=data['ticker'],
-                    company_name=data['company_name'],
-                    ftse_index=ftse_index,
-                    sector=data.get('sector'),
-                    fiscal_year_end_month=data.get('fiscal_year_end_month')
-                )
-                db.session.add(stock)
-                db.session.flush()  # Get stock.id
+            row = stock_rows.get(data['ticker'])
+            if row is None:
+                stock_rows[data['ticker']] = {
+                    'ticker': data['ticker'],
+                    'company_name': data['company_name'],
+                    'ftse_index': ftse_index,
+                    'sector': data.get('sector'),
+                    'fiscal_year_end_month': data.get('fiscal_year_end_month')
+                }
             else:
-                # Update existing stock metadata if changed
-                if 'sector' in data and data['sector']:
-                    stock.sector = data['sector']
-                if 'fiscal_year_end_month' in data and data['fiscal_year_end_month']:
-                    stock.fiscal_year_end_month = data['fiscal_year_end_month']
-
-            # Create earnings report
-            report = EarningsReport(
-                stock_id=stock.id,
-                report_date=data['report_date'],
-                reporting_period=data['reporting_period'],
-                period_type=data['period_type'],
-                fiscal_year_end_month=data.get('fiscal_year_end_month'),
-                actual_eps=data['actual_eps'],
-                net_income=data['net_income'],
-                operating_cash_flow=data['operating_cash_flow'],
-                total_assets=data['total_assets'],
-                change_in_receivables=data.get('change_in_receivables'),
-                change_in_inventory=data.get('change_in_inventory'),
-                change_in_payables=data.get('change_in_payables'),
-                depreciation=data.get('depreciation'),
-                total_debt=data.get('total_debt'),
-                upload_batch_id=batch_id
+                if data.get('sector'):
+                    row['sector'] = data['sector']
+                if data.get('fiscal_year_end_month'):
+                    row['fiscal_year_end_month'] = data['fiscal_year_end_month']
+
+        dialect_insert = self._UPSERT_INSERTS.get(db.session.get_bind().dialect.name)
+
+        if dialect_insert is not None:
+            stmt = dialect_insert(Stock).values(list(stock_rows.values()))
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Stock.ticker],
+                set_={
+                    # Empty values in the upload leave stored metadata untouched
+                    'sector': func.coalesce(func.nullif(stmt.excluded.sector, ''), Stock.sector),
+                    'fiscal_year_end_month': func.coalesce(
+                        func.nullif(stmt.excluded.fiscal_year_end_month, 0),
+                        Stock.fiscal_year_end_month
+                    )
+                }
+            )
+            db.session.execute(stmt)
+        else:
+            existing = {
+                stock.ticker: stock
+                for stock in Stock.query.filter(Stock.ticker.in_(tickers)).all()
+            }
+            for ticker, row in stock_rows.items():
+                stock = existing.get(ticker)
+                if stock is None:
+                    db.session.add(Stock(**row))
+                else:
+                    # Update existing stock metadata if changed
+                    if row['sector']:
+                        stock.sector = row['sector']
+                    if row['fiscal_year_end_month']:
+                        stock.fiscal_year_end_month = row['fiscal_year_end_month']
+
+        return dict(
+            db.session.query(Stock.ticker, Stock.id)
+            .filter(Stock.ticker.in_(tickers))
+            .all()
+        )
+
+    @staticmethod
+    def _derive_report_metrics(
+        parsed_data: List[Dict]
+    ) -> Tuple[List[float], List[Optional[float]], List[Optional[float]]]:
+        """
+        Calculate accruals and ROA for all parsed rows as array operations.
+
+        - Total accruals: NI - OCF
+        - Operating accruals: ΔAR + ΔInv - ΔAP - Dep (only if all components present)
+        - ROA: NI / Total Assets (only if assets positive)
+
+        Args:
+            parsed_data: List of parsed stock dictionaries from CSV
+
+        Returns:
+            Tuple of (total_accruals, operating_accruals, return_on_assets)
+            lists aligned with parsed_data, with None where not computable
+        """
+        n = len(parsed_data)
+
+        def column(key: str) -> np.ndarray:
+            return np.fromiter(
+                (np.nan if data.get(key) is None else data[key] for data in parsed_data),
+                dtype=np.float64,
+                count=n
             )
 
-            # Calculate total accruals
-            report.total_accruals = report.net_income - report.operating_cash_flow
+        net_income = column('net_income')
+        total_assets = column('total_assets')
+        receivables = column('change_in_receivables')
+        inventory = column('change_in_inventory')
+        payables = column('change_in_payables')
+        depreciation = column('depreciation')
 
-            # Calculate operating accruals if components available
-            if all(getattr(report, field, None) is not None for field in
-                   ['change_in_receivables', 'change_in_inventory', 'change_in_payables', 'depreciation']):
-                report.operating_accruals = (
-                    report.change_in_receivables +
-                    report.change_in_inventory -
-                    report.change_in_payables -
-                    report.depreciation
-                )
+        total_accruals = net_income - column('operating_cash_flow')
 
-            # Calculate ROA if assets available
-            if report.total_assets > 0:
-                report.return_on_assets = report.net_income / report.total_assets
+        has_components = ~(
+            np.isnan(receivables) | np.isnan(inventory) |
+            np.isnan(payables) | np.isnan(depreciation)
+        )
+        operating_accruals = np.where(
+            has_components,
+            receivables + inventory - payables - depreciation,
+            np.nan
+        )
+
+        return_on_assets = np.divide(
+            net_income,
+            total_assets,
+            out=np.full(n, np.nan),
+            where=total_assets > 0
+        )
 
-            db.session.add(report)
+        def to_list(values: np.ndarray) -> List[Optional[float]]:
+            return [None if value != value else value for value in values.tolist()]
+
+        return total_accruals.tolist(), to_list(operating_accruals), to_list(return_on_assets)
 
     def _calculate_sue_batch(
         self,
@@ -242,7 +438,7 @@ class PEADScreeningManager:
         Returns:
             List of SUECalculation objects
         """
-        sue_calculations = []
+        sue_rows = []
 
         # Get all stocks in this batch
         stocks = (
@@ -253,46 +449,63 @@ class PEADScreeningManager:
             .all()
         )
 
-        for stock in stocks:
-            # Get all earnings reports for this stock
-            all_reports = (
-                EarningsReport.query
-                .filter_by(stock_id=stock.id)
-                .order_by(EarningsReport.report_date.desc())
-                .all()
+        # Get all earnings reports for these stocks in one query, bucketed by stock.
+        # Same-date reports (re-uploads) keep newest-first order via id desc.
+        reports = (
+            EarningsReport.query
+            .filter(EarningsReport.stock_id.in_([stock.id for stock in stocks]))
+            .order_by(EarningsReport.stock_id, EarningsReport.report_date.desc(), EarningsReport.id.desc())
+            .all()
+        )
+        reports_by_stock = {
+            stock_id: list(group)
+            for stock_id, group in groupby(reports, key=attrgetter('stock_id'))
+        }
+
+        # Detach the EPS history from the ORM so it can be shipped to workers
+        stock_ids = [stock.id for stock in stocks]
+        stock_histories = [
+            [
+                _EPSReport(r.report_date, r.reporting_period, r.period_type, r.actual_eps, r.upload_batch_id)
+                for r in reports_by_stock.get(stock_id, [])
+            ]
+            for stock_id in stock_ids
+        ]
+        batch_ids = [batch_id] * len(stock_ids)
+
+        results = process_map(
+            _calculate_stock_sue, stock_ids, stock_histories, batch_ids,
+            n_jobs=configured_n_jobs(self.n_jobs)
+        )
+
+        for stock_id, stock_results in zip(stock_ids, results):
+            for current_report, sue_score, metadata in stock_results:
+                # Queue SUE calculation record for bulk insert
+                sue_rows.append({
+                    'stock_id': stock_id,
+                    'report_date': current_report.report_date,
+                    'actual_eps': current_report.actual_eps,
+                    'expected_eps': metadata.get('expected_eps'),
+                    'forecast_error': metadata.get('forecast_error'),
+                    'forecast_error_stddev': metadata.get('forecast_error_stddev'),
+                    'sue_score': sue_score,
+                    'small_sample_corrected': metadata.get('small_sample_corrected', False),
+                    'upload_batch_id': batch_id
+                })
+
+        for start in range(0, len(sue_rows), self.BULK_CHUNK_SIZE):
+            db.session.bulk_insert_mappings(
+                SUECalculation,
+                sue_rows[start:start + self.BULK_CHUNK_SIZE]
             )
 
-            # Get current batch reports
-            current_batch_reports = [r for r in all_reports if r.upload_batch_id == batch_id]
-
-            for current_report in current_batch_reports:
-                # Get historical reports (excluding current)
-                historical_reports = [r for r in all_reports if r.report_date < current_report.report_date]
-
-                # Calculate SUE
-                sue_score, metadata = self.sue_service.calculate_sue_for_stock(
-                    stock.id,
-                    current_report,
-                    historical_reports
-                )
-
-                # Create SUE calculation record
-                sue_calc = SUECalculation(
-                    stock_id=stock.id,
-                    report_date=current_report.report_date,
-                    actual_eps=current_report.actual_eps,
-                    expected_eps=metadata.get('expected_eps'),
-                    forecast_error=metadata.get('forecast_error'),
-                    forecast_error_stddev=metadata.get('forecast_error_stddev'),
-                    sue_score=sue_score,
-                    small_sample_corrected=metadata.get('small_sample_corrected', False),
-                    upload_batch_id=batch_id
-                )
-
-                db.session.add(sue_calc)
-                sue_calculations.append(sue_calc)
-
-        db.session.flush()  # Ensure all SUE calculations have IDs
+        # Load the inserted rows back (with IDs) as session-tracked objects
+        sue_calculations = (
+            SUECalculation.query
+            .filter_by(upload_batch_id=batch_id)
+            .order_by(SUECalculation.id)
+            .all()
+        )
 
         return sue_calculations
 
@@ -330,28 +543,52 @@ class PEADScreeningManager:
         Args:
             sue_calculations: List of SUE calculations
         """
+        # Prefetch stocks and their reports once instead of three queries per row
+        stock_ids = {sue_calc.stock_id for sue_calc in sue_calculations}
+        stocks_by_id = {
+            stock.id: stock
+            for stock in Stock.query.filter(Stock.id.in_(stock_ids)).all()
+        }
+        reports = (
+            EarningsReport.query
+            .filter(EarningsReport.stock_id.in_(stock_ids))
+            .order_by(EarningsReport.stock_id, EarningsReport.report_date.desc(), EarningsReport.id.desc())
+            .all()
+        )
+        reports_by_stock = {
+            stock_id: list(group)
+            for stock_id, group in groupby(reports, key=attrgetter('stock_id'))
+        }
+        # Negated ordinals ascend along each newest-first list, so bisect can
+        # find where reports strictly older than a given date start
+        report_keys_by_stock = {
+            stock_id: [-report.report_date.toordinal() for report in stock_reports]
+            for stock_id, stock_reports in reports_by_stock.items()
+        }
+
+        # Current report per (stock, date): the earliest-inserted one, as .first() returned
+        current_reports = {}
+        for report in reversed(reports):
+            current_reports.setdefault((report.stock_id, report.report_date), report)
+
+        updated_calcs = []
+        current_reports_used = []
+        updates = []
         for sue_calc in sue_calculations:
             # Get stock and current report
-            stock = Stock.query.get(sue_calc.stock_id)
-            current_report = EarningsReport.query.filter_by(
-                stock_id=sue_calc.stock_id,
-                report_date=sue_calc.report_date
-            ).first()
+            stock = stocks_by_id.get(sue_calc.stock_id)
+            current_report = current_reports.get((sue_calc.stock_id, sue_calc.report_date))
 
             if not stock or not current_report:
                 continue
 
             # Get historical reports (for ROA persistence calculation)
-            historical_reports = (
-                EarningsReport.query
-                .filter(
-                    EarningsReport.stock_id == stock.id,
-                    EarningsReport.report_date < sue_calc.report_date
-                )
-                .order_by(EarningsReport.report_date.desc())
-                .limit(8)
-                .all()
+            stock_reports = reports_by_stock[stock.id]
+            older_start = bisect_right(
+                report_keys_by_stock[stock.id],
+                -sue_calc.report_date.toordinal()
             )
+            historical_reports = stock_reports[older_start:older_start + 8]
 
             # Calculate sector-aware quality score
             quality_score, methodology = self.quality_service.calculate_quality_score_for_stock(
@@ -360,17 +597,68 @@ class PEADScreeningManager:
                 historical_reports
             )
 
-            # Update SUE calculation with quality metrics
-            sue_calc.quality_score = quality_score
-            sue_calc.quality_calculation_method = methodology
+            # Queue quality metrics update for this SUE calculation
+            updated_calcs.append(sue_calc)
+            current_reports_used.append(current_report)
+            updates.append({
+                'id': sue_calc.id,
+                'quality_score': quality_score,
+                'quality_calculation_method': methodology
+            })
+
+        # Store individual components (for detail view)
+        accruals_ratios, cash_flow_ratios, operating_accruals_ratios = self._component_ratios(current_reports_used)
+        for i, update in enumerate(updates):
+            update['accruals_ratio'] = accruals_ratios[i]
+            update['cash_flow_to_assets'] = cash_flow_ratios[i]
+            update['operating_accruals_ratio'] = operating_accruals_ratios[i]
+
+        self._bulk_update_sue_calculations(updated_calcs, updates)
+
+    @staticmethod
+    def _component_ratios(
+        reports: List[EarningsReport]
+    ) -> Tuple[List[Optional[float]], List[Optional[float]], List[Optional[float]]]:
+        """
+        Divide accruals and cash flow by total assets for all reports at once.
 
-            # Store individual components (for detail view)
-            if current_report.total_assets > 0:
-                sue_calc.accruals_ratio = current_report.total_accruals / current_report.total_assets
-                sue_calc.cash_flow_to_assets = current_report.operating_cash_flow / current_report.total_assets
+        The three numerators are stacked into one array so a single masked
+        divide covers every ratio (None where assets are not positive, or
+        where operating accruals are missing).
 
-                if current_report.operating_accruals is not None:
-                    sue_calc.operating_accruals_ratio = current_report.operating_accruals / current_report.total_assets
+        Args:
+            reports: Current earnings reports, one per updated SUE calculation
+
+        Returns:
+            Tuple of (accruals_ratio, cash_flow_to_assets, operating_accruals_ratio)
+            lists aligned with reports
+        """
+        n = len(reports)
+        numerators = np.array(
+            [
+                (report.total_accruals, report.operating_cash_flow, report.operating_accruals)
+                for report in reports
+            ],
+            dtype=np.float64
+        ).reshape(n, 3)
+        total_assets = np.fromiter(
+            (report.total_assets for report in reports),
+            dtype=np.float64,
+            count=n
+        )
+
+        valid_assets = total_assets > 0
+        ratios = np.divide(
+            numerators,
+            total_assets[:, np.newaxis],
+            out=np.full((n, 3), np.nan),
+            where=valid_assets[:, np.newaxis]
+        )
+
+        def to_list(values: np.ndarray) -> List[Optional[float]]:
+            return [None if value != value else value for value in values.tolist()]
+
+        return to_list(ratios[:, 0]), to_list(ratios[:, 1]), to_list(ratios[:, 2])
 
     def _generate_recommendations(
         self,
@@ -384,23 +672,55 @@ class PEADScreeningManager:
             sue_calculations: List of SUE calculations
             drift_window: Drift window in days
         """
-        for sue_calc in sue_calculations:
-            if sue_calc.sue_score is None or sue_calc.quality_score is None:
-                continue
+        updated_calcs = [
+            sue_calc for sue_calc in sue_calculations
+            if sue_calc.sue_score is not None and sue_calc.quality_score is not None
+        ]
+
+        # Generate recommendations for the whole batch (global decile, default 5)
+        recommendations = self.screening_service.generate_recommendations(
+            [sue_calc.global_decile or 5 for sue_calc in updated_calcs],
+            [sue_calc.quality_score for sue_calc in updated_calcs],
+            drift_window
+        )
 
-            # Use global decile for recommendations
-            decile = sue_calc.global_decile or 5
+        updates = [
+            {
+                'id': sue_calc.id,
+                'recommendation': recommendation,
+                'recommendation_explanation': explanation
+            }
+            for sue_calc, (recommendation, explanation) in zip(updated_calcs, recommendations)
+        ]
 
-            # Generate recommendation
-            recommendation, explanation = self.screening_service.generate_recommendation(
-                sue_calc.sue_score,
-                decile,
-                sue_calc.quality_score,
-                drift_window
+        self._bulk_update_sue_calculations(updated_calcs, updates)
+
+    def _bulk_update_sue_calculations(
+        self,
+        sue_calculations: List[SUECalculation],
+        updates: List[Dict]
+    ) -> None:
+        """
+        Write column updates for SUE calculations in bulk.
+
+        Emits executemany UPDATEs in chunks rather than one UPDATE per dirty
+        object at flush, then mirrors the values onto the in-memory objects
+        as committed state so later steps see them without re-flushing.
+
+        Args:
+            sue_calculations: SUE calculation objects being updated
+            updates: Update mappings (with 'id') aligned with sue_calculations
+        """
+        for start in range(0, len(updates), self.BULK_CHUNK_SIZE):
+            db.session.bulk_update_mappings(
+                SUECalculation,
+                updates[start:start + self.BULK_CHUNK_SIZE]
             )
 
-            sue_calc.recommendation = recommendation
-            sue_calc.recommendation_explanation = explanation
+        for sue_calc, update in zip(sue_calculations, updates):
+            for key, value in update.items():
+                if key != 'id':
+                    set_committed_value(sue_calc, key, value)
 
     def _cleanup_previous_batch(self) -> None:
         """
@@ -411,6 +731,9 @@ class PEADScreeningManager:
 
         Note: Stocks are NOT deleted because they are shared across batches
         (ticker has unique constraint).
+
+        Runs inside the upload transaction and is committed together with the
+        new batch.
         """
         if not has_request_context():
             return
@@ -427,6 +750,9 @@ class PEADScreeningManager:
 
         current_app.logger.info(f"Cleaning up previous batch: {previous_batch_uuid}")
 
+        # Delete the denormalized screening rows for this batch
+        ScreeningResult.query.filter_by(upload_batch_id=previous_batch.id).delete()
+
         # Delete all SUE calculations for this batch
         deleted_sue = SUECalculation.query.filter_by(upload_batch_id=previous_batch.id).delete()
 
@@ -436,10 +762,9 @@ class PEADScreeningManager:
         # Delete the batch itself
         db.session.delete(previous_batch)
 
-        # Commit the deletions
-        db.session.commit()
-
-        current_app.logger.info(f"Successfully deleted previous batch: {previous_batch_uuid} ({deleted_reports} reports, {deleted_sue} SUE calcs)")
+        # No commit here: the deletions share the upload's transaction, so a
+        # failed upload rolls back to the previous batch instead of losing it
+        current_app.logger.info(f"Deleted previous batch: {previous_batch_uuid} ({deleted_reports} reports, {deleted_sue} SUE calcs)")
 
     def _persist_to_session(
         self,
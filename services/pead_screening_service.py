@@ -10,9 +10,14 @@ Recommendation Logic:
 - HOLD: High SUE but Low Quality, OR Medium SUE
 - AVOID: Low SUE (Decile 1-3)
 """
+import logging
 from typing import List, Dict, Optional
-from datetime import date, timedelta
-from models.financial import SUECalculation, Stock, EarningsReport, UploadBatch
+from datetime import date
+import numpy as np
+from flask import current_app
+from sqlalchemy import and_, bindparam, insert, or_, select, update
+from sqlalchemy.sql import Select
+from models.financial import SUECalculation, Stock, EarningsReport, UploadBatch, ScreeningResult
 from extensions import db
 
 
@@ -35,6 +40,64 @@ class PEADScreeningService:
 
     AVOID_SUE_DECILE = 3
 
+    # (recommendation, explanation template) per rule, in generate_recommendations order
+    _RECOMMENDATION_RULES = (
+        (
+            'STRONG_BUY',
+            'High earnings surprise (Decile {sue_decile}) backed by strong cash flow quality '
+            '({quality_score:.0f}/100). Academic research shows strongest PEAD effect in this category.'
+        ),
+        (
+            'BUY',
+            'Positive earnings surprise (Decile {sue_decile}) with acceptable quality '
+            '({quality_score:.0f}/100). Expected drift over {drift_window_days} days.'
+        ),
+        (
+            'HOLD',
+            'High earnings surprise (Decile {sue_decile}) but low quality ({quality_score:.0f}/100). '
+            'Surprise may be driven by aggressive accounting (high accruals). Proceed with caution.'
+        ),
+        (
+            'AVOID',
+            'Negative earnings surprise (Decile {sue_decile}) indicates downward drift risk '
+            'over {drift_window_days} days. Quality score: {quality_score:.0f}/100.'
+        ),
+        (
+            'HOLD',
+            'Moderate earnings surprise (Decile {sue_decile}) with high quality '
+            '({quality_score:.0f}/100). Weaker PEAD signal but solid fundamentals.'
+        ),
+        (
+            'HOLD',
+            'Moderate earnings surprise (Decile {sue_decile}) with medium quality '
+            '({quality_score:.0f}/100). Insufficient signal strength for action.'
+        ),
+    )
+
+    # Recommended drift window per reporting frequency (anything else is annual)
+    _PERIOD_DRIFT_WINDOWS = {
+        'QUARTER': DRIFT_WINDOW_QUARTERLY,
+        'HALF': DRIFT_WINDOW_SEMI_ANNUAL,
+    }
+
+    # Bootstrap badge colors, indexed by decile 0-10
+    _DECILE_COLORS = (
+        'danger', 'danger', 'danger', 'danger',
+        'warning', 'warning', 'warning',
+        'primary', 'primary',
+        'success', 'success'
+    )
+
+    _RECOMMENDATION_COLORS = {
+        'STRONG_BUY': 'success',
+        'BUY': 'primary',
+        'HOLD': 'warning',
+        'AVOID': 'danger',
+    }
+
+    # Screening SELECTs keyed by active filter combination (see _screening_statement)
+    _SCREEN_STATEMENTS: Dict[tuple, Select] = {}
+
     @classmethod
     def screen_opportunities(
         cls,
@@ -72,100 +135,281 @@ class PEADScreeningService:
             batch = UploadBatch.query.get(upload_batch_id)
             drift_window_days = batch.default_drift_window if batch else 60
 
-        # Build base query
-        query = (
-            db.session.query(SUECalculation, Stock, EarningsReport)
-            .join(Stock, SUECalculation.stock_id == Stock.id)
-            .join(EarningsReport, db.and_(
-                EarningsReport.stock_id == Stock.id,
-                EarningsReport.report_date == SUECalculation.report_date,
-                EarningsReport.upload_batch_id == upload_batch_id  # Ensure report is from same batch
-            ))
-            .filter(SUECalculation.upload_batch_id == upload_batch_id)
-            .filter(SUECalculation.sue_score.isnot(None))
-        )
-
-        # Apply filters
-        if ftse_index:
-            query = query.filter(Stock.ftse_index == ftse_index)
-
+        # Pick the prebuilt statement for this combination of active filters
+        decile_filter = None
         if min_sue_decile:
-            decile_field = SUECalculation.sector_decile if use_sector_adjusted else SUECalculation.global_decile
-            query = query.filter(decile_field >= min_sue_decile)
-
-        if min_quality_score:
-            query = query.filter(SUECalculation.quality_score >= min_quality_score)
-
-        if sectors:
-            query = query.filter(Stock.sector.in_(sectors))
-
-        if date_range_start:
-            query = query.filter(EarningsReport.report_date >= date_range_start)
-
-        if date_range_end:
-            query = query.filter(EarningsReport.report_date <= date_range_end)
-
-        # Order by quality score descending (best opportunities first)
-        query = query.order_by(SUECalculation.quality_score.desc())
-
-        # Debug logging
-        from flask import current_app
-        if current_app:
+            decile_filter = 'sector' if use_sector_adjusted else 'global'
+        statement = cls._screening_statement((
+            decile_filter,
+            bool(ftse_index),
+            bool(min_quality_score),
+            bool(sectors),
+            bool(date_range_start),
+            bool(date_range_end),
+        ))
+
+        # Debug logging (the COUNT is an extra round-trip, so only when DEBUG is on)
+        logger = current_app.logger
+        if logger.isEnabledFor(logging.DEBUG):
             # Count total SUE calculations for this batch
             total_sue = db.session.query(SUECalculation).filter_by(upload_batch_id=upload_batch_id).count()
-            current_app.logger.debug(f"Total SUE calculations in batch: {total_sue}")
-            current_app.logger.debug(f"Screening query filters: ftse_index={ftse_index}, min_sue_decile={min_sue_decile}, min_quality_score={min_quality_score}")
+            logger.debug("Total SUE calculations in batch: %s", total_sue)
+            logger.debug(
+                "Screening query filters: ftse_index=%s, min_sue_decile=%s, min_quality_score=%s",
+                ftse_index, min_sue_decile, min_quality_score
+            )
 
         # Execute query with limit
-        results = query.limit(limit).all()
+        params = {
+            'batch_id': upload_batch_id,
+            'ftse_index': ftse_index,
+            'min_sue_decile': min_sue_decile,
+            'min_quality_score': min_quality_score,
+            'sectors': list(sectors) if sectors else [],
+            'date_range_start': date_range_start,
+            'date_range_end': date_range_end,
+            'limit': limit,
+        }
+        results = db.session.execute(statement, params).all()
+
+        # Format results; ISO report dates and drift window ends are computed
+        # for all rows at once on a datetime64[D] column
+        report_days = np.array([row.report_date for row in results], dtype='datetime64[D]')
+        report_date_strs = np.datetime_as_string(report_days).tolist()
+        drift_end_strs = np.datetime_as_string(
+            report_days + np.timedelta64(drift_window_days, 'D')
+        ).tolist()
 
-        # Format results
         opportunities = []
-        for sue_calc, stock, report in results:
-            # Calculate drift window end date
-            drift_end = report.report_date + timedelta(days=drift_window_days)
-
+        for row, report_date_str, drift_end_str in zip(results, report_date_strs, drift_end_strs):
             # Get recommended window for this report type
-            recommended_window = cls.get_recommended_drift_window(report.period_type)
+            recommended_window = cls.get_recommended_drift_window(row.period_type)
 
             # Determine which decile to display (fall back to global if sector not available)
-            if use_sector_adjusted and sue_calc.sector_decile is not None:
-                display_decile = sue_calc.sector_decile
+            if use_sector_adjusted and row.sector_decile is not None:
+                display_decile = row.sector_decile
             else:
-                display_decile = sue_calc.global_decile
+                display_decile = row.global_decile
 
             opportunities.append({
-                'ticker': stock.ticker,
-                'company_name': stock.company_name,
-                'sector': stock.sector or 'Unknown',
-                'ftse_index': stock.ftse_index,
-                'report_date': report.report_date.isoformat(),
-                'reporting_period': report.reporting_period,
-                'period_type': report.period_type,
-                'actual_eps': report.actual_eps,
-                'expected_eps': sue_calc.expected_eps,
-                'sue_score': round(sue_calc.sue_score, 2) if sue_calc.sue_score else None,
+                'ticker': row.ticker,
+                'company_name': row.company_name,
+                'sector': row.sector or 'Unknown',
+                'ftse_index': row.ftse_index,
+                'report_date': report_date_str,
+                'reporting_period': row.reporting_period,
+                'period_type': row.period_type,
+                'actual_eps': row.actual_eps,
+                'expected_eps': row.expected_eps,
+                'sue_score': round(row.sue_score, 2) if row.sue_score else None,
                 'sue_decile': display_decile,
-                'global_decile': sue_calc.global_decile,
-                'sector_decile': sue_calc.sector_decile,
-                'quality_score': round(sue_calc.quality_score, 1) if sue_calc.quality_score else None,
-                'quality_method': sue_calc.quality_calculation_method,
-                'accruals_ratio': round(sue_calc.accruals_ratio, 3) if sue_calc.accruals_ratio else None,
-                'cf_to_assets': round(sue_calc.cash_flow_to_assets, 3) if sue_calc.cash_flow_to_assets else None,
-                'recommendation': sue_calc.recommendation,
-                'recommendation_explanation': sue_calc.recommendation_explanation,
+                'global_decile': row.global_decile,
+                'sector_decile': row.sector_decile,
+                'quality_score': round(row.quality_score, 1) if row.quality_score else None,
+                'quality_method': row.quality_calculation_method,
+                'accruals_ratio': round(row.accruals_ratio, 3) if row.accruals_ratio else None,
+                'cf_to_assets': round(row.cash_flow_to_assets, 3) if row.cash_flow_to_assets else None,
+                'recommendation': row.recommendation,
+                'recommendation_explanation': row.recommendation_explanation,
                 'drift_window_days': drift_window_days,
-                'drift_window_end': drift_end.isoformat(),
+                'drift_window_end': drift_end_str,
                 'recommended_drift_window': recommended_window,
                 'using_recommended_window': drift_window_days == recommended_window,
                 # UI helper fields
                 'decile_color': cls._get_decile_color(display_decile),
-                'quality_color': cls._get_quality_color(sue_calc.quality_score),
-                'rec_color': cls._get_recommendation_color(sue_calc.recommendation)
+                'quality_color': cls._get_quality_color(row.quality_score),
+                'rec_color': cls._get_recommendation_color(row.recommendation)
             })
 
         return opportunities
 
+    # Columns copied into ScreeningResult, in insert order
+    _SCREENING_FIELDS = (
+        'ticker', 'company_name', 'sector', 'ftse_index',
+        'report_date', 'reporting_period', 'period_type', 'actual_eps',
+        'expected_eps', 'sue_score', 'global_decile', 'sector_decile',
+        'quality_score', 'quality_calculation_method', 'accruals_ratio',
+        'cash_flow_to_assets', 'recommendation', 'recommendation_explanation'
+    )
+
+    @classmethod
+    def build_screening_results(cls, upload_batch_id: int) -> None:
+        """
+        Populate ScreeningResult rows for a batch from the SUE/stock/report join.
+
+        Runs once per batch (at the end of the upload workflow, or from
+        backfill_screening_results for batches uploaded before the table
+        existed) as a single INSERT ... SELECT, stored best-quality first.
+        The caller commits.
+
+        Args:
+            upload_batch_id: Upload batch ID
+        """
+        source = (
+            select(
+                bindparam('batch_id', upload_batch_id),
+                Stock.ticker,
+                Stock.company_name,
+                Stock.sector,
+                Stock.ftse_index,
+                EarningsReport.report_date,
+                EarningsReport.reporting_period,
+                EarningsReport.period_type,
+                EarningsReport.actual_eps,
+                SUECalculation.expected_eps,
+                SUECalculation.sue_score,
+                SUECalculation.global_decile,
+                SUECalculation.sector_decile,
+                SUECalculation.quality_score,
+                SUECalculation.quality_calculation_method,
+                SUECalculation.accruals_ratio,
+                SUECalculation.cash_flow_to_assets,
+                SUECalculation.recommendation,
+                SUECalculation.recommendation_explanation
+            )
+            .select_from(SUECalculation)
+            .join(Stock, SUECalculation.stock_id == Stock.id)
+            .join(EarningsReport, and_(
+                EarningsReport.stock_id == Stock.id,
+                EarningsReport.report_date == SUECalculation.report_date,
+                EarningsReport.upload_batch_id == upload_batch_id  # Ensure report is from same batch
+            ))
+            .where(SUECalculation.upload_batch_id == upload_batch_id)
+            .where(SUECalculation.sue_score.isnot(None))
+            .order_by(SUECalculation.quality_score.desc())
+        )
+
+        db.session.execute(
+            insert(ScreeningResult).from_select(
+                ['upload_batch_id', *cls._SCREENING_FIELDS],
+                source
+            )
+        )
+
+    @classmethod
+    def _screening_columns(cls, model) -> list:
+        """Columns of ``model`` named in _SCREENING_FIELDS, in order."""
+        return [getattr(model, field) for field in cls._SCREENING_FIELDS]
+
+    @classmethod
+    def _screening_statement(cls, filter_key: tuple) -> Select:
+        """
+        Get the screening SELECT for a combination of active filters.
+
+        Reads the denormalized ScreeningResult rows for the batch. Filter
+        values are bind parameters, so each of the few possible statements
+        is built once per process and reused, skipping the ORM query
+        construction on every screening request.
+
+        Args:
+            filter_key: (decile_filter, ftse_index, min_quality_score,
+                         sectors, date_range_start, date_range_end) where
+                         decile_filter is None, 'sector' or 'global' and the
+                         rest are booleans for whether the filter is active
+
+        Returns:
+            SELECT taking batch_id, limit and the active filter parameters
+        """
+        statement = cls._SCREEN_STATEMENTS.get(filter_key)
+        if statement is not None:
+            return statement
+
+        decile_filter, by_index, by_quality, by_sectors, by_start, by_end = filter_key
+
+        statement = (
+            select(*cls._screening_columns(ScreeningResult))
+            .where(ScreeningResult.upload_batch_id == bindparam('batch_id'))
+        )
+
+        # Apply filters
+        if by_index:
+            statement = statement.where(ScreeningResult.ftse_index == bindparam('ftse_index'))
+
+        if decile_filter:
+            decile_field = ScreeningResult.sector_decile if decile_filter == 'sector' else ScreeningResult.global_decile
+            statement = statement.where(decile_field >= bindparam('min_sue_decile'))
+
+        if by_quality:
+            statement = statement.where(ScreeningResult.quality_score >= bindparam('min_quality_score'))
+
+        if by_sectors:
+            statement = statement.where(ScreeningResult.sector.in_(bindparam('sectors', expanding=True)))
+
+        if by_start:
+            statement = statement.where(ScreeningResult.report_date >= bindparam('date_range_start'))
+
+        if by_end:
+            statement = statement.where(ScreeningResult.report_date <= bindparam('date_range_end'))
+
+        # Order by quality score descending (best opportunities first); rows
+        # were stored in that order, so id keeps ties as the join returned them
+        statement = (
+            statement
+            .order_by(ScreeningResult.quality_score.desc(), ScreeningResult.id)
+            .limit(bindparam('limit'))
+        )
+
+        cls._SCREEN_STATEMENTS[filter_key] = statement
+        return statement
+
+    @classmethod
+    def refresh_stock_fields(cls, tickers: set) -> None:
+        """
+        Copy current sector and FTSE index onto stored screening rows.
+
+        Screening rows copy these stock fields when a batch is built, so a
+        later upload that changes a stock's sector would otherwise leave
+        earlier batches showing (and filtering on) the old one. Sector
+        deciles stay as calculated for their batch. Does not commit.
+
+        Args:
+            tickers: Tickers whose stock metadata may have changed
+        """
+        sector = select(Stock.sector).where(Stock.ticker == ScreeningResult.ticker).scalar_subquery()
+        ftse_index = select(Stock.ftse_index).where(Stock.ticker == ScreeningResult.ticker).scalar_subquery()
+
+        db.session.execute(
+            update(ScreeningResult)
+            .where(ScreeningResult.ticker.in_(tickers))
+            .where(or_(
+                ScreeningResult.sector.is_distinct_from(sector),
+                ScreeningResult.ftse_index.is_distinct_from(ftse_index)
+            ))
+            .values(sector=sector, ftse_index=ftse_index)
+            .execution_options(synchronize_session=False)
+        )
+
+    @classmethod
+    def backfill_screening_results(cls) -> int:
+        """
+        Build ScreeningResult rows for batches uploaded before the table existed.
+
+        A one-off upgrade step (scripts/backfill_screening_results.py):
+        finds every batch with scored SUE calculations but no screening rows,
+        builds them and commits.
+
+        Returns:
+            Number of batches backfilled
+        """
+        has_screening_rows = (
+            select(ScreeningResult.id)
+            .where(ScreeningResult.upload_batch_id == SUECalculation.upload_batch_id)
+            .exists()
+        )
+        batch_ids = db.session.execute(
+            select(SUECalculation.upload_batch_id)
+            .where(SUECalculation.sue_score.isnot(None))
+            .where(~has_screening_rows)
+            .distinct()
+        ).scalars().all()
+
+        for batch_id in batch_ids:
+            cls.build_screening_results(batch_id)
+        if batch_ids:
+            db.session.commit()
+
+        return len(batch_ids)
+
     @classmethod
     def generate_recommendation(
         cls,
@@ -192,53 +436,67 @@ class PEADScreeningService:
         Returns:
             Tuple of (recommendation, explanation)
         """
-        # HIGH SUE + HIGH QUALITY = STRONG_BUY
-        if sue_decile >= cls.STRONG_BUY_SUE_DECILE and quality_score >= cls.STRONG_BUY_QUALITY:
-            return (
-                'STRONG_BUY',
-                f'High earnings surprise (Decile {sue_decile}) backed by strong cash flow quality '
-                f'({quality_score:.0f}/100). Academic research shows strongest PEAD effect in this category.'
-            )
+        return cls.generate_recommendations([sue_decile], [quality_score], drift_window_days)[0]
 
-        # HIGH SUE + MEDIUM QUALITY = BUY
-        elif sue_decile >= cls.BUY_SUE_DECILE and quality_score >= cls.BUY_QUALITY:
-            return (
-                'BUY',
-                f'Positive earnings surprise (Decile {sue_decile}) with acceptable quality '
-                f'({quality_score:.0f}/100). Expected drift over {drift_window_days} days.'
-            )
+    @classmethod
+    def generate_recommendations(
+        cls,
+        sue_deciles: List[int],
+        quality_scores: List[float],
+        drift_window_days: int
+    ) -> List[tuple[str, str]]:
+        """
+        Generate recommendations for a whole batch at once.
 
-        # HIGH SUE + LOW QUALITY = HOLD (Risky)
-        elif sue_decile >= cls.BUY_SUE_DECILE and quality_score < cls.BUY_QUALITY:
-            return (
-                'HOLD',
-                f'High earnings surprise (Decile {sue_decile}) but low quality ({quality_score:.0f}/100). '
-                'Surprise may be driven by aggressive accounting (high accruals). Proceed with caution.'
-            )
+        The decision rules are evaluated as array conditions with np.select;
+        only the explanation text is formatted per row.
 
-        # LOW SUE = AVOID (regardless of quality)
-        elif sue_decile <= cls.AVOID_SUE_DECILE:
-            return (
-                'AVOID',
-                f'Negative earnings surprise (Decile {sue_decile}) indicates downward drift risk '
-                f'over {drift_window_days} days. Quality score: {quality_score:.0f}/100.'
-            )
+        Args:
+            sue_deciles: SUE decile ranks (1-10)
+            quality_scores: Earnings quality scores (0-100), aligned with sue_deciles
+            drift_window_days: Drift window in days
 
-        # MEDIUM SUE + HIGH QUALITY = HOLD
-        elif quality_score >= cls.STRONG_BUY_QUALITY:
-            return (
-                'HOLD',
-                f'Moderate earnings surprise (Decile {sue_decile}) with high quality '
-                f'({quality_score:.0f}/100). Weaker PEAD signal but solid fundamentals.'
-            )
+        Returns:
+            List of (recommendation, explanation) tuples
+        """
+        if not sue_deciles:
+            return []
+
+        deciles = np.asarray(sue_deciles)
+        quality = np.asarray(quality_scores, dtype=np.float64)
+
+        high_sue = deciles >= cls.BUY_SUE_DECILE
+        rule_index = np.select(
+            [
+                # HIGH SUE + HIGH QUALITY = STRONG_BUY
+                (deciles >= cls.STRONG_BUY_SUE_DECILE) & (quality >= cls.STRONG_BUY_QUALITY),
+                # HIGH SUE + MEDIUM QUALITY = BUY
+                high_sue & (quality >= cls.BUY_QUALITY),
+                # HIGH SUE + LOW QUALITY = HOLD (Risky)
+                high_sue & (quality < cls.BUY_QUALITY),
+                # LOW SUE = AVOID (regardless of quality)
+                deciles <= cls.AVOID_SUE_DECILE,
+                # MEDIUM SUE + HIGH QUALITY = HOLD
+                quality >= cls.STRONG_BUY_QUALITY,
+            ],
+            [0, 1, 2, 3, 4],
+            # MEDIUM SUE + MEDIUM QUALITY = HOLD
+            default=5
+        )
 
-        # MEDIUM SUE + MEDIUM QUALITY = HOLD
-        else:
-            return (
-                'HOLD',
-                f'Moderate earnings surprise (Decile {sue_decile}) with medium quality '
-                f'({quality_score:.0f}/100). Insufficient signal strength for action.'
-            )
+        recommendations = []
+        for index, sue_decile, quality_score in zip(rule_index.tolist(), sue_deciles, quality_scores):
+            recommendation, template = cls._RECOMMENDATION_RULES[index]
+            recommendations.append((
+                recommendation,
+                template.format(
+                    sue_decile=sue_decile,
+                    quality_score=quality_score,
+                    drift_window_days=drift_window_days
+                )
+            ))
+
+        return recommendations
 
     @classmethod
     def get_recommended_drift_window(cls, period_type: str) -> int:
@@ -254,26 +512,14 @@ class PEADScreeningService:
         Returns:
             Recommended drift window in days
         """
-        if period_type == 'QUARTER':
-            return cls.DRIFT_WINDOW_QUARTERLY
-        elif period_type == 'HALF':
-            return cls.DRIFT_WINDOW_SEMI_ANNUAL
-        else:  # ANNUAL
-            return cls.DRIFT_WINDOW_EXTENDED
+        return cls._PERIOD_DRIFT_WINDOWS.get(period_type, cls.DRIFT_WINDOW_EXTENDED)
 
     @classmethod
     def _get_decile_color(cls, decile: Optional[int]) -> str:
         """Get Bootstrap color class for SUE decile badge."""
         if decile is None:
             return 'secondary'
-        elif decile >= 9:
-            return 'success'
-        elif decile >= 7:
-            return 'primary'
-        elif decile >= 4:
-            return 'warning'
-        else:
-            return 'danger'
+        return cls._DECILE_COLORS[min(max(decile, 0), 10)]
 
     @classmethod
     def _get_quality_color(cls, quality: Optional[float]) -> str:
@@ -292,13 +538,4 @@ class PEADScreeningService:
     @classmethod
     def _get_recommendation_color(cls, recommendation: Optional[str]) -> str:
         """Get Bootstrap color class for recommendation badge."""
-        if recommendation == 'STRONG_BUY':
-            return 'success'
-        elif recommendation == 'BUY':
-            return 'primary'
-        elif recommendation == 'HOLD':
-            return 'warning'
-        elif recommendation == 'AVOID':
-            return 'danger'
-        else:
-            return 'secondary'
+        return cls._RECOMMENDATION_COLORS.get(recommendation, 'secondary')
@@ -2,41 +2,115 @@
 Service for evaluating player positions, metrics, and roles.
 """
 
-from typing import List, Dict, Optional, Any
+import re
+from functools import lru_cache
+from operator import attrgetter
+from typing import List, Dict, Optional, Any, Tuple
 from models.squad_audit import Player
 from models.constants import PositionCategory, POSITION_METRICS
+from analyzers.metrics import METRIC_SOURCES, first_set
+from analyzers.role_recommendation_engine import RoleRecommendationEngine
+from utils.parallel import parse_n_jobs, process_map
+
+
+# Category rules in priority order, each a lookahead from the start of the
+# token so a single regex match applies them all; the first alternative that
+# matches names the category (no match, e.g. "M (R)", falls back to CM)
+_POSITION_RULES = re.compile(
+    r'(?P<GK>GK)'
+    r'|(?P<CB>(?=.*(?:DC|D \(C\))))'
+    r'|(?P<FB>(?!.*DM)(?=.*(?:DR|DL|WB)))'
+    r'|(?P<DM>(?=.*DM))'
+    r'|(?P<CM>(?=.*(?:MC|M \(C\))))'
+    r'|(?P<AM>(?=.*AM))'
+    r'|(?P<W>(?=.*W))'
+    r'|(?P<ST>(?=.*(?:ST|S \(C\))))'
+    r'|(?P<D>D)'
+    r'|(?P<S>S)',
+    re.DOTALL
+)
+
+_POSITION_RULE_CATEGORIES = {
+    'GK': PositionCategory.GK,
+    'CB': PositionCategory.CB,
+    'FB': PositionCategory.FB,
+    'DM': PositionCategory.DM,
+    'CM': PositionCategory.CM,
+    'AM': PositionCategory.AM,
+    'W': PositionCategory.W,
+    'ST': PositionCategory.ST,
+    'D': PositionCategory.CB,
+    'S': PositionCategory.ST,
+}
+
+
+def _parse_position_string(pos_str: str) -> PositionCategory:
+    """
+    Map a single FM position token (e.g. "D (RC)") to its category.
+
+    Never raises; tokens no rule recognises fall back to CM.
+    """
+    match = _POSITION_RULES.match(pos_str.upper().strip())
+    if match is None:
+        return PositionCategory.CM
+    return _POSITION_RULE_CATEGORIES[match.lastgroup]
+
+
+# Reads a position's fit metrics from a player in one call, built once per position
+_POSITION_FIT_READERS = {
+    position: attrgetter(*metrics) for position, metrics in POSITION_METRICS.items()
+}
+
+
+# Player fields set by PlayerEvaluatorService.evaluate_roles
+ROLE_RESULT_FIELDS = (
+    'all_role_scores', 'best_role', 'current_role_score',
+    'recommended_role', 'role_change_confidence', 'role_change_reason'
+)
+
+
+def _evaluate_player_roles(player: Player, player_metrics: Dict[str, float]) -> Tuple:
+    """
+    Evaluate one player's roles and return the resulting ROLE_RESULT_FIELDS.
+
+    Module-level so it can run in a worker process on a copy of the player.
+    """
+    PlayerEvaluatorService().evaluate_roles(player, player_metrics)
+    return tuple(getattr(player, field_name) for field_name in ROLE_RESULT_FIELDS)
+
+
+@lru_cache(maxsize=4096)
+def _parse_positions(position: str) -> Tuple[PositionCategory, ...]:
+    """
+    Parse a comma-separated FM position string into distinct categories.
+
+    Squads reuse a few dozen position strings, so results are cached per
+    string and shared by every evaluation of every player.
+    """
+    possible_positions = []
+    seen = set()
+    for pos_str in position.split(','):
+        pos_cat = _parse_position_string(pos_str.strip())
+        if pos_cat not in seen:
+            seen.add(pos_cat)
+            possible_positions.append(pos_cat)
+    return tuple(possible_positions)
+
 
 class PlayerEvaluatorService:
     """Handles business logic for player evaluation."""
 
     def __init__(self):
-        pass
+        self._engine = RoleRecommendationEngine()
 
     def get_position_category(self, player: Player) -> PositionCategory:
         """
         Determine the best-fit position category for the player.
         """
-        position_strings = [p.strip() for p in player.position.split(',')]
-        possible_positions = []
-        for pos_str in position_strings:
-            try:
-                pos_cat = self._parse_position_string(pos_str)
-                if pos_cat not in possible_positions:
-                    possible_positions.append(pos_cat)
-            except:
-                continue
+        possible_positions = _parse_positions(player.position)
 
         if not possible_positions:
-            pos = player.position_selected.upper()
-            if pos == "GK": return PositionCategory.GK
-            elif pos in ["DCR", "DCL", "DC"]: return PositionCategory.CB
-            elif pos in ["DR", "DL"] or "WB" in pos: return PositionCategory.FB
-            elif "DM" in pos: return PositionCategory.DM
-            elif pos in ["MCR", "MCL", "MC"]: return PositionCategory.CM
-            elif pos in ["AMR", "AML", "AM"] or "AM" in pos: return PositionCategory.AM
-            elif "W" in pos and "WB" not in pos: return PositionCategory.W
-            elif pos in ["STC", "ST"] or "ST" in pos: return PositionCategory.ST
-            else: return PositionCategory.CM
+            return self._selected_position_category(player)
 
         if len(possible_positions) == 1:
             return possible_positions[0]
@@ -56,110 +130,112 @@ class PlayerEvaluatorService:
         """
         Get all possible position categories this player can play.
         """
-        position_strings = [p.strip() for p in player.position.split(',')]
-        possible_positions = []
-        for pos_str in position_strings:
-            try:
-                pos_cat = self._parse_position_string(pos_str)
-                if pos_cat not in possible_positions:
-                    possible_positions.append(pos_cat)
-            except:
-                continue
+        possible_positions = list(_parse_positions(player.position))
 
         if not possible_positions:
-            possible_positions.append(self.get_position_category(player))
+            possible_positions.append(self._selected_position_category(player))
 
         return possible_positions
 
+    def _selected_position_category(self, player: Player) -> PositionCategory:
+        """Fallback category from the position the player was selected in."""
+        pos = player.position_selected.upper()
+        if pos == "GK": return PositionCategory.GK
+        elif pos in ["DCR", "DCL", "DC"]: return PositionCategory.CB
+        elif pos in ["DR", "DL"] or "WB" in pos: return PositionCategory.FB
+        elif "DM" in pos: return PositionCategory.DM
+        elif pos in ["MCR", "MCL", "MC"]: return PositionCategory.CM
+        elif pos in ["AMR", "AML", "AM"] or "AM" in pos: return PositionCategory.AM
+        elif "W" in pos and "WB" not in pos: return PositionCategory.W
+        elif pos in ["STC", "ST"] or "ST" in pos: return PositionCategory.ST
+        else: return PositionCategory.CM
+
     def get_normalized_metrics(self, player: Player) -> Dict[str, float]:
         """
         Get standardized metric dictionary for role evaluation.
         """
-        metrics = {}
-        metrics['tackles_90'] = player.tck_90 or player.k_tck_90 or 0.0
-        metrics['headers_won_90'] = player.hdrs_w_90 or 0.0
-        metrics['header_win_pct'] = player.hdr_pct or 0.0
-        metrics['clearances_90'] = player.clr_90 or 0.0
-        metrics['interceptions_90'] = player.int_90 or 0.0
-        metrics['blocks_90'] = player.shts_blckd_90 or player.blk_90 or 0.0
-        metrics['prog_passes_90'] = player.pr_passes_90 or 0.0
-        metrics['pressures_90'] = player.pres_c_90 or 0.0
-        metrics['dribbles_90'] = player.drb_90 or 0.0
-        metrics['key_passes_90'] = player.op_kp_90 or player.ch_c_90 or 0.0
-        metrics['xassists_90'] = player.xa_90 or 0.0
-        metrics['crosses_90'] = player.op_crs_c_90 or 0.0
-        metrics['sprints_90'] = player.sprints_90 or 0.0
-        metrics['shots_on_target_90'] = player.sht_90 or player.shot_90 or 0.0
-        metrics['xg_90'] = player.np_xg_90 or player.xg or 0.0
-        metrics['conversion_pct'] = player.conv_pct or 0.0
-        metrics['pass_pct'] = player.pas_pct or 0.0
-        metrics['xgp_90'] = player.xgp_90 or player.xgp or 0.0
-        metrics['conceded_90'] = player.con_90 or 0.0
-        metrics['save_pct'] = player.sv_pct or 0.0
-        return metrics
+        return {
+            metric: first_set(player, sources)
+            for metric, sources in METRIC_SOURCES.items()
+        }
+
+    def evaluate_squad(self, players: List[Player], n_jobs: int = 1) -> None:
+        """
+        Evaluate and store role scores for every player in a squad.
+
+        Each player's normalized metrics are built once and reused by all of
+        that player's role evaluations. Players are
+        independent, so with n_jobs != 1 they are spread over worker
+        processes and the results copied back onto the players.
+
+        Args:
+            players: Players to evaluate
+            n_jobs: Worker processes for role evaluation
+                    (1 = serial, -1 = one per CPU)
+        """
+        metrics = [self.get_normalized_metrics(player) for player in players]
+
+        if parse_n_jobs(n_jobs) == 1 or len(players) < 2:
+            for player, player_metrics in zip(players, metrics):
+                self.evaluate_roles(player, player_metrics)
+            return
+
+        results = process_map(_evaluate_player_roles, players, metrics, n_jobs=n_jobs)
+
+        for player, role_results in zip(players, results):
+            for field_name, value in zip(ROLE_RESULT_FIELDS, role_results):
+                setattr(player, field_name, value)
 
     def _parse_position_string(self, pos_str: str) -> PositionCategory:
-        pos = pos_str.upper().strip()
-        if pos.startswith("GK"): return PositionCategory.GK
-        if any(x in pos for x in ["DC", "D (C)"]): return PositionCategory.CB
-        if any(x in pos for x in ["DR", "DL", "D/WB", "WB"]) and "DM" not in pos: return PositionCategory.FB
-        if "DM" in pos: return PositionCategory.DM
-        if any(x in pos for x in ["MC", "M (C)"]): return PositionCategory.CM
-        if "AM" in pos: return PositionCategory.AM
-        if "W" in pos and "WB" not in pos and "DM" not in pos: return PositionCategory.W
-        if any(x in pos for x in ["ST", "S (C)"]): return PositionCategory.ST
-        if pos.startswith("D"): return PositionCategory.CB
-        elif pos.startswith("M"): return PositionCategory.CM
-        elif pos.startswith("S"): return PositionCategory.ST
-        else: return PositionCategory.CM
+        return _parse_position_string(pos_str)
 
     def _evaluate_position_fit(self, player: Player, position_cat: PositionCategory) -> float:
-        metrics = POSITION_METRICS.get(position_cat, [])
-        score = 0.0
-        count = 0
-        for metric in metrics:
-            value = getattr(player, metric, None)
-            if value is not None and value > 0:
-                score += value
-                count += 1
-        return score / count if count > 0 else 0.0
-
-    def evaluate_roles(self, player: Player):
+        read_metrics = _POSITION_FIT_READERS.get(position_cat)
+        if read_metrics is None:
+            return 0.0
+        values = [value for value in read_metrics(player) if value is not None and value > 0]
+        return sum(values) / len(values) if values else 0.0
+
+    def evaluate_roles(self, player: Player, player_metrics: Optional[Dict[str, float]] = None):
         """
         Evaluate and store all role scores.
+
+        Args:
+            player: Player to evaluate
+            player_metrics: Normalized metrics for the player, if already built
         """
-        from analyzers.role_recommendation_engine import RoleRecommendationEngine
-        engine = RoleRecommendationEngine()
+        if player_metrics is None:
+            player_metrics = self.get_normalized_metrics(player)
+
+        engine = self._engine
+
+        # Score every role once; the playable subset and the recommendations
+        # below are both taken from these scores
+        all_scores = engine.evaluate_all_roles(player, player_metrics=player_metrics)
+        scores_by_role = {score.role: score for score in all_scores}
 
         # Get the actual roles this player can play based on their position string
         # This is more specific than just position categories (e.g., distinguishes AM(C) vs WAP/WAS)
         playable_roles = engine._map_position_to_roles(player.position)
 
-        # Also get position categories for backwards compatibility with formation suggestions
-        positions = self.get_all_possible_positions(player)
-
-        # Evaluate only roles the player can actually play
+        # Keep only roles the player can actually play
         if playable_roles:
-            from models.role_definitions import ROLES
-            player.all_role_scores = []
-            for role_name in playable_roles:
-                if role_name in ROLES:
-                    role_profile = ROLES[role_name]
-                    score = engine.evaluator.evaluate_player_for_role(player, role_profile)
-                    player.all_role_scores.append(score)
+            player.all_role_scores = [
+                scores_by_role[role_name] for role_name in playable_roles if role_name in scores_by_role
+            ]
             # Sort by overall score
-            player.all_role_scores.sort(key=lambda s: s.overall_score, reverse=True)
+            player.all_role_scores.sort(key=attrgetter('overall_score'), reverse=True)
         else:
-            # Fallback: evaluate all roles
-            player.all_role_scores = engine.evaluate_all_roles(player)
+            # Fallback: all roles
+            player.all_role_scores = all_scores
 
         if not player.all_role_scores:
-            player.all_role_scores = engine.evaluate_all_roles(player)
+            player.all_role_scores = all_scores
 
         player.best_role = player.all_role_scores[0]
         player.current_role_score = engine.get_best_role_in_current_position(player, player.all_role_scores)
 
-        recommendations = engine.get_role_recommendations(player)
+        recommendations = engine.get_role_recommendations(player, player_metrics, all_scores)
         if recommendations:
             top_rec = recommendations[0]
             player.recommended_role = top_rec
@@ -4,38 +4,269 @@ Recommendation Engine - Rule-based system for player recommendations.
 Replaces nested conditionals with clear, testable rules.
 """
 
-from typing import Optional, List, Callable
+import logging
+from functools import lru_cache
+from itertools import product
+from typing import Optional, List, Dict, Tuple
 from datetime import date, datetime
 from dataclasses import dataclass
 from models.squad_audit import Player, Recommendation, StatusFlag
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1024)
+def parse_expiry(expires: str) -> Optional[date]:
+    """
+    Parse a DD/MM/YYYY contract expiry, or None if it is not a valid date.
+
+    The format is fixed, so the fields are split out and converted directly
+    rather than through strptime. Squads share a handful of expiry dates,
+    so each distinct string is parsed once.
+    """
+    try:
+        day, month, year = expires.split('/')
+    except (ValueError, AttributeError):
+        return None
+
+    if len(day) > 2 or len(month) > 2 or len(year) != 4 or not (day + month + year).isdecimal():
+        return None
+
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
 
 @dataclass
 class RecommendationContext:
     """Context object containing all data needed for recommendation."""
+    # Slots rather than a __dict__; built once per player and read by every rule.
+    # Listed explicitly since dataclass(slots=True) needs Python 3.10+.
+    __slots__ = (
+        'player', 'value_score', 'is_projected', 'game_date', 'contract_warning',
+        'tier', 'status_flag', 'mins', 'apps'
+    )
+
     player: Player
     value_score: float
     is_projected: bool
     game_date: Optional[date]
     contract_warning: bool
+    # Player fields read by the rules, resolved once per recommendation
+    tier: Optional[str]
+    status_flag: StatusFlag
+    mins: Optional[int]
+    apps: int
 
 
 class RecommendationRule:
-    """Base class for recommendation rules."""
+    """
+    Base class for recommendation rules.
+
+    Subclasses implement applies() and set the badge fields; generate()
+    builds the Recommendation from them. Rules are stateless, so a single
+    instance of each is shared by every engine.
+    """
 
-    def __init__(self, name: str, condition: Callable[[RecommendationContext], bool],
-                 recommendation_fn: Callable[[RecommendationContext], Recommendation]):
-        self.name = name
-        self.condition = condition
-        self.recommendation_fn = recommendation_fn
+    __slots__ = ()
+
+    name: str = ""
+    badge: str = ""
+    icon: str = ""
+    color: str = ""
+    explanation: str = ""
 
     def applies(self, context: RecommendationContext) -> bool:
         """Check if this rule applies to the given context."""
-        return self.condition(context)
+        raise NotImplementedError
+
+    def explain(self, context: RecommendationContext) -> str:
+        """Explanation text for this rule's recommendation."""
+        return self.explanation
 
     def generate(self, context: RecommendationContext) -> Recommendation:
         """Generate recommendation for this rule."""
-        return self.recommendation_fn(context)
+        return Recommendation(
+            badge=self.badge,
+            icon=self.icon,
+            color=self.color,
+            explanation=self.explain(context),
+            has_contract_warning=context.contract_warning
+        )
+
+
+class InsufficientDataRule(RecommendationRule):
+    """Rule 1: Insufficient data (<200 mins)."""
+
+    __slots__ = ()
+    name = "insufficient_data"
+    badge = "LOW DATA"
+    color = "secondary"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.mins is not None and context.mins < 200
+
+    def explain(self, context: RecommendationContext) -> str:
+        return f"Insufficient data ({context.mins} mins played)"
+
+
+class ProjectedStatsRule(RecommendationRule):
+    """Rule 2: Projected stats (200-500 mins)."""
+
+    __slots__ = ()
+    name = "projected_stats"
+    badge = "LOW DATA"
+    color = "secondary"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.mins is not None and 200 <= context.mins < 500
+
+    def explain(self, context: RecommendationContext) -> str:
+        return f"Projected stats only ({context.mins} mins played)"
+
+
+class EliteOverpaidRule(RecommendationRule):
+    """Rule 3: Elite but overpaid."""
+
+    __slots__ = ()
+    name = "elite_overpaid"
+    badge = "WAGE CUT"
+    color = "warning"
+    explanation = "Elite performance but overpaid"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.value_score < 50 and context.tier == 'ELITE'
+
+
+class PoorValueRule(RecommendationRule):
+    """Rule 4: Poor value (not elite)."""
+
+    __slots__ = ()
+    name = "poor_value"
+    badge = "CONSIDER SALE"
+    color = "danger"
+    explanation = "Poor value for wage cost"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.value_score < 50
+
+
+class EliteTransferListedRule(RecommendationRule):
+    """Rule 5: Elite on transfer list."""
+
+    __slots__ = ()
+    name = "elite_transfer_listed"
+    badge = "KEEP & PLAY"
+    color = "success"
+    explanation = "Elite ratings despite transfer list"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'ELITE' and context.status_flag == StatusFlag.TRANSFER_LISTED
+
+
+class EliteU21Rule(RecommendationRule):
+    """Rule 6: Elite U21 talent."""
+
+    __slots__ = ()
+    name = "elite_u21"
+    badge = "PROMOTE"
+    color = "info"
+    explanation = "Elite young talent"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'ELITE' and context.status_flag == StatusFlag.U21
+
+
+class EliteLowAppsRule(RecommendationRule):
+    """Rule 7: Elite low apps."""
+
+    __slots__ = ()
+    name = "elite_low_apps"
+    badge = "INCREASE MINS"
+    color = "info"
+    explanation = "Elite output per 90"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'ELITE' and context.apps < 10
+
+
+class EliteCoreRule(RecommendationRule):
+    """Rule 8: Elite core starter."""
+
+    __slots__ = ()
+    name = "elite_core"
+    badge = "CORE STARTER"
+    color = "success"
+    explanation = "Elite performance"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'ELITE'
+
+
+class GoodTransferListedRule(RecommendationRule):
+    """Rule 9: Good on transfer list."""
+
+    __slots__ = ()
+    name = "good_transfer_listed"
+    badge = "EVALUATE"
+    color = "warning"
+    explanation = "Good depth option on transfer list"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'GOOD' and context.status_flag == StatusFlag.TRANSFER_LISTED
+
+
+class GoodBackupRule(RecommendationRule):
+    """Rule 10: Good backup."""
+
+    __slots__ = ()
+    name = "good_backup"
+    badge = "BACKUP"
+    color = "secondary"
+    explanation = "Solid rotation option"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'GOOD'
+
+
+class PoorU21Rule(RecommendationRule):
+    """Rule 11: Poor U21 development."""
+
+    __slots__ = ()
+    name = "poor_u21"
+    badge = "DEVELOP"
+    color = "warning"
+    explanation = "Not ready yet"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'POOR' and context.status_flag == StatusFlag.U21
+
+
+class PoorSellRule(RecommendationRule):
+    """Rule 12: Poor sell/replace."""
+
+    __slots__ = ()
+    name = "poor_sell"
+    badge = "SELL/REPLACE"
+    color = "danger"
+    explanation = "Below standard"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return context.tier == 'POOR'
+
+
+class AverageBackupRule(RecommendationRule):
+    """Rule 13: Default (Average tier)."""
+
+    __slots__ = ()
+    name = "average_backup"
+    badge = "BACKUP"
+    color = "secondary"
+    explanation = "Average performance"
+
+    def applies(self, context: RecommendationContext) -> bool:
+        return True  # Catch-all
 
 
 class RecommendationEngine:
@@ -44,194 +275,110 @@ class RecommendationEngine:
 
     Evaluates rules in order and returns the first matching recommendation.
     Much easier to test and maintain than nested conditionals.
+
+    Rule conditions only depend on the tier, status flag, minutes bucket,
+    apps < 10 and value score < 50, so the first matching rule for every
+    combination is worked out once up front and recommendations become a
+    single table lookup.
     """
 
+    # Tiers the rules distinguish; any other tier behaves like no tier
+    RULE_TIERS = ('ELITE', 'GOOD', 'POOR')
+
+    # The only context fields rule conditions may read: the dispatch key is
+    # built from these alone, and _build_rule_table enforces it
+    DISPATCH_FIELDS = ('tier', 'status_flag', 'mins', 'apps', 'value_score')
+
+    # The rules never change, so they and their dispatch table are built on
+    # first use and shared by every engine instance
+    _shared_rules: Optional[List[RecommendationRule]] = None
+    _shared_rule_table: Optional[Dict[Tuple, RecommendationRule]] = None
+
     def __init__(self):
-        self.rules: List[RecommendationRule] = self._initialize_rules()
+        if RecommendationEngine._shared_rules is None:
+            rules = self._initialize_rules()
+            RecommendationEngine._shared_rule_table = self._build_rule_table(rules)
+            RecommendationEngine._shared_rules = rules
+
+        self.rules: List[RecommendationRule] = RecommendationEngine._shared_rules
+        self.rule_table: Dict[Tuple, RecommendationRule] = RecommendationEngine._shared_rule_table
+
+    @classmethod
+    def _dispatch_key(
+        cls,
+        tier: Optional[str],
+        status_flag: StatusFlag,
+        mins: Optional[int],
+        apps: int,
+        value_score: float
+    ) -> Tuple:
+        """Reduce the fields the rules read to the cases they distinguish."""
+        if mins is not None and mins < 200:
+            mins_bucket = 0
+        elif mins is not None and mins < 500:
+            mins_bucket = 1
+        else:
+            mins_bucket = 2
+
+        return (
+            tier if tier in cls.RULE_TIERS else None,
+            status_flag,
+            mins_bucket,
+            apps < 10,
+            value_score < 50
+        )
+
+    @classmethod
+    def _build_rule_table(cls, rules: List[RecommendationRule]) -> Dict[Tuple, RecommendationRule]:
+        """
+        Map every dispatch key to the first rule that applies to it.
+
+        Each key is probed with a context holding representative values for
+        its case, so the table follows the rule list and its order exactly.
+        Only the DISPATCH_FIELDS are set on the probe; a rule whose condition
+        reads any other field fails here instead of being mis-tabled.
+
+        Raises:
+            RuntimeError: If a rule condition reads a field outside DISPATCH_FIELDS
+        """
+        table = {}
+        for tier, status_flag, (mins_bucket, mins), (apps_low, apps), (value_low, value_score) in product(
+            (*cls.RULE_TIERS, None),
+            StatusFlag,
+            ((0, 0), (1, 200), (2, None)),
+            ((True, 0), (False, 10)),
+            ((True, 0.0), (False, 50.0))
+        ):
+            # Bypass __init__ so every other slot stays unset and raises on read
+            probe = object.__new__(RecommendationContext)
+            for field_name, value in zip(cls.DISPATCH_FIELDS, (tier, status_flag, mins, apps, value_score)):
+                setattr(probe, field_name, value)
+            try:
+                rule = next((rule for rule in rules if rule.applies(probe)), None)
+            except AttributeError as e:
+                raise RuntimeError(
+                    f"Recommendation rules may only read {', '.join(cls.DISPATCH_FIELDS)}: {e}"
+                ) from e
+            if rule is not None:
+                table[(tier, status_flag, mins_bucket, apps_low, value_low)] = rule
+        return table
 
     def _initialize_rules(self) -> List[RecommendationRule]:
         """Initialize recommendation rules in priority order."""
         return [
-            # Rule 1: Insufficient data (<200 mins)
-            RecommendationRule(
-                name="insufficient_data",
-                condition=lambda ctx: ctx.player.mins is not None and ctx.player.mins < 200,
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="LOW DATA",
-                    icon="",
-                    color="secondary",
-                    explanation=f"Insufficient data ({ctx.player.mins} mins played)",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 2: Projected stats (200-500 mins)
-            RecommendationRule(
-                name="projected_stats",
-                condition=lambda ctx: ctx.player.mins is not None and 200 <= ctx.player.mins < 500,
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="LOW DATA",
-                    icon="",
-                    color="secondary",
-                    explanation=f"Projected stats only ({ctx.player.mins} mins played)",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 3: Elite but overpaid
-            RecommendationRule(
-                name="elite_overpaid",
-                condition=lambda ctx: (ctx.value_score < 50
-                                      and ctx.player.best_role
-                                      and ctx.player.best_role.tier == 'ELITE'),
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="WAGE CUT",
-                    icon="",
-                    color="warning",
-                    explanation="Elite performance but overpaid",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 4: Poor value (not elite)
-            RecommendationRule(
-                name="poor_value",
-                condition=lambda ctx: ctx.value_score < 50,
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="CONSIDER SALE",
-                    icon="",
-                    color="danger",
-                    explanation="Poor value for wage cost",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 5: Elite on transfer list
-            RecommendationRule(
-                name="elite_transfer_listed",
-                condition=lambda ctx: (ctx.player.best_role
-                                      and ctx.player.best_role.tier == 'ELITE'
-                                      and ctx.player.get_status_flag() == StatusFlag.TRANSFER_LISTED),
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="KEEP & PLAY",
-                    icon="",
-                    color="success",
-                    explanation="Elite ratings despite transfer list",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 6: Elite U21 talent
-            RecommendationRule(
-                name="elite_u21",
-                condition=lambda ctx: (ctx.player.best_role
-                                      and ctx.player.best_role.tier == 'ELITE'
-                                      and ctx.player.get_status_flag() == StatusFlag.U21),
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="PROMOTE",
-                    icon="",
-                    color="info",
-                    explanation="Elite young talent",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 7: Elite low apps
-            RecommendationRule(
-                name="elite_low_apps",
-                condition=lambda ctx: (ctx.player.best_role
-                                      and ctx.player.best_role.tier == 'ELITE'
-                                      and ctx.player.apps < 10),
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="INCREASE MINS",
-                    icon="",
-                    color="info",
-                    explanation="Elite output per 90",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 8: Elite core starter
-            RecommendationRule(
-                name="elite_core",
-                condition=lambda ctx: ctx.player.best_role and ctx.player.best_role.tier == 'ELITE',
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="CORE STARTER",
-                    icon="",
-                    color="success",
-                    explanation="Elite performance",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 9: Good on transfer list
-            RecommendationRule(
-                name="good_transfer_listed",
-                condition=lambda ctx: (ctx.player.best_role
-                                      and ctx.player.best_role.tier == 'GOOD'
-                                      and ctx.player.get_status_flag() == StatusFlag.TRANSFER_LISTED),
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="EVALUATE",
-                    icon="",
-                    color="warning",
-                    explanation="Good depth option on transfer list",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 10: Good backup
-            RecommendationRule(
-                name="good_backup",
-                condition=lambda ctx: ctx.player.best_role and ctx.player.best_role.tier == 'GOOD',
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="BACKUP",
-                    icon="",
-                    color="secondary",
-                    explanation="Solid rotation option",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 11: Poor U21 development
-            RecommendationRule(
-                name="poor_u21",
-                condition=lambda ctx: (ctx.player.best_role
-                                      and ctx.player.best_role.tier == 'POOR'
-                                      and ctx.player.get_status_flag() == StatusFlag.U21),
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="DEVELOP",
-                    icon="",
-                    color="warning",
-                    explanation="Not ready yet",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 12: Poor sell/replace
-            RecommendationRule(
-                name="poor_sell",
-                condition=lambda ctx: ctx.player.best_role and ctx.player.best_role.tier == 'POOR',
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="SELL/REPLACE",
-                    icon="",
-                    color="danger",
-                    explanation="Below standard",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
-
-            # Rule 13: Default (Average tier)
-            RecommendationRule(
-                name="average_backup",
-                condition=lambda ctx: True,  # Catch-all
-                recommendation_fn=lambda ctx: Recommendation(
-                    badge="BACKUP",
-                    icon="",
-                    color="secondary",
-                    explanation="Average performance",
-                    has_contract_warning=ctx.contract_warning
-                )
-            ),
+            InsufficientDataRule(),
+            ProjectedStatsRule(),
+            EliteOverpaidRule(),
+            PoorValueRule(),
+            EliteTransferListedRule(),
+            EliteU21Rule(),
+            EliteLowAppsRule(),
+            EliteCoreRule(),
+            GoodTransferListedRule(),
+            GoodBackupRule(),
+            PoorU21Rule(),
+            PoorSellRule(),
+            AverageBackupRule(),
         ]
 
     def generate_recommendation(
@@ -244,11 +391,14 @@ class RecommendationEngine:
         """
         Generate recommendation using rule-based system.
 
-        Evaluates rules in order and returns first match.
-        Much clearer than nested conditionals.
+        Returns the first matching rule's recommendation, looked up in the
+        precomputed rule table.
         """
+        # Resolve the reference date once for this player
+        today = game_date if game_date else datetime.now().date()
+
         # Check contract warning
-        contract_warning = self._check_contract_expiring_soon(player, game_date)
+        contract_warning = self._check_contract_expiring_soon(player, today)
 
         # Create context
         context = RecommendationContext(
@@ -256,13 +406,19 @@ class RecommendationEngine:
             value_score=value_score,
             is_projected=is_projected,
             game_date=game_date,
-            contract_warning=contract_warning
+            contract_warning=contract_warning,
+            tier=player.best_role.tier if player.best_role else None,
+            status_flag=player.get_status_flag(),
+            mins=player.mins,
+            apps=player.apps
         )
 
-        # Evaluate rules in order
-        for rule in self.rules:
-            if rule.applies(context):
-                return rule.generate(context)
+        # Look up the first matching rule for this case
+        rule = self.rule_table.get(self._dispatch_key(
+            context.tier, context.status_flag, context.mins, context.apps, value_score
+        ))
+        if rule is not None:
+            return rule.generate(context)
 
         # Should never reach here due to catch-all rule
         return Recommendation(
@@ -281,15 +437,14 @@ class RecommendationEngine:
         if not player.expires or player.expires == "-":
             return False
 
-        try:
-            expiry_date = datetime.strptime(player.expires, "%d/%m/%Y").date()
-            today = game_date if game_date else datetime.now().date()
-            months_remaining = (expiry_date.year - today.year) * 12 + (expiry_date.month - today.month)
-            return months_remaining < 6
-        except (ValueError, TypeError) as e:
+        expiry_date = parse_expiry(player.expires)
+        if expiry_date is None:
             # Log but don't crash
-            import logging
-            logging.getLogger(__name__).debug(
-                f"Failed to check contract expiry for '{player.name}': {e}"
+            logger.debug(
+                f"Failed to check contract expiry for '{player.name}': invalid date '{player.expires}'"
             )
             return False
+
+        today = game_date if game_date else datetime.now().date()
+        months_remaining = (expiry_date.year - today.year) * 12 + (expiry_date.month - today.month)
+        return months_remaining < 6
@@ -2,29 +2,47 @@
 Squad Analysis Manager - Orchestrates the analysis workflow.
 """
 
+import gzip
 import os
+import pickle
+import time
 import uuid
-import tempfile
 from datetime import date
-from typing import Tuple, List, Optional, Dict
+from typing import Tuple, List, Optional, Dict, Union
 from flask import session, current_app
 from services.parser_factory import ParserFactory
 from services.squad_audit_service import SquadAuditService
 from services.player_evaluator_service import PlayerEvaluatorService
 from models.squad_audit import Squad, SquadAnalysisResult
 from models.league_baseline import LeagueBaselineCollection
+from utils.parallel import configured_n_jobs
+
+
+def _upload_path(filename: str) -> str:
+    """Path of a file in the squad upload directory set up by create_app."""
+    return os.path.join(current_app.config['SQUAD_UPLOAD_DIR'], filename)
+
 
 class SquadAnalysisManager:
     """Manages the end-to-end squad analysis process."""
 
-    def __init__(self):
+    def __init__(self, n_jobs: Optional[int] = None):
+        """
+        Initialize manager with all required services.
+
+        Args:
+            n_jobs: Worker processes for per-player role evaluation
+                    (1 = serial, -1 = one per CPU); None uses the app's
+                    ANALYSIS_WORKERS setting
+        """
+        self.n_jobs = n_jobs
         self.parser_factory = ParserFactory()
         self.audit_service = SquadAuditService()
         self.player_evaluator = PlayerEvaluatorService()
 
     def process_squad_upload(
         self,
-        file_content: str,
+        file_content: Union[str, bytes],
         selected_division: Optional[str] = None,
         league_baselines: Optional[LeagueBaselineCollection] = None,
         game_date: Optional[date] = None
@@ -35,10 +53,18 @@ class SquadAnalysisManager:
         2. Parses squad
         3. Evaluates players
         4. Analyzes squad (with league baselines if provided)
-        5. Persists to session-linked temporary storage
+        5. Persists to session-linked storage in the instance folder
+
+        Raw UTF-8 upload bytes are decoded once for parsing and stored as
+        received, without being encoded again.
         """
         errors = []
         try:
+            raw_content = None
+            if isinstance(file_content, bytes):
+                raw_content = file_content
+                file_content = file_content.decode('utf-8')
+
             # Detect and get parser
             parser = self.parser_factory.get_parser(file_content)
 
@@ -46,8 +72,7 @@ class SquadAnalysisManager:
             squad = parser.parse_html(file_content)
 
             # Evaluate roles for all players
-            for player in squad.players:
-                self.player_evaluator.evaluate_roles(player)
+            self.player_evaluator.evaluate_squad(squad.players, configured_n_jobs(self.n_jobs))
 
             # Analyze squad with league baselines
             analysis_result = self.audit_service.analyze_squad(
@@ -57,8 +82,13 @@ class SquadAnalysisManager:
                 game_date=game_date
             )
 
-            # Persist to safe temporary storage (including division and game date)
-            self._persist_to_session(file_content, selected_division, game_date)
+            # Persist to private upload storage (including division, game date and result)
+            self._persist_to_session(
+                raw_content if raw_content is not None else file_content,
+                selected_division,
+                game_date,
+                analysis_result
+            )
 
             return analysis_result, errors
             
@@ -72,10 +102,17 @@ class SquadAnalysisManager:
 
     def get_analysis_from_session(self) -> Optional[SquadAnalysisResult]:
         """
-        Retrieves and re-analyzes squad from session-stored HTML with division and game date.
+        Retrieves the squad analysis stored for this session.
 
-        Safely handles corrupted/invalid session data with validation and fallbacks.
+        Loads the result cached at upload time; if it is missing or
+        unreadable, re-analyzes the session-stored HTML with division and
+        game date and caches that result for later requests. Safely handles
+        corrupted/invalid session data with validation and fallbacks.
         """
+        cached_result = self._get_cached_analysis()
+        if cached_result is not None:
+            return cached_result
+
         html_content = self._get_from_session()
         if not html_content:
             return None
@@ -93,16 +130,20 @@ class SquadAnalysisManager:
         parser = self.parser_factory.get_parser(html_content)
         squad = parser.parse_html(html_content)
 
-        for player in squad.players:
-            self.player_evaluator.evaluate_roles(player)
+        self.player_evaluator.evaluate_squad(squad.players, configured_n_jobs(self.n_jobs))
 
-        return self.audit_service.analyze_squad(
+        analysis_result = self.audit_service.analyze_squad(
             squad,
             selected_division=selected_division,
             league_baselines=league_baselines,
             game_date=game_date
         )
 
+        # Replace the missing or stale cache so the next request loads it
+        self._cache_analysis(session['squad_analysis_id'], analysis_result)
+
+        return analysis_result
+
     def _parse_game_date_from_session(self) -> Optional[date]:
         """
         Safely parse game date from session storage.
@@ -144,39 +185,133 @@ class SquadAnalysisManager:
             )
             return None
 
-    def _persist_to_session(self, content: str, selected_division: Optional[str] = None, game_date: Optional[date] = None):
-        """Stores content in a UUID-named file and saves UUID + division + game_date in session."""
-        analysis_id = str(uuid.uuid4())
+    def _persist_to_session(
+        self,
+        content: Union[str, bytes],
+        selected_division: Optional[str] = None,
+        game_date: Optional[date] = None,
+        analysis_result: Optional[SquadAnalysisResult] = None
+    ):
+        """
+        Stores content in a UUID-named file and saves UUID + division + game_date in session.
 
-        # Ensure temp directory exists
-        temp_dir = os.path.join(tempfile.gettempdir(), 'squad_audit_uploads')
-        os.makedirs(temp_dir, exist_ok=True)
+        The HTML is gzip-compressed at level 1, which is nearly as fast as a
+        plain write and shrinks squad exports several times over. The
+        analysis result, when given, is pickled alongside the HTML so
+        later requests can load it instead of re-parsing and re-analyzing.
+        """
+        self._prune_expired_uploads()
+        analysis_id = str(uuid.uuid4())
 
-        file_path = os.path.join(temp_dir, f"{analysis_id}.html")
+        file_path = _upload_path(f"{analysis_id}.html.gz")
+        try:
+            self._write_upload(file_path, content)
+        except FileNotFoundError:
+            # Upload directory was removed since startup
+            os.makedirs(current_app.config['SQUAD_UPLOAD_DIR'], mode=0o700, exist_ok=True)
+            self._write_upload(file_path, content)
 
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        if analysis_result is not None:
+            self._cache_analysis(analysis_id, analysis_result)
 
         session['squad_analysis_id'] = analysis_id
         session['selected_division'] = selected_division
         session['game_date'] = game_date.isoformat() if game_date else None
         session.permanent = True
 
+    @staticmethod
+    def _cache_analysis(analysis_id: str, analysis_result: SquadAnalysisResult) -> None:
+        """Pickles an analysis result next to the upload it was built from."""
+        if not current_app.config['SQUAD_ANALYSIS_CACHE']:
+            return
+
+        try:
+            with open(_upload_path(f"{analysis_id}.pkl"), 'wb') as f:
+                pickle.dump(analysis_result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError, OSError) as e:
+            # The HTML is enough to rebuild the analysis, so just skip the cache
+            current_app.logger.warning(f"Could not cache squad analysis: {e}")
+
+    @staticmethod
+    def _prune_expired_uploads() -> None:
+        """
+        Deletes uploads and cached analyses older than the session lifetime.
+
+        Files are only reachable through the session that uploaded them, so
+        once that session has expired they are orphaned. Runs on each new
+        upload, which keeps the directory bounded without a separate job.
+        """
+        cutoff = time.time() - current_app.permanent_session_lifetime.total_seconds()
+        try:
+            with os.scandir(current_app.config['SQUAD_UPLOAD_DIR']) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_file() and entry.stat().st_mtime < cutoff:
+                            os.remove(entry.path)
+                    except FileNotFoundError:
+                        # Already pruned by another worker
+                        pass
+        except OSError as e:
+            current_app.logger.warning(f"Could not prune squad uploads: {e}")
+
+    @staticmethod
+    def _write_upload(file_path: str, content: Union[str, bytes]) -> None:
+        """Gzips raw upload bytes as-is, or text as UTF-8."""
+        if isinstance(content, bytes):
+            with gzip.open(file_path, 'wb', compresslevel=1) as f:
+                f.write(content)
+        else:
+            with gzip.open(file_path, 'wt', encoding='utf-8', compresslevel=1) as f:
+                f.write(content)
+
     def _get_from_session(self) -> Optional[str]:
-        """Reads content from file linked by session UUID."""
+        """
+        Reads content from file linked by session UUID.
+
+        Falls back to the uncompressed .html file written before uploads
+        were gzipped.
+        """
         analysis_id = session.get('squad_analysis_id')
         if not analysis_id:
             return None
-            
-        temp_dir = os.path.join(tempfile.gettempdir(), 'squad_audit_uploads')
-        file_path = os.path.join(temp_dir, f"{analysis_id}.html")
-        
-        if not os.path.exists(file_path):
+
+        file_path = _upload_path(f"{analysis_id}.html")
+
+        try:
+            with gzip.open(f"{file_path}.gz", 'rt', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
+            pass
+
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except FileNotFoundError:
             return None
             
-        with open(file_path, 'r', encoding='utf-8') as f:
-            return f.read()
-            
+    def _get_cached_analysis(self) -> Optional[SquadAnalysisResult]:
+        """Loads the analysis result pickled at upload time for the session UUID."""
+        analysis_id = session.get('squad_analysis_id')
+        if not analysis_id:
+            return None
+
+        if not current_app.config['SQUAD_ANALYSIS_CACHE']:
+            # Anyone else able to write to the upload dir could plant a pickle
+            return None
+
+        file_path = _upload_path(f"{analysis_id}.pkl")
+
+        try:
+            with open(file_path, 'rb') as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError,
+                ValueError, KeyError, TypeError, IndexError) as e:
+            # Stale or corrupted cache (e.g. truncated or from an older version): re-analyze
+            current_app.logger.warning(f"Ignoring unreadable squad analysis cache: {e}")
+            return None
+
     def get_formation_suggestions(self, result: SquadAnalysisResult) -> List[Dict]:
         """Wrapper for formation suggestions."""
         return self.audit_service.suggest_formations(result, top_n=3)
@@ -2,8 +2,12 @@
 Squad Audit Analysis Service - Refactored.
 """
 
-from typing import Dict, List, Optional, Tuple
+import heapq
+from functools import lru_cache
+from operator import attrgetter, itemgetter
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 from datetime import datetime, date
+import numpy as np
 from models.squad_audit import (
     Player,
     Squad,
@@ -19,7 +23,50 @@ from models.squad_audit import (
 from models.constants import PositionCategory, POSITION_METRICS, METRIC_NAMES
 from models.league_baseline import LeagueWageBaseline, LeagueBaselineCollection
 from services.player_evaluator_service import PlayerEvaluatorService
-from services.recommendation_engine import RecommendationEngine
+from services.recommendation_engine import RecommendationEngine, parse_expiry
+
+# Every metric used by a position benchmark, as columns of the squad table
+_BENCHMARK_METRICS = tuple(dict.fromkeys(
+    metric for metrics in POSITION_METRICS.values() for metric in metrics
+))
+_BENCHMARK_COLUMNS = {metric: i for i, metric in enumerate(_BENCHMARK_METRICS)}
+_read_benchmark_metrics = attrgetter(*_BENCHMARK_METRICS)
+_POSITIONS = tuple(PositionCategory)
+_POSITION_CODES = {position: code for code, position in enumerate(_POSITIONS)}
+_POSITION_COLUMNS = {
+    position: [_BENCHMARK_COLUMNS[metric] for metric in metrics]
+    for position, metrics in POSITION_METRICS.items()
+}
+
+# A position's benchmark metrics, a getter reading them all from a player,
+# and the squad average for each
+PositionProfile = Tuple[Tuple[str, ...], Callable[[Player], tuple], Tuple[float, ...]]
+
+# Display group for each metric tier, in output order; CRITICAL and any
+# unknown tier are listed under "Poor"
+METRIC_TIER_LABELS = {
+    'ELITE': "Elite",
+    'GOOD': "Good",
+    'AVERAGE': "Average",
+    'POOR': "Poor",
+}
+
+# PlayerAnalysis fields read for each CSV export row, in one call
+_read_csv_fields = attrgetter(
+    'player', 'value_score', 'league_value_score', 'league_wage_percentile',
+    'verdict', 'recommendation', 'top_metrics'
+)
+
+# Verdict for each role tier, looked up rather than built through the Enum call
+_TIER_TO_VERDICT = {verdict.value: verdict for verdict in PerformanceVerdict}
+
+
+@lru_cache(maxsize=None)
+def _metric_display_name(metric: str) -> str:
+    """Readable metric name, e.g. 'Key Passes/90' for 'key_passes_90'."""
+    name = METRIC_NAMES.get(metric)
+    return name if name is not None else metric.replace('_', ' ').title()
+
 
 # Position to roles mapping for Best XI selection
 POSITION_TO_ROLES = {
@@ -34,6 +81,29 @@ POSITION_TO_ROLES = {
 }
 
 
+# Formation catalog; suggestions are ranked by score, ties in this order
+FORMATIONS = (
+    {"name": "4-2-3-1 DM AM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 1, PositionCategory.W: 2, PositionCategory.ST: 1}},
+    {"name": "4-3-3 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
+    {"name": "4-3-2-1 DM AM Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.AM: 2, PositionCategory.ST: 1}},
+    {"name": "5-2-2-1 DM AM", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 2, PositionCategory.ST: 1}},
+    {"name": "5-2-3 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
+    {"name": "4-4-2", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 2}},
+    {"name": "4-2-4 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.W: 2, PositionCategory.ST: 2}},
+    {"name": "4-4-2 Diamond Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.AM: 1, PositionCategory.ST: 2}},
+    {"name": "4-2-2-2 DM AM Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 2, PositionCategory.ST: 2}},
+    {"name": "5-3-2 DM WB", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.ST: 2}},
+    {"name": "3-4-3", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
+)
+_FORMATIONS_BY_NAME = {formation['name']: formation for formation in FORMATIONS}
+
+# Players required per position (columns in PositionCategory order) for each formation
+_FORMATION_REQUIREMENTS = np.array([
+    [formation['positions'].get(pos, 0) for pos in PositionCategory]
+    for formation in FORMATIONS
+])
+
+
 class SquadAuditService:
     """Service for analyzing squad performance and value."""
 
@@ -48,19 +118,59 @@ class SquadAuditService:
         league_baselines: Optional[LeagueBaselineCollection] = None,
         game_date: Optional[date] = None
     ) -> SquadAnalysisResult:
-        """Perform complete squad analysis with optional league comparison."""
-        benchmarks = self._calculate_position_benchmarks(squad)
+        """
+        Perform complete squad analysis with optional league comparison.
+
+        Bayesian averages for every soft-floor player are applied in one
+        vectorized pass. Players are then prepared one by one (minutes
+        floors), and value scores for the whole squad are computed in a
+        single vectorized pass before each analysis is assembled.
+
+        Roles are expected to be evaluated already, as SquadAnalysisManager
+        does on the unadjusted stats. Callers that skip that step (scripts,
+        tests) get any players without roles evaluated here as one batch,
+        on the adjusted stats.
+
+        Args:
+            squad: Squad to analyze (players are modified in-place)
+            selected_division: Division for league comparison
+            league_baselines: League wage baselines
+            game_date: In-game date for contract calculations
+
+        Returns:
+            SquadAnalysisResult for the squad
+        """
+        # Categorize each player once for the benchmarks and Bayesian averages
+        positions = [self.player_evaluator.get_position_category(player) for player in squad.players]
+        benchmarks = self._calculate_position_benchmarks(squad, positions)
         squad_avg_wage = squad.get_average_wage()
+        self._apply_bayesian_averages(squad.players, positions, benchmarks)
+        # Only players the caller left unevaluated; they share one metrics matrix
+        unevaluated = [player for player in squad.players if not player.best_role]
+        if unevaluated:
+            self.player_evaluator.evaluate_squad(unevaluated)
+        # Contract checks fall back to today's date; resolve it once, not per player
+        contract_date = game_date if game_date else datetime.now().date()
+
+        performance_indices = [
+            self._prepare_player(player, apply_bayesian=False)
+            for player in squad.players
+        ]
+        value_scores = self._calculate_value_scores(
+            [0.0 if index is None else index for index in performance_indices],
+            [player.wage for player in squad.players],
+            squad_avg_wage
+        )
 
         player_analyses = []
-        for player in squad.players:
-            analysis = self._analyze_player(
+        for player, performance_index, value_score in zip(squad.players, performance_indices, value_scores):
+            analysis = self._build_player_analysis(
                 player,
-                benchmarks,
-                squad_avg_wage,
+                performance_index,
+                value_score,
                 selected_division=selected_division,
                 league_baselines=league_baselines,
-                game_date=game_date
+                game_date=contract_date
             )
             player_analyses.append(analysis)
 
@@ -77,7 +187,7 @@ class SquadAuditService:
     def _analyze_player(
         self,
         player: Player,
-        benchmarks: Dict[str, Dict[str, float]],
+        benchmarks: Dict[PositionCategory, Dict[str, float]],
         squad_avg_wage: float,
         position_override: Optional[PositionCategory] = None,
         selected_division: Optional[str] = None,
@@ -94,6 +204,41 @@ class SquadAuditService:
 
         Note: mins=None is treated as sufficient data for backward compatibility with legacy parsers.
         """
+        performance_index = self._prepare_player(player, self._position_profiles(benchmarks))
+        value_score = 0.0
+        if performance_index is not None:
+            value_score = self._calculate_value_score(performance_index, player.wage, squad_avg_wage)
+
+        return self._build_player_analysis(
+            player,
+            performance_index,
+            value_score,
+            position_override=position_override,
+            selected_division=selected_division,
+            league_baselines=league_baselines,
+            game_date=game_date
+        )
+
+    def _prepare_player(
+        self,
+        player: Player,
+        profiles: Optional[Dict[PositionCategory, Optional[PositionProfile]]] = None,
+        position: Optional[PositionCategory] = None,
+        apply_bayesian: bool = True
+    ) -> Optional[float]:
+        """
+        Apply the minutes thresholds and make sure the player's roles are evaluated.
+
+        Args:
+            player: Player to prepare (modified in-place)
+            profiles: Benchmark profiles from _position_profiles
+            position: Player's position category, if already known
+            apply_bayesian: Whether to apply the soft-floor Bayesian average
+                            (False when _apply_bayesian_averages already did)
+
+        Returns:
+            Performance index, or None below the 200-minute hard floor
+        """
         mins = player.mins  # Keep as None if not set
 
         # Store all possible positions for filtering (always set this)
@@ -105,7 +250,48 @@ class SquadAuditService:
             # Still need to evaluate roles to set best_role for display
             if not player.best_role:
                 self.player_evaluator.evaluate_roles(player)
+            return None
+
+        # SOFT FLOOR: 200-500 minutes - Apply Bayesian Average (only if mins is explicitly set)
+        if apply_bayesian and mins is not None and 200 <= mins < 500:
+            self._apply_bayesian_average(player, profiles, mins, position)
+
+        # Evaluate roles (uses adjusted stats if Bayesian Average was applied)
+        if not player.best_role:
+            self.player_evaluator.evaluate_roles(player)
+
+        return player.best_role.overall_score
+
+    def _build_player_analysis(
+        self,
+        player: Player,
+        performance_index: Optional[float],
+        value_score: float,
+        position_override: Optional[PositionCategory] = None,
+        selected_division: Optional[str] = None,
+        league_baselines: Optional[LeagueBaselineCollection] = None,
+        game_date: Optional[date] = None
+    ) -> PlayerAnalysis:
+        """
+        Assemble the analysis for a player prepared by _prepare_player.
+
+        Args:
+            player: Prepared player
+            performance_index: Index from _prepare_player (None = hard floor)
+            value_score: Squad-based value score
+            position_override: Position to use for league comparison
+            selected_division: Division for league comparison
+            league_baselines: League wage baselines
+            game_date: In-game date for contract calculations
+
+        Returns:
+            PlayerAnalysis for the player
+        """
+        mins = player.mins
+        # Categorized after any Bayesian adjustment, like later lookups would be
+        position = self.player_evaluator.get_position_category(player)
 
+        if performance_index is None:
             # No league value calculation for <200 mins players
             return PlayerAnalysis(
                 player=player,
@@ -123,23 +309,14 @@ class SquadAuditService:
                     has_contract_warning=False
                 ),
                 top_metrics=["N/A - Insufficient Data"],
-                contract_warning=self._check_contract_warning(player.expires, game_date)
+                contract_warning=self._check_contract_warning(player.expires, game_date),
+                position=position
             )
 
-        # SOFT FLOOR: 200-500 minutes - Apply Bayesian Average (only if mins is explicitly set)
-        if mins is not None and 200 <= mins < 500:
-            self._apply_bayesian_average(player, benchmarks, mins)
-
-        # Evaluate roles (uses adjusted stats if Bayesian Average was applied)
-        if not player.best_role:
-            self.player_evaluator.evaluate_roles(player)
-
-        performance_index = player.best_role.overall_score
-        value_score = self._calculate_value_score(performance_index, player.wage, squad_avg_wage)
-        verdict = PerformanceVerdict(player.best_role.tier)
+        verdict = _TIER_TO_VERDICT[player.best_role.tier]
 
         # Calculate league value score (if division selected)
-        player_position = position_override if position_override else self.player_evaluator.get_position_category(player)
+        player_position = position_override if position_override else position
         league_value_score, league_baseline, league_percentile = self._calculate_league_value_score(
             performance_index,
             player.wage,
@@ -166,10 +343,40 @@ class SquadAuditService:
             contract_warning=contract_warning,
             league_value_score=league_value_score,
             league_baseline=league_baseline,
-            league_wage_percentile=league_percentile
+            league_wage_percentile=league_percentile,
+            position=position
         )
 
-    def _apply_bayesian_average(self, player: Player, benchmarks: Dict[str, Dict[str, float]], mins: int):
+    def _position_profiles(
+        self,
+        benchmarks: Dict[PositionCategory, Dict[str, float]]
+    ) -> Dict[PositionCategory, Optional[PositionProfile]]:
+        """
+        Resolve each position's benchmark profile (None without benchmarks).
+
+        Built once per analysis so per-player steps index by the position
+        directly instead of re-reading the nested benchmark dicts, and read
+        a player's metrics with a single attrgetter call.
+        """
+        profiles = {}
+        for position in PositionCategory:
+            position_benchmarks = benchmarks.get(position)
+            if not position_benchmarks:
+                profiles[position] = None
+                continue
+            metrics = tuple(position_benchmarks)
+            profiles[position] = (
+                metrics, attrgetter(*metrics), tuple(position_benchmarks.values())
+            )
+        return profiles
+
+    def _apply_bayesian_average(
+        self,
+        player: Player,
+        profiles: Dict[PositionCategory, Optional[PositionProfile]],
+        mins: int,
+        position: Optional[PositionCategory] = None
+    ):
         """
         Apply Bayesian Average to pull player stats toward squad average.
 
@@ -183,47 +390,120 @@ class SquadAuditService:
 
         Args:
             player: Player to adjust (modified in-place)
-            benchmarks: Squad averages by position
+            profiles: Benchmark profiles by position
             mins: Minutes played (must be 200-500)
+            position: Player's position category, if already known
         """
         # Calculate player weight (0.0 at 200 mins → 1.0 at 500 mins)
         player_weight = (mins - 200) / 300.0
 
         # Get position benchmarks for this player's position
-        position = self.player_evaluator.get_position_category(player)
-        position_benchmarks = benchmarks.get(position.value, {})
+        if position is None:
+            position = self.player_evaluator.get_position_category(player)
+        profile = profiles[position]
 
-        if not position_benchmarks:
+        if profile is None:
             return  # No adjustment if no benchmarks available for this position
 
         # Apply weighted average to each metric in the position's benchmark
-        for metric_attr, squad_avg in position_benchmarks.items():
-            player_value = getattr(player, metric_attr, None)
-
+        metrics, read_metrics, averages = profile
+        for metric_attr, player_value, squad_avg in zip(metrics, read_metrics(player), averages):
             # Only adjust if player has a valid value for this metric
             if player_value is not None:
                 # Apply Bayesian weighted average
                 adjusted_value = (player_value * player_weight) + (squad_avg * (1 - player_weight))
                 setattr(player, metric_attr, adjusted_value)
 
-    def _calculate_position_benchmarks(self, squad: Squad) -> Dict[str, Dict[str, float]]:
-        """Calculate average metrics for each position."""
+    def _apply_bayesian_averages(
+        self,
+        players: List[Player],
+        positions: List[PositionCategory],
+        benchmarks: Dict[PositionCategory, Dict[str, float]]
+    ):
+        """
+        Vectorized _apply_bayesian_average for every soft-floor player.
+
+        The soft-floor players' benchmark metrics are read once into a
+        players x metrics array and blended with their positions' averages
+        in a single expression; only metrics the player has and their
+        position benchmarks are written back.
+
+        Args:
+            players: Players to adjust (modified in-place)
+            positions: Position category of each player, in the same order
+            benchmarks: Position benchmarks from _calculate_position_benchmarks
+        """
+        soft_floor = [
+            (player, position) for player, position in zip(players, positions)
+            if player.mins is not None and 200 <= player.mins < 500
+        ]
+        if not soft_floor:
+            return
+
+        # Squad average per (position, metric); NaN where a position has no benchmark
+        averages = np.full((len(_POSITIONS), len(_BENCHMARK_METRICS)), np.nan)
+        for position, position_benchmarks in benchmarks.items():
+            columns = [_BENCHMARK_COLUMNS[metric] for metric in position_benchmarks]
+            averages[_POSITION_CODES[position], columns] = list(position_benchmarks.values())
+
+        codes = np.array([_POSITION_CODES[position] for _, position in soft_floor])
+        stats = np.array([_read_benchmark_metrics(player) for player, _ in soft_floor], dtype=float)
+        averages = averages[codes]
+
+        # 0.0 at 200 mins -> 1.0 at 500 mins
+        weights = (np.array([player.mins for player, _ in soft_floor], dtype=float) - 200) / 300.0
+        adjusted = stats * weights[:, None] + averages * (1 - weights[:, None])
+        adjust = ~(np.isnan(stats) | np.isnan(averages))
+
+        for (player, _), row, row_adjust in zip(soft_floor, adjusted.tolist(), adjust):
+            for column in np.flatnonzero(row_adjust):
+                setattr(player, _BENCHMARK_METRICS[column], row[column])
+
+    def _calculate_position_benchmarks(
+        self,
+        squad: Squad,
+        positions: Optional[List[PositionCategory]] = None
+    ) -> Dict[PositionCategory, Dict[str, float]]:
+        """
+        Calculate average metrics for each position.
+
+        The squad's benchmark metrics are read once into a players x metrics
+        array (missing stats as NaN). A players x positions membership matrix
+        then gives every position's metric totals and value counts in one
+        product each, so averages ignore missing values.
+        """
         benchmarks = {}
+        if not squad.players:
+            return benchmarks
 
-        for position in PositionCategory:
-            # Group players by position using the evaluator
-            position_players = [p for p in squad.players if self.player_evaluator.get_position_category(p) == position]
+        # Categorize each player once rather than once per position
+        if positions is None:
+            positions = [self.player_evaluator.get_position_category(p) for p in squad.players]
+        codes = np.array([_POSITION_CODES[position] for position in positions])
+        membership = (codes[:, None] == np.arange(len(_POSITIONS))).astype(float)
+
+        table = np.array([_read_benchmark_metrics(p) for p in squad.players], dtype=float)
+        present = ~np.isnan(table)
+        table[~present] = 0.0
+
+        totals = membership.T @ table
+        counts = membership.T @ present
+        players_per_position = np.bincount(codes, minlength=len(_POSITIONS))
 
-            if not position_players:
+        for code, position in enumerate(_POSITIONS):
+            if not players_per_position[code]:
                 continue
 
             metrics = POSITION_METRICS.get(position, [])
-            position_benchmarks = {}
-            for metric in metrics:
-                values = [getattr(p, metric, 0.0) for p in position_players if getattr(p, metric, None) is not None]
-                position_benchmarks[metric] = sum(values) / len(values) if values else 0.0
+            columns = _POSITION_COLUMNS.get(position, [])
+            position_totals = totals[code, columns]
+            position_counts = counts[code, columns]
+            averages = np.divide(
+                position_totals, position_counts,
+                out=np.zeros(len(metrics)), where=position_counts > 0
+            )
 
-            benchmarks[position.value] = position_benchmarks
+            benchmarks[position] = dict(zip(metrics, averages.tolist()))
 
         return benchmarks
 
@@ -233,6 +513,31 @@ class SquadAuditService:
         wage_index = max(0.1, player_wage / squad_avg_wage)
         return performance_index / wage_index
 
+    def _calculate_value_scores(
+        self,
+        performance_indices: List[float],
+        player_wages: List[float],
+        squad_avg_wage: float
+    ) -> List[float]:
+        """
+        Vectorized _calculate_value_score for a whole squad.
+
+        Args:
+            performance_indices: Performance index per player
+            player_wages: Wage per player, in the same order
+            squad_avg_wage: Squad average wage
+
+        Returns:
+            Value score per player
+        """
+        if squad_avg_wage == 0.0:
+            return [100.0] * len(player_wages)
+
+        wages = np.array(player_wages, dtype=float)
+        wage_index = np.maximum(0.1, wages / squad_avg_wage)
+        scores = np.where(wages == 0.0, 100.0, np.array(performance_indices, dtype=float) / wage_index)
+        return scores.tolist()
+
     def _calculate_league_value_score(
         self,
         performance_index: float,
@@ -321,116 +626,91 @@ class SquadAuditService:
         Shows all PRIMARY and SECONDARY metrics evaluated, organized by tier.
         Includes metrics that are good/average/poor to give full picture.
         """
-        from models.constants import METRIC_NAMES
-
         if not metric_scores:
             return ["N/A - No metrics"]
 
-        # Group metrics by tier
-        elite_metrics = []
-        good_metrics = []
-        average_metrics = []
-        poor_metrics = []
+        # Group metrics by tier, in display order
+        groups = {label: [] for label in METRIC_TIER_LABELS.values()}
 
         for metric_name, metric_data in metric_scores.items():
             tier = metric_data.get('tier', 'UNKNOWN')
-            display_name = METRIC_NAMES.get(metric_name, metric_name.replace('_', ' ').title())
-
-            if tier == 'ELITE':
-                elite_metrics.append(display_name)
-            elif tier == 'GOOD':
-                good_metrics.append(display_name)
-            elif tier == 'AVERAGE':
-                average_metrics.append(display_name)
-            else:  # CRITICAL or POOR
-                poor_metrics.append(display_name)
+            groups[METRIC_TIER_LABELS.get(tier, "Poor")].append(_metric_display_name(metric_name))
 
         # Format output
-        result = []
         prefix = "Projected: " if projected else ""
-
-        if elite_metrics:
-            result.append(f"{prefix}Elite: {', '.join(elite_metrics)}")
-        if good_metrics:
-            result.append(f"{prefix}Good: {', '.join(good_metrics)}")
-        if average_metrics:
-            result.append(f"{prefix}Average: {', '.join(average_metrics)}")
-        if poor_metrics:
-            result.append(f"{prefix}Poor: {', '.join(poor_metrics)}")
+        result = [f"{prefix}{label}: {', '.join(names)}" for label, names in groups.items() if names]
 
         return result if result else ["N/A"]
 
     def _check_contract_warning(self, expires: str, game_date: Optional[date] = None) -> bool:
         if not expires or expires == "-": return False
-        try:
-            expiry_date = datetime.strptime(expires, "%d/%m/%Y").date()
-            today = game_date if game_date else datetime.now().date()
-            months_remaining = (expiry_date.year - today.year) * 12 + (expiry_date.month - today.month)
-            return months_remaining <= 12
-        except: return False
+        # Cached per expiry string; squads share a handful of dates
+        expiry_date = parse_expiry(expires)
+        if expiry_date is None: return False
+        today = game_date if game_date else datetime.now().date()
+        months_remaining = (expiry_date.year - today.year) * 12 + (expiry_date.month - today.month)
+        return months_remaining <= 12
 
     def export_to_csv_data(self, result: SquadAnalysisResult) -> List[Dict[str, str]]:
-        csv_data = []
+        return list(self.iter_csv_rows(result))
+
+    def iter_csv_rows(self, result: SquadAnalysisResult) -> Iterator[Dict[str, str]]:
+        """Yield one formatted CSV row per analyzed player, for streaming into a writer."""
         for analysis in result.player_analyses:
-            row = {
-                "Name": analysis.player.name,
-                "Position": self.player_evaluator.get_position_category(analysis.player).value,
-                "Age": str(analysis.player.age),
-                "Value Score": f"{analysis.value_score:.1f}",
-                "League Value Score": f"{analysis.league_value_score:.1f}" if analysis.league_value_score else "N/A",
-                "League Wage Percentile": f"{analysis.league_wage_percentile:.0f}th" if analysis.league_wage_percentile else "N/A",
+            (player, value_score, league_value_score, league_wage_percentile,
+             verdict, recommendation, top_metrics) = _read_csv_fields(analysis)
+            yield {
+                "Name": player.name,
+                "Position": analysis.position.value,
+                "Age": str(player.age),
+                "Value Score": f"{value_score:.1f}",
+                "League Value Score": f"{league_value_score:.1f}" if league_value_score else "N/A",
+                "League Wage Percentile": f"{league_wage_percentile:.0f}th" if league_wage_percentile else "N/A",
                 "Value Insight": analysis.get_value_comparison_indicator() or "",
-                "Performance": analysis.verdict.value,
-                "Status": analysis.player.inf or "-",
-                "Recommendation": f"{analysis.recommendation.badge} - {analysis.recommendation.explanation}",
-                "Contract Expires": analysis.player.expires,
-                "Wage": analysis.player.get_wage_formatted(),
-                "Top Metric 1": analysis.top_metrics[0] if len(analysis.top_metrics) > 0 else "-",
-                "Top Metric 2": analysis.top_metrics[1] if len(analysis.top_metrics) > 1 else "-"
+                "Performance": verdict.value,
+                "Status": player.inf or "-",
+                "Recommendation": f"{recommendation.badge} - {recommendation.explanation}",
+                "Contract Expires": player.expires,
+                "Wage": player.get_wage_formatted(),
+                "Top Metric 1": top_metrics[0] if len(top_metrics) > 0 else "-",
+                "Top Metric 2": top_metrics[1] if len(top_metrics) > 1 else "-"
             }
-            csv_data.append(row)
-        return csv_data
 
     def suggest_formations(self, result: SquadAnalysisResult, top_n: int = 3) -> List[Dict]:
-        FORMATIONS = [
-            {"name": "4-2-3-1 DM AM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 1, PositionCategory.W: 2, PositionCategory.ST: 1}},
-            {"name": "4-3-3 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
-            {"name": "4-3-2-1 DM AM Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.AM: 2, PositionCategory.ST: 1}},
-            {"name": "5-2-2-1 DM AM", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 2, PositionCategory.ST: 1}},
-            {"name": "5-2-3 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
-            {"name": "4-4-2", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 2}},
-            {"name": "4-2-4 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.W: 2, PositionCategory.ST: 2}},
-            {"name": "4-4-2 Diamond Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.AM: 1, PositionCategory.ST: 2}},
-            {"name": "4-2-2-2 DM AM Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 2, PositionCategory.ST: 2}},
-            {"name": "5-3-2 DM WB", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.ST: 2}},
-            {"name": "3-4-3", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}}
-        ]
-
-        # Build position quality considering all positions each player can play
-        position_quality = {}
-        for pos in PositionCategory:
-            # Get all players who CAN play this position (not just those whose best position is this)
-            analyses = [a for a in result.player_analyses
-                       if pos in self.player_evaluator.get_all_possible_positions(a.player)]
-            elite_count = len([a for a in analyses if a.verdict == PerformanceVerdict.ELITE])
-            good_count = len([a for a in analyses if a.verdict == PerformanceVerdict.GOOD])
-            position_quality[pos] = {'elite': elite_count, 'good': good_count, 'total': len(analyses)}
+        # Build position quality considering all positions each player can play,
+        # counting every player once for each position they CAN play (not just
+        # their best position) in a single pass over the squad
+        position_quality = {pos: {'elite': 0, 'good': 0, 'total': 0} for pos in PositionCategory}
+        for a in result.player_analyses:
+            for pos in self.player_evaluator.get_all_possible_positions(a.player):
+                quality = position_quality[pos]
+                quality['total'] += 1
+                if a.verdict == PerformanceVerdict.ELITE:
+                    quality['elite'] += 1
+                elif a.verdict == PerformanceVerdict.GOOD:
+                    quality['good'] += 1
+
+        # Score every formation at once against the formations x positions
+        # requirements, filled with elite players first, then good, then others
+        requirements = _FORMATION_REQUIREMENTS
+        elite, good, total = np.array([
+            [quality['elite'], quality['good'], quality['total']]
+            for quality in position_quality.values()
+        ]).T
+        can_fill = (requirements <= total).all(axis=1)
+        elite_filled = np.minimum(requirements, elite)
+        good_filled = np.minimum(requirements - elite_filled, good)
+        others_filled = requirements - elite_filled - good_filled
+        # Star Power Weighting: 10/4/1 (prioritizes formations that maximize elite players)
+        scores = (elite_filled * 10 + good_filled * 4 + others_filled).sum(axis=1)
 
         scored_formations = []
-        for formation in FORMATIONS:
-            score = 0
-            can_fill = True
+        for formation, fits, score in zip(FORMATIONS, can_fill.tolist(), scores.tolist()):
+            if not fits:
+                continue
             position_breakdown = []
             for pos, required in formation['positions'].items():
-                quality = position_quality.get(pos, {'elite': 0, 'good': 0, 'total': 0})
-                if quality['total'] < required:
-                    can_fill = False
-                    break
-                elite_filled = min(quality['elite'], required)
-                good_filled = min(quality['good'], max(0, required - elite_filled))
-                others_filled = max(0, required - elite_filled - good_filled)
-                # Star Power Weighting: 10/4/1 (prioritizes formations that maximize elite players)
-                score += (elite_filled * 10) + (good_filled * 4) + (others_filled * 1)
+                quality = position_quality[pos]
                 # Calculate recruitment needed (elite + good players needed)
                 quality_players_available = quality['elite'] + quality['good']
                 recruitment_needed = max(0, required - quality_players_available)
@@ -442,19 +722,17 @@ class SquadAuditService:
                     'total_available': quality['total'],
                     'recruitment_needed': recruitment_needed
                 })
-            if can_fill:
-                # Calculate total recruitment needed for this formation
-                total_recruitment = sum(pos['recruitment_needed'] for pos in position_breakdown)
-                scored_formations.append({
-                    'name': formation['name'],
-                    'score': score,
-                    'breakdown': position_breakdown,
-                    'total_recruitment_needed': total_recruitment
-                })
-
-        # Sort by score (highest first) - Star Power Weighting prioritizes elite players
-        scored_formations.sort(key=lambda x: x['score'], reverse=True)
-        return scored_formations[:top_n]
+            # Calculate total recruitment needed for this formation
+            total_recruitment = sum(pos['recruitment_needed'] for pos in position_breakdown)
+            scored_formations.append({
+                'name': formation['name'],
+                'score': score,
+                'breakdown': position_breakdown,
+                'total_recruitment_needed': total_recruitment
+            })
+
+        # Top scores first (ties keep catalog order) - Star Power Weighting prioritizes elite players
+        return heapq.nlargest(top_n, scored_formations, key=itemgetter('score'))
 
     def _get_position_score(self, player_analysis: PlayerAnalysis,
                             target_position: PositionCategory) -> Tuple[float, str]:
@@ -493,14 +771,16 @@ class SquadAuditService:
             PerformanceVerdict.POOR: False
         }
 
-        position_viability = {}
-        for position in positions.keys():
-            viable_count = len([
-                a for a in result.player_analyses
-                if (position in self.player_evaluator.get_all_possible_positions(a.player)
-                    and VIABILITY_THRESHOLD.get(a.verdict, False))
-            ])
-            position_viability[position] = viable_count
+        # One pass over the squad: each player's playable positions, and the
+        # number of viable players per formation position
+        playable = {}
+        position_viability = dict.fromkeys(positions, 0)
+        for a in result.player_analyses:
+            player_positions = frozenset(self.player_evaluator.get_all_possible_positions(a.player))
+            playable[id(a)] = player_positions
+            if VIABILITY_THRESHOLD.get(a.verdict, False):
+                for position in player_positions.intersection(positions):
+                    position_viability[position] += 1
 
         # PASS 1: Identify and fill critical positions (viable_count <= slots_needed)
         critical_positions = [
@@ -512,7 +792,7 @@ class SquadAuditService:
             starting_xi[position] = []
             candidates = [
                 a for a in result.player_analyses
-                if position in self.player_evaluator.get_all_possible_positions(a.player)
+                if position in playable[id(a)]
                 and a.player.name not in used_players
             ]
 
@@ -539,7 +819,7 @@ class SquadAuditService:
             starting_xi[position] = []
             candidates = [
                 a for a in result.player_analyses
-                if position in self.player_evaluator.get_all_possible_positions(a.player)
+                if position in playable[id(a)]
                 and a.player.name not in used_players
             ]
 
@@ -549,13 +829,12 @@ class SquadAuditService:
                 base_score, role = self._get_position_score(candidate, position)
 
                 # Count how many OTHER positions this player can viably fill
-                other_positions = [
-                    p for p in positions.keys()
+                versatility_count = sum(
+                    1 for p in positions.keys()
                     if p != position
-                    and p in self.player_evaluator.get_all_possible_positions(candidate.player)
+                    and p in playable[id(candidate)]
                     and position_viability.get(p, 0) > 0  # Only count positions that still need filling
-                ]
-                versatility_count = len(other_positions)
+                )
 
                 # Apply penalty: -5% per additional position they can fill
                 versatility_penalty = 1.0 - (0.05 * versatility_count)
@@ -633,7 +912,7 @@ class SquadAuditService:
         pos_score = scored_candidate[1]
         role = scored_candidate[2] if len(scored_candidate) > 2 else None
 
-        is_natural = self.player_evaluator.get_position_category(candidate.player) == position
+        is_natural = candidate.position == position
         return PlayerAssignment(
             player_analysis=candidate,
             assigned_position=position,
@@ -660,7 +939,7 @@ class SquadAuditService:
         ), reverse=True)
 
         def create_assignment(analysis):
-            pos = self.player_evaluator.get_position_category(analysis.player)
+            pos = analysis.position
             role = analysis.player.best_role.role if analysis.player.best_role else pos.value
             score = analysis.player.best_role.overall_score if analysis.player.best_role else 0
             return PlayerAssignment(
@@ -701,7 +980,7 @@ class SquadAuditService:
             group_positions = POSITION_GROUPS[group]
             group_candidates = [
                 a for a in remaining
-                if self.player_evaluator.get_position_category(a.player) in group_positions
+                if a.position in group_positions
                 and a.player.name not in used_in_bench
             ]
 
@@ -732,28 +1011,11 @@ class SquadAuditService:
     def suggest_formations_with_xi(self, result: SquadAnalysisResult,
                                    top_n: int = 3) -> List[Dict]:
         """Get formation suggestions with best XI for each."""
-        FORMATIONS = [
-            {"name": "4-2-3-1 DM AM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 1, PositionCategory.W: 2, PositionCategory.ST: 1}},
-            {"name": "4-3-3 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
-            {"name": "4-3-2-1 DM AM Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.AM: 2, PositionCategory.ST: 1}},
-            {"name": "5-2-2-1 DM AM", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 2, PositionCategory.ST: 1}},
-            {"name": "5-2-3 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}},
-            {"name": "4-4-2", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 2}},
-            {"name": "4-2-4 DM Wide", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.W: 2, PositionCategory.ST: 2}},
-            {"name": "4-4-2 Diamond Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.AM: 1, PositionCategory.ST: 2}},
-            {"name": "4-2-2-2 DM AM Narrow", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.FB: 2, PositionCategory.DM: 2, PositionCategory.AM: 2, PositionCategory.ST: 2}},
-            {"name": "5-3-2 DM WB", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.DM: 1, PositionCategory.CM: 2, PositionCategory.ST: 2}},
-            {"name": "3-4-3", "positions": {PositionCategory.GK: 1, PositionCategory.CB: 3, PositionCategory.FB: 2, PositionCategory.CM: 2, PositionCategory.W: 2, PositionCategory.ST: 1}}
-        ]
-
         formations = self.suggest_formations(result, top_n)
 
         for formation_result in formations:
             # Find matching formation definition
-            formation_def = next(
-                (f for f in FORMATIONS if f['name'] == formation_result['name']),
-                None
-            )
+            formation_def = _FORMATIONS_BY_NAME.get(formation_result['name'])
             if formation_def:
                 formation_result['best_xi'] = self.generate_best_xi(formation_def, result)
 
@@ -8,12 +8,45 @@ Implements Standardized Unexpected Earnings (SUE) methodology:
 - Global and sector-specific decile ranking
 """
 import statistics
+from bisect import bisect_right
+from functools import lru_cache
 from typing import List, Dict, Tuple, Optional
 from datetime import date
+import numpy as np
+from sqlalchemy.orm.attributes import set_committed_value
 from models.financial import EarningsReport, SUECalculation, Stock, SectorStatistics
 from extensions import db
 
 
+@lru_cache(maxsize=1024)
+def _prior_year_period(reporting_period: str) -> Optional[str]:
+    """Shift a 'XX-YY' period label back one year ('H1-24' -> 'H1-23'); cached per label."""
+    try:
+        # Split period into components
+        parts = reporting_period.split('-')
+        if len(parts) != 2:
+            return None
+
+        period_label = parts[0]  # e.g., 'H1', 'Q2', 'FY'
+        year_suffix = parts[1]  # e.g., '24', '23'
+
+        # Convert year suffix to integer and decrement
+        year_int = int(year_suffix)
+        prior_year = year_int - 1
+
+        # Handle century rollover (00 → 99)
+        if prior_year < 0:
+            prior_year = 99
+
+        # Format back to 2-digit year
+        prior_year_str = f"{prior_year:02d}"
+
+        return f"{period_label}-{prior_year_str}"
+
+    except (ValueError, IndexError):
+        return None
+
+
 class SUECalculationService:
     """
     SUE calculation engine.
@@ -172,6 +205,12 @@ class SUECalculationService:
 
         forecast_errors = []
 
+        # Index report positions by period so each prior-year lookup is a
+        # bisect instead of a scan over the remaining history
+        period_positions = {}
+        for idx, report in enumerate(historical_reports):
+            period_positions.setdefault(report.reporting_period, []).append(idx)
+
         # Calculate forecast errors for each historical period
         for i, current in enumerate(historical_reports[:-1]):  # Exclude last (oldest) report
             # Find matching period from previous year
@@ -183,13 +222,15 @@ class SUECalculationService:
             if target_period is None:
                 continue
 
-            # Search for matching prior report
-            for prior in historical_reports[i+1:]:
-                if prior.reporting_period == target_period:
-                    # Forecast error = Actual - Expected (same period last year)
-                    error = current.actual_eps - prior.actual_eps
-                    forecast_errors.append(error)
-                    break
+            # Nearest matching prior report after position i
+            positions = period_positions.get(target_period)
+            if not positions:
+                continue
+            match = bisect_right(positions, i)
+            if match < len(positions):
+                # Forecast error = Actual - Expected (same period last year)
+                prior = historical_reports[positions[match]]
+                forecast_errors.append(current.actual_eps - prior.actual_eps)
 
         # Need at least 2 data points for standard deviation
         if len(forecast_errors) < 2:
@@ -223,30 +264,7 @@ class SUECalculationService:
         Returns:
             Corresponding period from last year (None if format invalid)
         """
-        try:
-            # Split period into components
-            parts = reporting_period.split('-')
-            if len(parts) != 2:
-                return None
-
-            period_label = parts[0]  # e.g., 'H1', 'Q2', 'FY'
-            year_suffix = parts[1]  # e.g., '24', '23'
-
-            # Convert year suffix to integer and decrement
-            year_int = int(year_suffix)
-            prior_year = year_int - 1
-
-            # Handle century rollover (00 → 99)
-            if prior_year < 0:
-                prior_year = 99
-
-            # Format back to 2-digit year
-            prior_year_str = f"{prior_year:02d}"
-
-            return f"{period_label}-{prior_year_str}"
-
-        except (ValueError, IndexError):
-            return None
+        return _prior_year_period(reporting_period)
 
     @classmethod
     def assign_decile_ranks(
@@ -274,16 +292,10 @@ class SUECalculationService:
         if not valid_calcs:
             return
 
-        # Sort by SUE score (ascending)
-        sorted_calcs = sorted(valid_calcs, key=lambda x: x.sue_score)
-
-        # Assign global deciles (1-10)
-        total_count = len(sorted_calcs)
-        for idx, calc in enumerate(sorted_calcs):
-            # Calculate decile (1-indexed)
-            # Use ceiling division to ensure values 1-10
-            decile = min(10, max(1, int((idx + 1) / total_count * 10) + 1))
-            calc.global_decile = decile
+        # Assign global deciles (1-10) from the ascending SUE rank
+        global_deciles = cls._decile_ranks([calc.sue_score for calc in valid_calcs])
+        for calc, decile in zip(valid_calcs, global_deciles):
+            set_committed_value(calc, 'global_decile', decile)
 
         # Assign sector-specific deciles if requested
         if use_sector_adjusted:
@@ -292,6 +304,38 @@ class SUECalculationService:
         # Apply Bayesian shrinkage to small sample stocks
         cls._apply_bayesian_shrinkage_batch(sue_calculations, batch_id)
 
+        # Ranks and shrunk scores were set as committed state above, so write
+        # them back in one executemany instead of a per-object UPDATE at flush
+        db.session.bulk_update_mappings(SUECalculation, [
+            {
+                'id': calc.id,
+                'global_decile': calc.global_decile,
+                'sector_decile': calc.sector_decile,
+                'sue_score': calc.sue_score
+            }
+            for calc in valid_calcs
+        ])
+
+    @staticmethod
+    def _decile_ranks(sue_scores: List[float]) -> List[int]:
+        """
+        Convert scores to deciles 1-10 by ascending rank.
+
+        Rank r (1-based) of n maps to min(10, int(r / n * 10) + 1); equal
+        scores keep their input order, as with a stable sort.
+
+        Args:
+            sue_scores: SUE scores to rank
+
+        Returns:
+            Decile for each score, aligned with sue_scores
+        """
+        count = len(sue_scores)
+        order = np.argsort(np.asarray(sue_scores, dtype=np.float64), kind='stable')
+        deciles = np.empty(count, dtype=np.int64)
+        deciles[order] = np.clip((np.arange(1, count + 1) / count * 10).astype(np.int64) + 1, 1, 10)
+        return deciles.tolist()
+
     @classmethod
     def _assign_sector_deciles(
         cls,
@@ -308,14 +352,14 @@ class SUECalculationService:
             batch_id: Upload batch ID
         """
         # Group calculations by sector
+        stock_sectors = cls._get_stock_sectors(sue_calculations)
         sector_groups = {}
         for calc in sue_calculations:
-            # Get stock to access sector
-            stock = Stock.query.get(calc.stock_id)
-            if not stock or not stock.sector:
+            # Get stock sector
+            sector = stock_sectors.get(calc.stock_id)
+            if not sector:
                 continue
 
-            sector = stock.sector
             if sector not in sector_groups:
                 sector_groups[sector] = []
             sector_groups[sector].append(calc)
@@ -325,18 +369,40 @@ class SUECalculationService:
             if not calcs:
                 continue
 
-            # Sort by SUE score within sector
-            sorted_sector_calcs = sorted(calcs, key=lambda x: x.sue_score)
-            sector_count = len(sorted_sector_calcs)
-
-            for idx, calc in enumerate(sorted_sector_calcs):
-                # Calculate sector-specific decile
-                sector_decile = min(10, max(1, int((idx + 1) / sector_count * 10) + 1))
-                calc.sector_decile = sector_decile
+            # Rank by SUE score within sector
+            sector_deciles = cls._decile_ranks([calc.sue_score for calc in calcs])
+            for calc, sector_decile in zip(calcs, sector_deciles):
+                set_committed_value(calc, 'sector_decile', sector_decile)
 
             # Calculate sector statistics for Bayesian shrinkage
             cls._calculate_sector_statistics(sector, calcs, batch_id)
 
+    @classmethod
+    def _get_stock_sectors(
+        cls,
+        sue_calculations: List[SUECalculation]
+    ) -> Dict[int, Optional[str]]:
+        """
+        Look up the sector of every stock referenced by the calculations.
+
+        One query for the whole batch; many calculations share a stock.
+
+        Args:
+            sue_calculations: SUE calculations to resolve sectors for
+
+        Returns:
+            Dict mapping stock ID to sector (None if not set)
+        """
+        stock_ids = {calc.stock_id for calc in sue_calculations}
+        if not stock_ids:
+            return {}
+
+        return dict(
+            db.session.query(Stock.id, Stock.sector)
+            .filter(Stock.id.in_(stock_ids))
+            .all()
+        )
+
     @classmethod
     def _calculate_sector_statistics(
         cls,
@@ -410,17 +476,20 @@ class SUECalculationService:
             sector_stats_map[stats.sector] = stats
 
         # Apply shrinkage to small sample stocks
+        stock_sectors = cls._get_stock_sectors(
+            [calc for calc in sue_calculations if calc.small_sample_corrected]
+        )
         for calc in sue_calculations:
             if not calc.small_sample_corrected:
                 continue
 
             # Get stock sector
-            stock = Stock.query.get(calc.stock_id)
-            if not stock or not stock.sector:
+            sector = stock_sectors.get(calc.stock_id)
+            if not sector:
                 continue
 
             # Get sector statistics
-            stats = sector_stats_map.get(stock.sector)
+            stats = sector_stats_map.get(sector)
             if not stats:
                 continue
 
@@ -430,4 +499,4 @@ class SUECalculationService:
                     cls.BAYESIAN_WEIGHT_RAW * calc.sue_score +
                     cls.BAYESIAN_WEIGHT_SECTOR * stats.sue_mean
                 )
-                calc.sue_score = adjusted_sue
+                set_committed_value(calc, 'sue_score', adjusted_sue)
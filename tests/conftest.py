@@ -18,19 +18,24 @@ def test_config():
 
 
 @pytest.fixture
-def app(test_config):
+def app(test_config, tmp_path):
     """
     Create and configure a Flask application instance for testing.
 
     Uses the application factory pattern to create a clean instance
-    for each test function.
+    for each test function. Squad uploads go to a per-test temporary
+    directory rather than the repo's instance folder.
     """
     # Set test environment variables
     os.environ['FLASK_ENV'] = 'testing'
     os.environ['SECRET_KEY'] = 'test-secret-key-for-pytest'
 
     from app import create_app
-    app = create_app(test_config)
+
+    class IsolatedConfig(test_config):
+        SQUAD_UPLOAD_DIR = str(tmp_path / 'squad_audit_uploads')
+
+    app = create_app(IsolatedConfig)
 
     # Push application context
     ctx = app.app_context()
@@ -2,6 +2,7 @@
 Integration tests for league comparison functionality.
 """
 
+import os
 import pytest
 from flask import session
 from services.squad_analysis_manager import SquadAnalysisManager
@@ -163,6 +164,140 @@ class TestLeagueComparisonWorkflow:
                 assert retrieved_result is not None
                 assert retrieved_result.selected_division == "English Premier Division"
 
+    def test_session_loads_cached_analysis(self, app, sample_squad_html, monkeypatch):
+        """Test that the analysis cached at upload is loaded without re-parsing."""
+        with app.test_request_context():
+            manager = SquadAnalysisManager()
+
+            analysis_result, errors = manager.process_squad_upload(sample_squad_html)
+
+            def fail_parse(html_content):
+                raise AssertionError("squad should not be re-parsed")
+
+            monkeypatch.setattr(manager.parser_factory, 'get_parser', fail_parse)
+            retrieved_result = manager.get_analysis_from_session()
+
+            assert retrieved_result is not analysis_result
+            assert len(retrieved_result.player_analyses) == len(analysis_result.player_analyses)
+            assert [a.player.name for a in retrieved_result.player_analyses] == \
+                [a.player.name for a in analysis_result.player_analyses]
+
+    def test_session_reanalysis_refills_cache(self, app, sample_squad_html, monkeypatch):
+        """Test that a re-analysis is cached, so the next request skips re-parsing."""
+        import os
+        from services.squad_analysis_manager import _upload_path
+
+        with app.test_request_context():
+            manager = SquadAnalysisManager()
+            manager._persist_to_session(sample_squad_html)
+            cache_path = _upload_path(f"{session['squad_analysis_id']}.pkl")
+            assert not os.path.exists(cache_path)
+
+            first = manager.get_analysis_from_session()
+            assert os.path.exists(cache_path)
+
+            def fail_parse(html_content):
+                raise AssertionError("squad should not be re-parsed")
+
+            monkeypatch.setattr(manager.parser_factory, 'get_parser', fail_parse)
+            second = manager.get_analysis_from_session()
+
+            assert [a.player.name for a in second.player_analyses] == \
+                [a.player.name for a in first.player_analyses]
+
+    def test_session_ignores_truncated_cache(self, app, sample_squad_html):
+        """Test that a corrupt cached result is a cache miss, not an error."""
+        import os
+        from services.squad_analysis_manager import _upload_path
+
+        with app.test_request_context():
+            manager = SquadAnalysisManager()
+            analysis_result, errors = manager.process_squad_upload(sample_squad_html)
+            cache_path = _upload_path(f"{session['squad_analysis_id']}.pkl")
+
+            with open(cache_path, 'rb') as f:
+                data = f.read()
+            with open(cache_path, 'wb') as f:
+                f.write(data[:len(data) // 2])
+
+            assert manager._get_cached_analysis() is None
+            retrieved_result = manager.get_analysis_from_session()
+            assert [a.player.name for a in retrieved_result.player_analyses] == \
+                [a.player.name for a in analysis_result.player_analyses]
+
+    def test_session_cache_skipped_in_shared_directory(self, app, sample_squad_html):
+        """Test that pickles are neither written nor read unless the upload dir is private."""
+        import os
+        from services.squad_analysis_manager import _upload_path
+
+        with app.test_request_context():
+            manager = SquadAnalysisManager()
+            manager.process_squad_upload(sample_squad_html)
+            cache_path = _upload_path(f"{session['squad_analysis_id']}.pkl")
+            assert manager._get_cached_analysis() is not None
+
+            app.config['SQUAD_ANALYSIS_CACHE'] = False
+            assert manager._get_cached_analysis() is None
+
+            os.remove(cache_path)
+            manager.get_analysis_from_session()
+            assert not os.path.exists(cache_path)
+
+    def test_session_html_gzipped_with_legacy_fallback(self, app, sample_squad_html):
+        """Test that stored HTML round-trips through gzip and old .html files still load."""
+        import os
+        from services.squad_analysis_manager import _upload_path
+
+        with app.test_request_context():
+            manager = SquadAnalysisManager()
+            manager._persist_to_session(sample_squad_html.encode('utf-8'))
+            analysis_id = session['squad_analysis_id']
+            gz_path = _upload_path(f"{analysis_id}.html.gz")
+
+            assert manager._get_from_session() == sample_squad_html
+
+            # Uploads stored before compression was added
+            os.remove(gz_path)
+            with open(gz_path[:-3], 'w', encoding='utf-8') as f:
+                f.write(sample_squad_html)
+
+            assert manager._get_from_session() == sample_squad_html
+            os.remove(gz_path[:-3])
+
+    def test_upload_prunes_expired_files(self, app, sample_squad_html):
+        """Test that a new upload deletes files older than the session lifetime."""
+        import os
+        import time
+        from services.squad_analysis_manager import _upload_path
+
+        expired, recent = _upload_path('expired.html.gz'), _upload_path('recent.pkl')
+        for path in (expired, recent):
+            with open(path, 'wb') as f:
+                f.write(b'x')
+        stale = time.time() - app.permanent_session_lifetime.total_seconds() - 60
+        os.utime(expired, (stale, stale))
+
+        with app.test_request_context():
+            SquadAnalysisManager()._persist_to_session(sample_squad_html)
+            assert os.path.exists(_upload_path(f"{session['squad_analysis_id']}.html.gz"))
+
+        assert not os.path.exists(expired)
+        assert os.path.exists(recent)
+
+    @pytest.mark.skipif(not hasattr(os, 'getuid'), reason="POSIX permissions only")
+    def test_shared_upload_dir_disables_cache(self, test_config, tmp_path):
+        """Test that startup turns pickle caching off for a group/world-accessible dir."""
+        from app import create_app
+
+        upload_dir = tmp_path / 'shared'
+        upload_dir.mkdir()
+        upload_dir.chmod(0o777)
+
+        class SharedUploadConfig(test_config):
+            SQUAD_UPLOAD_DIR = str(upload_dir)
+
+        assert create_app(SharedUploadConfig).config['SQUAD_ANALYSIS_CACHE'] is False
+
 
 class TestRouteIntegration:
     """Test route-level integration."""
@@ -171,9 +306,8 @@ class TestRouteIntegration:
         """Test POST to squad audit tracker with division selection."""
         from io import BytesIO
 
-        # Mock league_baselines in app module
-        from app import create_app
-        app = create_app()
+        # Mock league_baselines on the test app
+        app = client.application
         app.league_baselines = sample_league_baselines
 
         with app.test_client() as client:
@@ -6,6 +6,8 @@ Tests the parsing of Football Manager HTML squad exports.
 
 import pytest
 from services.fm_parser import FMHTMLParser, FMParserError
+from services.fm_parser_v2 import FMHTMLParserV2
+from services.parser_factory import ParserFactory
 from models import Squad
 
 
@@ -356,3 +358,31 @@ class TestFMParserIntegration:
             assert analysis.value_score > 0
             assert analysis.recommendation is not None
             assert len(analysis.recommendation.badge) > 0
+
+
+class TestParserFactory:
+    """Test format detection in ParserFactory."""
+
+    def _table(self, column_count):
+        headers = ''.join(f'<th>Col {i}</th>' for i in range(column_count))
+        return f'<html><head><style>td,th {{ padding: 2px; }}</style></head><body><table><tr>{headers}</tr></table></body></html>'
+
+    def test_32_columns_selects_v2_parser(self):
+        """Test 32 header cells select the new-format parser."""
+        assert isinstance(ParserFactory.get_parser(self._table(32)), FMHTMLParserV2)
+
+    def test_other_column_counts_select_legacy_parser(self):
+        """Test other header counts fall back to the legacy parser."""
+        assert isinstance(ParserFactory.get_parser(self._table(24)), FMHTMLParser)
+
+    def test_fixture_files_detected(self):
+        """Test real exports are routed to the expected parser."""
+        with open('tests/fixtures/Go Ahead - New Format.html', 'r', encoding='utf-8') as f:
+            assert isinstance(ParserFactory.get_parser(f.read()), FMHTMLParserV2)
+        with open('tests/fixtures/Test File 3.html', 'r', encoding='utf-8') as f:
+            assert isinstance(ParserFactory.get_parser(f.read()), FMHTMLParser)
+
+    def test_missing_table_raises(self):
+        """Test HTML without a table raises ValueError."""
+        with pytest.raises(ValueError):
+            ParserFactory.get_parser("<html><body><p>No table</p></body></html>")
@@ -100,6 +100,18 @@ class TestPositionMapping:
         generator = LeagueBaselineGenerator()
         assert generator._map_position_to_category("ST (C)") == PositionCategory.ST
 
+    def test_map_multi_position_string(self):
+        """Test strings outside the lookup table fall back to substring rules."""
+        generator = LeagueBaselineGenerator()
+        assert generator._map_position_to_category("AM (RL), ST (C)") == PositionCategory.AM
+        assert generator._map_position_to_category("d (c), dm") == PositionCategory.CB
+
+    def test_map_rule_priority_not_string_order(self):
+        """Test earlier rules win regardless of where the token appears."""
+        generator = LeagueBaselineGenerator()
+        assert generator._map_position_to_category("ST (C), AM (RL)") == PositionCategory.AM
+        assert generator._map_position_to_category("DM, D (C)") == PositionCategory.CB
+
     def test_map_invalid_position(self):
         """Test invalid position returns None."""
         generator = LeagueBaselineGenerator()
@@ -111,6 +123,93 @@ class TestPositionMapping:
         assert generator._map_position_to_category("") is None
 
 
+class TestWageExportParsing:
+    """Test extracting player rows from a wage export table."""
+
+    HTML = """
+    <table>
+      <tr><th>Inf</th><th>Name</th><th>Position</th><th>Wage</th><th>Personality</th><th>Division</th><th>Expires</th></tr>
+      <tr><td></td><td>Keeper One</td><td>GK</td><td>£12,000 p/w</td><td>Driven</td><td>English Premier Division</td><td>30/6/2027</td></tr>
+      <tr><td></td><td>Striker Two</td><td>ST (C)</td><td>£45,500 p/w</td><td>Balanced</td><td>English Premier Division</td><td>30/6/2026</td></tr>
+      <tr><td></td><td>No Wage</td><td>D (C)</td><td>-</td><td>Balanced</td><td>Italian Serie A</td><td>-</td></tr>
+      <tr><td></td><td>Odd Position</td><td>INVALID</td><td>£1,000 p/w</td><td>Balanced</td><td>Italian Serie A</td><td>-</td></tr>
+      <tr><td></td><td>Short Row</td><td>M (C)</td></tr>
+    </table>
+    """
+
+    def test_parse_valid_rows(self):
+        """Test rows with wage, mappable position and division are kept."""
+        generator = LeagueBaselineGenerator()
+        players = generator.parse_wage_export_html(self.HTML)
+
+        assert players == [
+            {'name': 'Keeper One', 'position': 'GK', 'position_category': PositionCategory.GK,
+             'wage': 12000.0, 'division': 'English Premier Division'},
+            {'name': 'Striker Two', 'position': 'ST (C)', 'position_category': PositionCategory.ST,
+             'wage': 45500.0, 'division': 'English Premier Division'},
+        ]
+
+    def test_parse_from_file(self, tmp_path):
+        """Test parsing a UTF-8 wage export from disk."""
+        html_path = tmp_path / "wage_export.html"
+        html_path.write_text(self.HTML.replace("English Premier Division", "Spanish Primera División"), encoding='utf-8')
+
+        generator = LeagueBaselineGenerator()
+        players = generator.parse_wage_export_file(str(html_path))
+
+        assert [p['name'] for p in players] == ['Keeper One', 'Striker Two']
+        assert players[0]['division'] == "Spanish Primera División"
+
+    def test_parse_from_file_rejects_invalid_utf8(self, tmp_path):
+        """Test a file that is not UTF-8 raises instead of being re-guessed."""
+        html_path = tmp_path / "wage_export.html"
+        html_path.write_bytes(self.HTML.replace("English", "Espa\u00f1ol").encode('latin-1'))
+
+        generator = LeagueBaselineGenerator()
+        with pytest.raises(UnicodeDecodeError):
+            generator.parse_wage_export_file(str(html_path))
+
+    def test_file_parse_cached_across_generators(self, tmp_path, monkeypatch):
+        """Test an unchanged export is loaded from the cache dir without re-parsing."""
+        html_path = tmp_path / "wage_export.html"
+        html_path.write_text(self.HTML, encoding='utf-8')
+        cache_dir = str(tmp_path / "cache")
+
+        first = LeagueBaselineGenerator().parse_wage_export_file(str(html_path), cache_dir=cache_dir)
+
+        def fail(self, html_content):
+            raise AssertionError("HTML should not be re-parsed")
+
+        monkeypatch.setattr(LeagueBaselineGenerator, 'parse_wage_export_html', fail)
+        second = LeagueBaselineGenerator().parse_wage_export_file(str(html_path), cache_dir=cache_dir)
+
+        assert second == first
+        assert second[0]['position_category'] is PositionCategory.GK
+
+    def test_file_parse_cache_keyed_on_contents(self, tmp_path):
+        """Test a changed export, or an unreadable cache entry, is parsed again."""
+        html_path = tmp_path / "wage_export.html"
+        html_path.write_text(self.HTML, encoding='utf-8')
+        cache_dir = tmp_path / "cache"
+        generator = LeagueBaselineGenerator()
+        generator.parse_wage_export_file(str(html_path), cache_dir=str(cache_dir))
+
+        html_path.write_text(self.HTML.replace("Keeper One", "Keeper Renamed"), encoding='utf-8')
+        players = generator.parse_wage_export_file(str(html_path), cache_dir=str(cache_dir))
+        assert players[0]['name'] == 'Keeper Renamed'
+
+        for cache_file in cache_dir.iterdir():
+            cache_file.write_bytes(b'{"truncated')
+        players = generator.parse_wage_export_file(str(html_path), cache_dir=str(cache_dir))
+        assert players[0]['name'] == 'Keeper Renamed'
+
+    def test_missing_table_raises(self):
+        """Test HTML without a table raises ValueError."""
+        generator = LeagueBaselineGenerator()
+        with pytest.raises(ValueError):
+            generator.parse_wage_export_html("<html><body>No data</body></html>")
+
+
 class TestGKMultiplier:
     """Test GK wage multiplier calculation."""
 
@@ -163,6 +262,106 @@ class TestGKMultiplier:
         assert multiplier == 0.75  # Default fallback
 
 
+class TestBaselineStatistics:
+    """Test wage statistics computed for a single baseline."""
+
+    def test_stats_match_statistics_module(self):
+        """Test mean/median/quartiles match the statistics module."""
+        import statistics
+
+        generator = LeagueBaselineGenerator()
+        wages = [1200.0, 500.0, 9800.0, 3100.0, 750.0, 4400.0, 2600.0]
+
+        baseline = generator._create_baseline(
+            division="Test Division",
+            position="ST (C)",
+            position_category=PositionCategory.ST,
+            wages=wages,
+            is_aggregated=False
+        )
+
+        quartiles = statistics.quantiles(wages, n=4)
+        assert baseline.average_wage == pytest.approx(statistics.mean(wages))
+        assert baseline.median_wage == statistics.median(wages)
+        assert baseline.percentile_25 == pytest.approx(quartiles[0])
+        assert baseline.percentile_75 == pytest.approx(quartiles[2])
+        assert baseline.player_count == 7
+
+    def test_small_sample_uses_min_max(self):
+        """Test fewer than 4 wages fall back to min/max for quartiles."""
+        generator = LeagueBaselineGenerator()
+
+        baseline = generator._create_baseline(
+            division="Test Division",
+            position="GK",
+            position_category=PositionCategory.GK,
+            wages=[3000.0, 1000.0, 2000.0],
+            is_aggregated=False
+        )
+
+        assert baseline.percentile_25 == 1000.0
+        assert baseline.percentile_75 == 3000.0
+        assert baseline.median_wage == 2000.0
+
+
+class TestBaselineGeneration:
+    """Test grouping of player data into specific and aggregated baselines."""
+
+    def _players(self, division, position, category, wages):
+        return [
+            {'name': f'{position} {i}', 'position': position, 'position_category': category,
+             'wage': wage, 'division': division}
+            for i, wage in enumerate(wages)
+        ]
+
+    def test_specific_and_aggregated_baselines(self):
+        """Test ≥30 players get a specific baseline and groups of ≥5 aggregate."""
+        generator = LeagueBaselineGenerator()
+        player_data = (
+            self._players("Test Division", "ST (C)", PositionCategory.ST, [1000.0 * (i + 1) for i in range(30)])
+            + self._players("Test Division", "W (R)", PositionCategory.W, [500.0] * 4)
+            + self._players("Test Division", "D (C)", PositionCategory.CB, [800.0] * 3)
+            + self._players("Test Division", "GK", PositionCategory.GK, [700.0] * 6)
+        )
+
+        collection = generator.generate_baselines(player_data)
+
+        specific = collection.get_baseline("Test Division", PositionCategory.ST)
+        assert specific.position == "ST (C)"
+        assert specific.player_count == 30
+        assert not specific.is_aggregated
+
+        aggregated = {b.position: b for b in collection.baselines if b.is_aggregated}
+        assert set(aggregated) == {"Attackers"}
+        assert aggregated["Attackers"].player_count == 34
+        assert aggregated["Attackers"].position_category == PositionCategory.ST
+
+        assert collection.division_metadata == {"Test Division": 43}
+
+    def test_parallel_matches_serial(self):
+        """Test process-pool generation yields the same baselines as serial."""
+        generator = LeagueBaselineGenerator()
+        player_data = []
+        for division in ["Division A", "Division B", "Division C"]:
+            player_data += self._players(division, "ST (C)", PositionCategory.ST, [1500.0 + i for i in range(31)])
+            player_data += self._players(division, "D (C)", PositionCategory.CB, [900.0 + i for i in range(8)])
+
+        serial = generator.generate_baselines(player_data)
+        parallel = generator.generate_baselines(player_data, n_jobs=2)
+
+        assert parallel.baselines == serial.baselines
+        assert parallel.division_metadata == serial.division_metadata
+
+    def test_empty_player_data(self):
+        """Test empty input produces an empty collection."""
+        generator = LeagueBaselineGenerator()
+        collection = generator.generate_baselines([])
+
+        assert collection.baselines == []
+        assert collection.division_metadata == {}
+        assert collection.gk_wage_multiplier == 0.75
+
+
 class TestBaselineCollection:
     """Test LeagueBaselineCollection lookup and fallback logic."""
 
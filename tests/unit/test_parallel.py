@@ -0,0 +1,66 @@
+"""
+Unit Tests for Process Pool Helpers
+
+Tests the worker-count validation and mapping helpers from
+utils/parallel.py.
+"""
+
+import pytest
+from utils.parallel import configured_n_jobs, parse_n_jobs, process_map
+
+
+def _square(value):
+    return value * value
+
+
+class TestParseNJobs:
+    """Test worker-count validation."""
+
+    @pytest.mark.parametrize('value,expected', [
+        (1, 1),
+        (-1, -1),
+        (4, 4),
+        ('1', 1),
+        (' -1 ', -1),
+        ('8', 8),
+    ])
+    def test_valid_counts(self, value, expected):
+        """Test: 1, -1 and positive integers (or their strings) are accepted."""
+        assert parse_n_jobs(value) == expected
+
+    @pytest.mark.parametrize('value', [0, -2, '0', '-2', 'many', '', 2.0, True, None])
+    def test_invalid_counts(self, value):
+        """Test: anything else is rejected before a pool is started."""
+        with pytest.raises(ValueError):
+            parse_n_jobs(value)
+
+
+class TestConfiguredNJobs:
+    """Test reading the worker count from the app config."""
+
+    def test_explicit_value_wins(self, app):
+        """Test: an explicit worker count overrides ANALYSIS_WORKERS."""
+        app.config['ANALYSIS_WORKERS'] = 4
+        assert configured_n_jobs(2) == 2
+
+    def test_reads_app_config(self, app):
+        """Test: None falls back to the ANALYSIS_WORKERS setting."""
+        assert configured_n_jobs() == 1
+        app.config['ANALYSIS_WORKERS'] = -1
+        assert configured_n_jobs() == -1
+
+
+class TestProcessMap:
+    """Test serial and worker-process mapping."""
+
+    def test_worker_processes_match_serial(self):
+        """Test: results come back in input order either way."""
+        values = list(range(6))
+        assert process_map(_square, values, n_jobs=2) == process_map(_square, values) == [
+            0, 1, 4, 9, 16, 25
+        ]
+
+    def test_invalid_count_rejected(self):
+        """Test: a bad worker count raises instead of reaching ProcessPoolExecutor."""
+        with pytest.raises(ValueError):
+            process_map(_square, [1, 2], n_jobs=0)
@@ -0,0 +1,155 @@
+"""
+Unit Tests for PEADScreeningManager
+
+Tests the batch helpers used by the PEAD upload workflow in
+services/pead_screening_manager.py.
+"""
+
+import pytest
+from datetime import date
+from types import SimpleNamespace
+from services.pead_screening_manager import PEADScreeningManager, _EPSReport, _calculate_stock_sue
+
+
+class TestDeriveReportMetrics:
+    """Test vectorized accruals / ROA calculation for parsed CSV rows."""
+
+    def test_all_components_present(self):
+        """Test: total accruals, operating accruals and ROA computed per row."""
+        rows = [{
+            'net_income': 1200.0,
+            'operating_cash_flow': 1100.0,
+            'total_assets': 11000.0,
+            'change_in_receivables': 60.0,
+            'change_in_inventory': 35.0,
+            'change_in_payables': 45.0,
+            'depreciation': 120.0,
+        }]
+
+        total, operating, roa = PEADScreeningManager._derive_report_metrics(rows)
+
+        assert total == [100.0]
+        assert operating == [60.0 + 35.0 - 45.0 - 120.0]
+        assert roa == [1200.0 / 11000.0]
+
+    def test_missing_components_give_none(self):
+        """Test: operating accruals are None unless all four components exist."""
+        rows = [
+            {'net_income': 10.0, 'operating_cash_flow': 4.0, 'total_assets': 100.0},
+            {'net_income': 10.0, 'operating_cash_flow': 4.0, 'total_assets': 100.0,
+             'change_in_receivables': 1.0, 'change_in_inventory': 2.0,
+             'change_in_payables': None, 'depreciation': 3.0},
+        ]
+
+        total, operating, roa = PEADScreeningManager._derive_report_metrics(rows)
+
+        assert total == [6.0, 6.0]
+        assert operating == [None, None]
+        assert roa == [0.1, 0.1]
+
+    def test_non_positive_assets_skip_roa(self):
+        """Test: ROA is None when total assets are not positive."""
+        rows = [{'net_income': 10.0, 'operating_cash_flow': 4.0, 'total_assets': 0.0}]
+
+        _, _, roa = PEADScreeningManager._derive_report_metrics(rows)
+
+        assert roa == [None]
+
+    def test_results_are_python_floats(self):
+        """Test: values are plain floats so they bind cleanly as SQL parameters."""
+        rows = [{'net_income': 3.0, 'operating_cash_flow': 1.0, 'total_assets': 6.0}]
+
+        total, _, roa = PEADScreeningManager._derive_report_metrics(rows)
+
+        assert type(total[0]) is float
+        assert type(roa[0]) is float
+
+
+class TestComponentRatios:
+    """Test vectorized accruals / cash flow ratios for the quality detail view."""
+
+    def test_ratios_divided_by_assets(self):
+        """Test: each component is divided by total assets; missing ones stay None."""
+        reports = [
+            SimpleNamespace(total_accruals=100.0, operating_cash_flow=1100.0,
+                            operating_accruals=-70.0, total_assets=11000.0),
+            SimpleNamespace(total_accruals=6.0, operating_cash_flow=4.0,
+                            operating_accruals=None, total_assets=100.0),
+        ]
+
+        accruals, cash_flow, operating = PEADScreeningManager._component_ratios(reports)
+
+        assert accruals == [100.0 / 11000.0, 0.06]
+        assert cash_flow == [1100.0 / 11000.0, 0.04]
+        assert operating == [-70.0 / 11000.0, None]
+
+    def test_non_positive_assets_give_none(self):
+        """Test: no ratios when total assets are not positive."""
+        reports = [SimpleNamespace(total_accruals=6.0, operating_cash_flow=4.0,
+                                   operating_accruals=1.0, total_assets=0.0)]
+
+        assert PEADScreeningManager._component_ratios(reports) == ([None], [None], [None])
+
+    def test_empty(self):
+        """Test: no reports gives empty lists."""
+        assert PEADScreeningManager._component_ratios([]) == ([], [], [])
+
+
+class TestCalculateStockSUE:
+    """Test the ORM-free per-stock SUE worker."""
+
+    def _history(self):
+        """Five years of H1 reports, newest first; only the latest is in batch 2."""
+        return [
+            _EPSReport(date(2020 + year, 8, 1), f'H1-{20 + year}', 'HALF', eps, 2 if year == 4 else 1)
+            for year, eps in reversed(list(enumerate([1.0, 1.1, 1.3, 1.2, 1.6])))
+        ]
+
+    def test_only_current_batch_reports_scored(self):
+        """Test: reports from other batches are history only."""
+        results = _calculate_stock_sue(7, self._history(), batch_id=2)
+
+        assert len(results) == 1
+        current, sue_score, metadata = results[0]
+        assert current.reporting_period == 'H1-24'
+        assert metadata['expected_eps'] == 1.2
+        assert sue_score is not None
+
+    def test_matches_service_on_orm_free_reports(self):
+        """Test: worker output equals calling the service directly."""
+        from services.sue_calculation_service import SUECalculationService
+        history = self._history()
+
+        _, sue_score, metadata = _calculate_stock_sue(7, history, batch_id=2)[0]
+
+        assert (sue_score, metadata) == SUECalculationService.calculate_sue_for_stock(7, history[0], history[1:])
+
+
+class TestDatabaseStartup:
+    """Test schema setup on a database that predates newer indexes."""
+
+    def test_index_added_to_existing_table(self, tmp_path, test_config):
+        """Test: app startup builds an index declared after the table was created."""
+        import sqlite3
+        from app import create_app
+
+        db_path = tmp_path / 'existing.db'
+        connection = sqlite3.connect(db_path)
+        connection.execute(
+            'CREATE TABLE earnings_reports (id INTEGER PRIMARY KEY, stock_id INTEGER, '
+            'upload_batch_id INTEGER, report_date DATE)'
+        )
+        connection.close()
+
+        class ExistingDatabaseConfig(test_config):
+            SQLALCHEMY_DATABASE_URI = f'sqlite:///{db_path}'
+            SQUAD_UPLOAD_DIR = str(tmp_path / 'squad_audit_uploads')
+
+        create_app(ExistingDatabaseConfig)
+
+        connection = sqlite3.connect(db_path)
+        indexes = {row[0] for row in connection.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'earnings_reports'"
+        )}
+        connection.close()
+        assert 'idx_report_batch_stock' in indexes
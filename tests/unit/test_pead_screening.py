@@ -0,0 +1,94 @@
+"""
+Unit Tests for PEADScreeningService
+
+Tests the recommendation and display helpers from
+services/pead_screening_service.py.
+"""
+
+import pytest
+from services.pead_screening_service import PEADScreeningService
+
+
+class TestDisplayHelpers:
+    """Test lookup-table based badge colors and drift windows."""
+
+    @pytest.mark.parametrize('decile,expected', [
+        (None, 'secondary'),
+        (1, 'danger'),
+        (3, 'danger'),
+        (4, 'warning'),
+        (6, 'warning'),
+        (7, 'primary'),
+        (8, 'primary'),
+        (9, 'success'),
+        (10, 'success'),
+    ])
+    def test_decile_color(self, decile, expected):
+        """Test: decile badge color follows the 1-3 / 4-6 / 7-8 / 9-10 bands."""
+        assert PEADScreeningService._get_decile_color(decile) == expected
+
+    def test_decile_color_out_of_range(self):
+        """Test: deciles outside 1-10 clamp to the nearest band."""
+        assert PEADScreeningService._get_decile_color(0) == 'danger'
+        assert PEADScreeningService._get_decile_color(11) == 'success'
+
+    @pytest.mark.parametrize('recommendation,expected', [
+        ('STRONG_BUY', 'success'),
+        ('BUY', 'primary'),
+        ('HOLD', 'warning'),
+        ('AVOID', 'danger'),
+        (None, 'secondary'),
+    ])
+    def test_recommendation_color(self, recommendation, expected):
+        """Test: recommendation badge colors."""
+        assert PEADScreeningService._get_recommendation_color(recommendation) == expected
+
+    @pytest.mark.parametrize('period_type,expected', [
+        ('QUARTER', 60),
+        ('HALF', 90),
+        ('ANNUAL', 120),
+    ])
+    def test_recommended_drift_window(self, period_type, expected):
+        """Test: drift window per reporting frequency."""
+        assert PEADScreeningService.get_recommended_drift_window(period_type) == expected
+
+
+class TestRecommendations:
+    """Test the SUE decile + quality recommendation rules."""
+
+    @pytest.mark.parametrize('decile,quality,expected', [
+        (10, 85, 'STRONG_BUY'),
+        (9, 70, 'STRONG_BUY'),
+        (9, 69.9, 'BUY'),
+        (8, 50, 'BUY'),
+        (8, 49.9, 'HOLD'),
+        (3, 95, 'AVOID'),
+        (1, 10, 'AVOID'),
+        (5, 80, 'HOLD'),
+        (6, 40, 'HOLD'),
+    ])
+    def test_rule_priority(self, decile, quality, expected):
+        """Test: rules apply in priority order."""
+        recommendation, _ = PEADScreeningService.generate_recommendation(1.0, decile, quality, 60)
+        assert recommendation == expected
+
+    def test_explanation_text(self):
+        """Test: explanation includes decile, rounded quality and drift window."""
+        _, explanation = PEADScreeningService.generate_recommendation(1.0, 8, 62.4, 90)
+        assert explanation == (
+            'Positive earnings surprise (Decile 8) with acceptable quality '
+            '(62/100). Expected drift over 90 days.'
+        )
+
+    def test_batch_matches_single(self):
+        """Test: batch generation equals row-by-row generation."""
+        deciles = [10, 8, 8, 2, 5, 6]
+        qualities = [90.0, 55.0, 20.0, 75.0, 71.0, 50.0]
+
+        batch = PEADScreeningService.generate_recommendations(deciles, qualities, 120)
+
+        assert batch == [
+            PEADScreeningService.generate_recommendation(0.0, d, q, 120)
+            for d, q in zip(deciles, qualities)
+        ]
+        assert PEADScreeningService.generate_recommendations([], [], 60) == []
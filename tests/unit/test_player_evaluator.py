@@ -0,0 +1,200 @@
+"""
+Unit Tests for PlayerEvaluatorService
+
+Tests the position parsing helpers from
+services/player_evaluator_service.py.
+"""
+
+import copy
+import pytest
+from models.constants import PositionCategory
+from analyzers.role_recommendation_engine import RoleChangeDetector, _detector_name, _position_roles
+from services.player_evaluator_service import (
+    PlayerEvaluatorService, _parse_positions, _parse_position_string
+)
+
+
+class TestParsePositionString:
+    """Test single position token rules and their priority."""
+
+    @pytest.mark.parametrize('token,expected', [
+        ('GK', PositionCategory.GK),
+        ('D (RLC)', PositionCategory.CB),
+        ('WB (L)', PositionCategory.FB),
+        ('DM', PositionCategory.DM),
+        ('DM/WB (R)', PositionCategory.DM),
+        ('M (C)', PositionCategory.CM),
+        ('AM (C)', PositionCategory.CM),
+        ('AM (RL)', PositionCategory.AM),
+        ('W', PositionCategory.W),
+        ('ST (C)', PositionCategory.ST),
+        ('d (l)', PositionCategory.CB),
+        ('M (R)', PositionCategory.CM),
+        ('S', PositionCategory.ST),
+        ('', PositionCategory.CM),
+    ])
+    def test_rule_priority(self, token, expected):
+        """Test: first matching rule wins, unmatched tokens fall back to CM."""
+        assert _parse_position_string(token) == expected
+
+
+class TestParsePositions:
+    """Test FM position string parsing."""
+
+    @pytest.mark.parametrize('position,expected', [
+        ('GK', (PositionCategory.GK,)),
+        ('D (C)', (PositionCategory.CB,)),
+        ('D/WB (R)', (PositionCategory.FB,)),
+        ('DM, M (C)', (PositionCategory.DM, PositionCategory.CM)),
+        ('M (C), AM (RL), ST (C)', (PositionCategory.CM, PositionCategory.AM, PositionCategory.ST)),
+        ('AM (R), AM (L)', (PositionCategory.AM,)),
+    ])
+    def test_categories_in_listed_order(self, position, expected):
+        """Test: one category per token, duplicates dropped, order kept."""
+        assert _parse_positions(position) == expected
+
+    def test_cached_per_string(self):
+        """Test: repeated position strings reuse the cached result."""
+        first = _parse_positions('D (LC), DM')
+        assert _parse_positions('D (LC), DM') is first
+
+
+class TestNormalizedMetrics:
+    """Test normalized metrics for role evaluation."""
+
+    def test_fallback_attributes(self, sample_player):
+        """Test: zero or missing primary stats fall back to the legacy column."""
+        sample_player.tck_90 = 0.0
+        sample_player.k_tck_90 = 1.7
+
+        metrics = PlayerEvaluatorService().get_normalized_metrics(sample_player)
+
+        assert metrics['tackles_90'] == 1.7
+        assert metrics['xg_90'] == 0.0
+
+
+class TestEvaluateSquad:
+    """Test squad-wide role evaluation."""
+
+    def test_matches_per_player_evaluation(self, sample_player, sample_elite_player, sample_goalkeeper):
+        """Test: squad evaluation gives the same roles as evaluating each player alone."""
+        service = PlayerEvaluatorService()
+        squad = [copy.deepcopy(p) for p in (sample_player, sample_elite_player, sample_goalkeeper)]
+        single = [copy.deepcopy(p) for p in (sample_player, sample_elite_player, sample_goalkeeper)]
+
+        service.evaluate_squad(squad)
+        for player in single:
+            service.evaluate_roles(player)
+
+        for expected, player in zip(single, squad):
+            assert player.all_role_scores == expected.all_role_scores
+            assert player.best_role == expected.best_role
+
+    def test_worker_processes_match_serial(self, sample_player, sample_elite_player, sample_goalkeeper):
+        """Test: role results copied back from workers equal serial evaluation."""
+        service = PlayerEvaluatorService()
+        serial = [copy.deepcopy(p) for p in (sample_player, sample_elite_player, sample_goalkeeper)]
+        parallel = [copy.deepcopy(p) for p in (sample_player, sample_elite_player, sample_goalkeeper)]
+
+        service.evaluate_squad(serial)
+        service.evaluate_squad(parallel, n_jobs=2)
+
+        for expected, player in zip(serial, parallel):
+            assert player.best_role is not None
+            assert player.best_role == expected.best_role
+            assert player.all_role_scores == expected.all_role_scores
+            assert player.role_change_reason == expected.role_change_reason
+
+
+class TestSelectedPositionCategory:
+    """Test the position_selected fallback mapping."""
+
+    @pytest.mark.parametrize('selected,expected', [
+        ('GK', PositionCategory.GK),
+        ('DCL', PositionCategory.CB),
+        ('WBR', PositionCategory.FB),
+        ('DM', PositionCategory.DM),
+        ('MC', PositionCategory.CM),
+        ('AML', PositionCategory.AM),
+        ('ML', PositionCategory.CM),
+        ('STC', PositionCategory.ST),
+        ('SUB', PositionCategory.CM),
+    ])
+    def test_selected_position(self, sample_player, selected, expected):
+        """Test: selected position codes map to categories in rule order."""
+        sample_player.position_selected = selected
+        assert PlayerEvaluatorService()._selected_position_category(sample_player) == expected
+
+
+class TestPositionFit:
+    """Test the metric average used to pick between listed positions."""
+
+    def test_fit_averages_positive_metrics(self, sample_player):
+        """Test: missing and non-positive metrics are left out of the average."""
+        service = PlayerEvaluatorService()
+
+        # AM: ch_c_90, drb_90, xg (None), pas_pct (None)
+        assert service._evaluate_position_fit(sample_player, PositionCategory.AM) == (0.97 + 6.00) / 2
+        # ST: shot_90, xg (None), ch_c_90, av_rat
+        assert service._evaluate_position_fit(sample_player, PositionCategory.ST) == (3.39 + 0.97 + 7.30) / 3
+        # CB: k_tck_90 is 0.0, the rest are None
+        assert service._evaluate_position_fit(sample_player, PositionCategory.CB) == 0.0
+
+    def test_best_fit_category(self, sample_player):
+        """Test: the listed position with the highest fit is the category."""
+        assert PlayerEvaluatorService().get_position_category(sample_player) == PositionCategory.ST
+
+
+class TestEvaluateRoles:
+    """Test per-player role evaluation."""
+
+    def test_each_role_scored_once(self, sample_player, monkeypatch):
+        """Test: playable roles and recommendations share one scoring pass."""
+        service = PlayerEvaluatorService()
+        evaluator = service._engine.evaluator
+        scored = []
+        original = evaluator.evaluate_player_for_role
+
+        def counting(player, role, player_metrics=None):
+            scored.append(role.name)
+            return original(player, role, player_metrics)
+
+        monkeypatch.setattr(evaluator, 'evaluate_player_for_role', counting)
+        service.evaluate_roles(sample_player)
+
+        assert sorted(scored) == sorted(set(scored))
+        assert {score.role for score in sample_player.all_role_scores} <= set(scored)
+
+    def test_position_roles_cached_per_string(self):
+        """Test: role mapping is computed once per position string, returned as a fresh list."""
+        engine = PlayerEvaluatorService()._engine
+
+        first = engine._map_position_to_roles('D (RLC), DM')
+        second = engine._map_position_to_roles('D (RLC), DM')
+
+        assert sorted(first) == ['BCB', 'CB-STOPPER', 'FB', 'MD', 'WB']
+        assert first == second and first is not second
+        assert _position_roles('D (RLC), DM') is _position_roles('D (RLC), DM')
+
+
+class TestRoleChangeDetector:
+    """Test role change detection helpers."""
+
+    def test_metric_matches_normalized_metrics(self, sample_player):
+        """Test: single-metric reads equal the full normalized metric dict."""
+        detector = RoleChangeDetector()
+        metrics = PlayerEvaluatorService().get_normalized_metrics(sample_player)
+
+        for metric, value in metrics.items():
+            assert detector._get_metric(sample_player, metric) == value
+        assert detector._get_metric(sample_player, 'unknown_90', default=-1.0) == -1.0
+
+    @pytest.mark.parametrize('current,alternative,expected', [
+        ('CB-STOPPER', 'BCB', 'detect_cb_stopper_to_bcb'),
+        ('AM(C)', 'WAP', 'detect_amc_to_wap'),
+        ('FB', 'WB', 'detect_fb_to_wb'),
+    ])
+    def test_detector_name(self, current, alternative, expected):
+        """Test: role pairs map to the detector method names."""
+        assert _detector_name(current, alternative) == expected
+        assert hasattr(RoleChangeDetector, expected)
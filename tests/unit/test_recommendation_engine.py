@@ -0,0 +1,173 @@
+"""
+Unit Tests for RecommendationEngine
+
+Tests rule priority of the rule-based player recommendations in
+services/recommendation_engine.py.
+"""
+
+import pytest
+from datetime import date
+from itertools import product
+from types import SimpleNamespace
+from models.squad_audit import Player
+from services.recommendation_engine import RecommendationEngine, RecommendationContext, parse_expiry
+
+
+GAME_DATE = date(2027, 11, 1)
+
+
+def make_player(tier=None, inf='', mins=3000, apps=30, expires='30/06/2030'):
+    """Build a player whose best role has the given tier."""
+    player = Player(
+        name='Test Player',
+        position_selected='MC',
+        position='M (C)',
+        age=24,
+        wage=10000.0,
+        apps=apps,
+        subs=0,
+        gls=0,
+        ast=0,
+        av_rat=7.0,
+        expires=expires,
+        inf=inf,
+        mins=mins
+    )
+    player.best_role = SimpleNamespace(tier=tier) if tier else None
+    return player
+
+
+class TestRulePriority:
+    """Test that the first matching rule decides the badge."""
+
+    @pytest.mark.parametrize('player_kwargs,value_score,badge', [
+        ({'tier': 'ELITE', 'mins': 150}, 90, 'LOW DATA'),
+        ({'tier': 'ELITE', 'mins': 499}, 90, 'LOW DATA'),
+        ({'tier': 'ELITE'}, 40, 'WAGE CUT'),
+        ({'tier': 'GOOD'}, 40, 'CONSIDER SALE'),
+        ({'tier': 'ELITE', 'inf': 'Lst'}, 90, 'KEEP & PLAY'),
+        ({'tier': 'ELITE', 'inf': 'U21'}, 90, 'PROMOTE'),
+        ({'tier': 'ELITE', 'apps': 9}, 90, 'INCREASE MINS'),
+        ({'tier': 'ELITE'}, 90, 'CORE STARTER'),
+        ({'tier': 'GOOD', 'inf': 'Lst'}, 90, 'EVALUATE'),
+        ({'tier': 'GOOD'}, 90, 'BACKUP'),
+        ({'tier': 'POOR', 'inf': 'U21'}, 90, 'DEVELOP'),
+        ({'tier': 'POOR'}, 90, 'SELL/REPLACE'),
+        ({'tier': 'AVERAGE'}, 90, 'BACKUP'),
+        ({'tier': None, 'mins': None}, 90, 'BACKUP'),
+    ])
+    def test_badge(self, player_kwargs, value_score, badge):
+        """Test: badge for each rule in priority order."""
+        recommendation = RecommendationEngine().generate_recommendation(
+            make_player(**player_kwargs), value_score, game_date=GAME_DATE
+        )
+        assert recommendation.badge == badge
+
+    def test_low_data_explanation_includes_minutes(self):
+        """Test: minutes played appear in the low-data explanation."""
+        recommendation = RecommendationEngine().generate_recommendation(
+            make_player(mins=320), 90, game_date=GAME_DATE
+        )
+        assert recommendation.explanation == 'Projected stats only (320 mins played)'
+
+
+class TestRuleTable:
+    """Test the precomputed first-matching-rule table."""
+
+    def test_table_matches_rule_order(self):
+        """Test: table lookup picks the same rule as scanning the rule list."""
+        engine = RecommendationEngine()
+
+        for tier, inf, mins, apps, value_score in product(
+            ('ELITE', 'GOOD', 'AVERAGE', 'POOR', None),
+            ('', 'Lst', 'U21', 'Inj'),
+            (None, 0, 199, 200, 499, 500),
+            (0, 9, 10),
+            (0.0, 49.9, 50.0, 99.0)
+        ):
+            player = make_player(tier=tier, inf=inf, mins=mins, apps=apps)
+            recommendation = engine.generate_recommendation(player, value_score, game_date=GAME_DATE)
+
+            context = RecommendationContext(
+                player=player, value_score=value_score, is_projected=False,
+                game_date=GAME_DATE, contract_warning=recommendation.has_contract_warning,
+                tier=tier, status_flag=player.get_status_flag(), mins=mins, apps=apps
+            )
+            expected = next(rule for rule in engine.rules if rule.applies(context))
+            assert recommendation == expected.generate(context)
+
+    def test_rule_reading_other_context_fields_rejected(self):
+        """Test: a rule condition outside the dispatch fields fails when the table is built."""
+        from services.recommendation_engine import RecommendationRule
+
+        class ProjectedEliteRule(RecommendationRule):
+            __slots__ = ()
+
+            def applies(self, context):
+                return context.tier == 'ELITE' and context.is_projected
+
+        rules = [ProjectedEliteRule(), *RecommendationEngine().rules]
+
+        with pytest.raises(RuntimeError, match='may only read'):
+            RecommendationEngine._build_rule_table(rules)
+
+    def test_rule_names_in_priority_order(self):
+        """Test: one instance of each rule class, in priority order."""
+        assert [rule.name for rule in RecommendationEngine().rules] == [
+            'insufficient_data', 'projected_stats', 'elite_overpaid', 'poor_value',
+            'elite_transfer_listed', 'elite_u21', 'elite_low_apps', 'elite_core',
+            'good_transfer_listed', 'good_backup', 'poor_u21', 'poor_sell', 'average_backup',
+        ]
+
+    def test_rules_shared_between_instances(self):
+        """Test: rules and table are built once, not per engine."""
+        first, second = RecommendationEngine(), RecommendationEngine()
+
+        assert first.rules is second.rules
+        assert first.rule_table is second.rule_table
+
+
+class TestContractWarning:
+    """Test the <6 months contract warning for Elite/Good players."""
+
+    @pytest.mark.parametrize('tier,expires,expected', [
+        ('ELITE', '30/04/2028', True),
+        ('GOOD', '01/05/2028', False),
+        ('POOR', '30/04/2028', False),
+        ('ELITE', '-', False),
+        ('ELITE', 'not a date', False),
+    ])
+    def test_contract_warning(self, tier, expires, expected):
+        """Test: months remaining counted from the game date."""
+        recommendation = RecommendationEngine().generate_recommendation(
+            make_player(tier=tier, expires=expires), 90, game_date=GAME_DATE
+        )
+        assert recommendation.has_contract_warning is expected
+
+    @pytest.mark.parametrize('expires,expected', [
+        ('30/06/2028', date(2028, 6, 30)),
+        ('1/7/2029', date(2029, 7, 1)),
+        ('31/02/2028', None),
+        ('2028-06-30', None),
+        ('30/06/28', None),
+        ('00/06/2028', None),
+        ('30/06/2028/1', None),
+    ])
+    def test_parse_expiry(self, expires, expected):
+        """Test: DD/MM/YYYY parsing, invalid dates give None."""
+        assert parse_expiry(expires) == expected
+
+
+class TestRecommendationContext:
+    """Test the per-player rule context."""
+
+    def test_context_has_no_instance_dict(self):
+        """Test: context uses slots, so stray attributes are rejected."""
+        context = RecommendationContext(
+            player=None, value_score=90.0, is_projected=False, game_date=None,
+            contract_warning=False, tier='ELITE', status_flag=None, mins=900, apps=10
+        )
+
+        assert not hasattr(context, '__dict__')
+        with pytest.raises(AttributeError):
+            context.tierr = 'GOOD'
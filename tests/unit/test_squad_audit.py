@@ -46,6 +46,69 @@ class TestSquadAuditService:
             assert isinstance(metrics, dict)
             assert len(metrics) > 0
 
+    def test_position_benchmarks_skip_missing_values(self, squad_audit_service):
+        """Test that benchmark averages ignore missing stats per metric."""
+        def centre_back(name, int_90, hdr_pct):
+            return Player(
+                name=name, position_selected='DC', position='D (C)', age=25,
+                wage=10000.0, apps=20, subs=0, gls=0, ast=0, av_rat=7.0,
+                expires='30/6/2030', inf='', int_90=int_90, hdr_pct=hdr_pct,
+                k_tck_90=None, pas_pct=80.0
+            )
+
+        squad = Squad(players=[
+            centre_back('A', 2.0, 60.0),
+            centre_back('B', None, 70.0),
+            centre_back('C', 1.0, None),
+        ])
+
+        benchmarks = squad_audit_service._calculate_position_benchmarks(squad)
+
+        assert benchmarks == {
+            PositionCategory.CB: {'k_tck_90': 0.0, 'int_90': 1.5, 'hdr_pct': 65.0, 'pas_pct': 80.0}
+        }
+
+    def test_bayesian_average_blends_benchmark_metrics(self, squad_audit_service):
+        """Test that only the position's set metrics are pulled toward the squad average."""
+        player = Player(
+            name='A', position_selected='DC', position='D (C)', age=25,
+            wage=10000.0, apps=20, subs=0, gls=0, ast=0, av_rat=7.0,
+            expires='30/6/2030', inf='', int_90=3.0, hdr_pct=None,
+            k_tck_90=1.0, pas_pct=90.0, drb_90=5.0
+        )
+        profiles = squad_audit_service._position_profiles({
+            PositionCategory.CB: {'k_tck_90': 2.0, 'int_90': 1.0, 'hdr_pct': 60.0, 'pas_pct': 80.0}
+        })
+
+        squad_audit_service._apply_bayesian_average(player, profiles, 350)
+
+        assert profiles[PositionCategory.ST] is None
+        assert (player.k_tck_90, player.int_90, player.hdr_pct, player.pas_pct) == (1.5, 2.0, None, 85.0)
+        assert player.drb_90 == 5.0
+
+    def test_bayesian_averages_only_adjust_soft_floor_players(self, squad_audit_service):
+        """Test that the squad-wide Bayesian pass matches the per-player blend."""
+        def centre_back(name, mins):
+            return Player(
+                name=name, position_selected='DC', position='D (C)', age=25,
+                wage=10000.0, apps=20, subs=0, gls=0, ast=0, av_rat=7.0,
+                expires='30/6/2030', inf='', int_90=3.0, hdr_pct=None,
+                k_tck_90=1.0, pas_pct=90.0, drb_90=5.0, mins=mins
+            )
+        benchmarks = {
+            PositionCategory.CB: {'k_tck_90': 2.0, 'int_90': 1.0, 'hdr_pct': 60.0, 'pas_pct': 80.0}
+        }
+        players = [centre_back('Low', 150), centre_back('Soft', 350), centre_back('Full', 600)]
+
+        squad_audit_service._apply_bayesian_averages(players, [PositionCategory.CB] * 3, benchmarks)
+
+        stats = [(p.k_tck_90, p.int_90, p.hdr_pct, p.pas_pct, p.drb_90) for p in players]
+        assert stats == [
+            (1.0, 3.0, None, 90.0, 5.0),
+            (1.5, 2.0, None, 85.0, 5.0),
+            (1.0, 3.0, None, 90.0, 5.0),
+        ]
+
     def test_value_score_calculation(self, squad_audit_service):
         """Test value score calculation."""
         # Test case: High performance, low wage = high value
@@ -68,6 +131,17 @@ class TestSquadAuditService:
         # Should be below 100 (poor value)
         assert value_score_low < 100
 
+    def test_value_scores_match_single_calculation(self, squad_audit_service):
+        """Test that squad-wide value scores equal the per-player calculation."""
+        performance = [120.0, 80.0, 95.5, 60.0]
+        wages = [20000.0, 0.0, 500.0, 90000.0]
+
+        for squad_avg_wage in (30000.0, 0.0):
+            assert squad_audit_service._calculate_value_scores(performance, wages, squad_avg_wage) == [
+                squad_audit_service._calculate_value_score(p, w, squad_avg_wage)
+                for p, w in zip(performance, wages)
+            ]
+
     def test_recommendation_structure(self, squad_audit_service, sample_squad):
         """Test that recommendations have correct structure."""
         from models import Recommendation
@@ -98,6 +172,42 @@ class TestSquadAuditService:
 
         assert isinstance(warning, bool)
 
+    @pytest.mark.parametrize('expires,expected', [
+        ('30/11/2028', True),
+        ('1/12/2028', False),
+        ('31/10/2027', True),
+        ('-', False),
+        ('', False),
+        ('31/02/2028', False),
+        ('2028-06-30', False),
+    ])
+    def test_contract_warning_relative_to_game_date(self, squad_audit_service, expires, expected):
+        """Test contract warning within 12 months of the game date; bad dates never warn."""
+        from datetime import date
+
+        warning = squad_audit_service._check_contract_warning(expires, date(2027, 11, 1))
+
+        assert warning is expected
+
+    def test_format_all_metrics_groups_by_tier(self, squad_audit_service):
+        """Test metric display lines are grouped Elite/Good/Average/Poor."""
+        metric_scores = {
+            'xg_90': {'tier': 'CRITICAL'},
+            'dribbles_90': {'tier': 'ELITE'},
+            'pass_pct': {'tier': 'AVERAGE'},
+            'key_passes_90': {'tier': 'ELITE'},
+            'odd_metric': {},
+        }
+
+        lines = squad_audit_service._format_all_metrics(metric_scores, projected=True)
+
+        assert lines == [
+            'Projected: Elite: Dribbles/90, Key Passes/90',
+            'Projected: Average: Pass %',
+            'Projected: Poor: xG/90, Odd Metric',
+        ]
+        assert squad_audit_service._format_all_metrics({}) == ["N/A - No metrics"]
+
     def test_export_to_csv_data(self, squad_audit_service, sample_squad):
         """Test CSV export data generation."""
         result = squad_audit_service.analyze_squad(sample_squad)
@@ -123,6 +233,49 @@ class TestSquadAuditService:
             for field in required_fields:
                 assert field in row
 
+    def test_position_stored_on_analysis(self, squad_audit_service, sample_squad, monkeypatch):
+        """Test that exports reuse the position category stored at analysis time."""
+        result = squad_audit_service.analyze_squad(sample_squad)
+        evaluator = squad_audit_service.player_evaluator
+        expected = [evaluator.get_position_category(a.player).value for a in result.player_analyses]
+
+        def fail_lookup(player):
+            raise AssertionError("position should not be looked up again")
+
+        monkeypatch.setattr(evaluator, 'get_position_category', fail_lookup)
+
+        assert [a.position.value for a in result.player_analyses] == expected
+        assert [row['Position'] for row in squad_audit_service.export_to_csv_data(result)] == expected
+
+    def test_unevaluated_players_scored_in_one_batch(self, squad_audit_service, sample_squad, monkeypatch):
+        """Test that players without roles are evaluated together, not one by one."""
+        evaluator = squad_audit_service.player_evaluator
+        original = evaluator.evaluate_squad
+        original(sample_squad.players[1:])
+        sample_squad.players[0].best_role = None
+        batches = []
+
+        def counting(players, n_jobs=1):
+            batches.append([player.name for player in players])
+            return original(players, n_jobs)
+
+        monkeypatch.setattr(evaluator, 'evaluate_squad', counting)
+
+        result = squad_audit_service.analyze_squad(sample_squad)
+
+        assert batches == [[sample_squad.players[0].name]]
+        assert all(a.player.best_role for a in result.player_analyses)
+
+    def test_csv_rows_streamed(self, squad_audit_service, sample_squad):
+        """Test that CSV rows are yielded lazily and match the list export."""
+        import types
+
+        result = squad_audit_service.analyze_squad(sample_squad)
+        rows = squad_audit_service.iter_csv_rows(result)
+
+        assert isinstance(rows, types.GeneratorType)
+        assert list(rows) == squad_audit_service.export_to_csv_data(result)
+
     def test_full_squad_analysis_workflow(self, squad_audit_service, sample_squad):
         """Test complete end-to-end squad analysis workflow."""
         # Run analysis
@@ -163,6 +316,14 @@ class TestPlayerModel:
         """Test position category classification for goalkeeper."""
         assert sample_goalkeeper.get_position_category() == PositionCategory.GK
 
+    def test_player_position_category_follows_stat_changes(self, sample_player):
+        """Test that the category is re-evaluated after stats are adjusted."""
+        sample_player.drb_90 = 50.0
+        assert sample_player.get_position_category() == PositionCategory.AM
+
+        sample_player.shot_90 = 200.0
+        assert sample_player.get_position_category() == PositionCategory.ST
+
     def test_player_position_category_winger(self, sample_player):
         """Test position category classification with multi-position player."""
         # Josh Bowler is listed as AMR but can play "AM (RL), ST (C)"
@@ -258,7 +419,8 @@ class TestAnalysisResultMethods:
             performance_index=120.0,
             value_score=160.0,
             verdict=PerformanceVerdict.ELITE,
-            recommendation=test_rec
+            recommendation=test_rec,
+            position=PositionCategory.AM
         )
         assert analysis_elite.get_value_score_color() == 'success'
 
@@ -268,7 +430,8 @@ class TestAnalysisResultMethods:
             performance_index=110.0,
             value_score=130.0,
             verdict=PerformanceVerdict.GOOD,
-            recommendation=test_rec
+            recommendation=test_rec,
+            position=PositionCategory.AM
         )
         assert analysis_good.get_value_score_color() == 'info'
 
@@ -278,7 +441,8 @@ class TestAnalysisResultMethods:
             performance_index=100.0,
             value_score=110.0,
             verdict=PerformanceVerdict.AVERAGE,
-            recommendation=test_rec
+            recommendation=test_rec,
+            position=PositionCategory.AM
         )
         assert analysis_expected.get_value_score_color() == 'warning'
 
@@ -288,7 +452,8 @@ class TestAnalysisResultMethods:
             performance_index=90.0,
             value_score=85.0,
             verdict=PerformanceVerdict.AVERAGE,
-            recommendation=test_rec
+            recommendation=test_rec,
+            position=PositionCategory.AM
         )
         assert analysis_below.get_value_score_color() == 'dark'
 
@@ -298,6 +463,117 @@ class TestAnalysisResultMethods:
             performance_index=80.0,
             value_score=70.0,
             verdict=PerformanceVerdict.POOR,
-            recommendation=test_rec
+            recommendation=test_rec,
+            position=PositionCategory.AM
         )
         assert analysis_poor.get_value_score_color() == 'danger'
+
+
+class TestFormationSuggestions:
+    """Test suite for formation suggestions."""
+
+    @staticmethod
+    def _result(positions_and_verdicts):
+        """Build an analysis result from (FM position string, verdict) pairs."""
+        from models import PlayerAnalysis, SquadAnalysisResult
+
+        analyses = []
+        for i, (position, verdict) in enumerate(positions_and_verdicts):
+            player = Player(
+                name=f'Player {i}', position_selected='', position=position, age=25,
+                wage=10000.0, apps=20, subs=0, gls=0, ast=0, av_rat=7.0,
+                expires='30/6/2030', inf=''
+            )
+            analyses.append(PlayerAnalysis(
+                player=player,
+                performance_index=80.0,
+                value_score=100.0,
+                verdict=verdict,
+                recommendation=Recommendation(badge='', icon='', color='', explanation=''),
+                position=player.get_position_category()
+            ))
+        return SquadAnalysisResult(squad=Squad(players=[a.player for a in analyses]), player_analyses=analyses)
+
+    def test_position_quality_counts_every_playable_position(self, squad_audit_service):
+        """Test that versatile players count towards each position they can play."""
+        elite, good, average = PerformanceVerdict.ELITE, PerformanceVerdict.GOOD, PerformanceVerdict.AVERAGE
+        result = self._result([
+            ('GK', good),
+            ('D (C)', elite), ('D (C), DM', good),
+            ('WB (R)', average), ('WB (L)', average),
+            ('DM', elite), ('DM', average),
+            ('AM (RL)', good), ('AM (RL)', good),
+            ('ST (C)', elite), ('ST (C)', average),
+        ])
+
+        suggestions = squad_audit_service.suggest_formations(result, top_n=20)
+
+        assert [s['name'] for s in suggestions] == ['4-2-2-2 DM AM Narrow']
+        breakdown = {row['position']: row for row in suggestions[0]['breakdown']}
+        assert breakdown['CB'] == {
+            'position': 'CB', 'required': 2, 'elite': 1, 'good': 1,
+            'total_available': 2, 'recruitment_needed': 0
+        }
+        assert breakdown['DM']['total_available'] == 3
+        # GK 4 + CB 10+4 + FB 1+1 + DM 10+4 + AM 4+4 + ST 10+1
+        assert suggestions[0]['score'] == 53
+        assert suggestions[0]['total_recruitment_needed'] == 3
+
+    def test_formation_catalog_fields_eleven(self):
+        """Test that every formation, and its requirements row, has eleven players."""
+        from services.squad_audit_service import FORMATIONS, _FORMATION_REQUIREMENTS
+
+        assert [sum(f['positions'].values()) for f in FORMATIONS] == [11] * len(FORMATIONS)
+        assert _FORMATION_REQUIREMENTS.sum(axis=1).tolist() == [11] * len(FORMATIONS)
+
+    def test_formations_need_every_position_filled(self, squad_audit_service):
+        """Test that formations are dropped when any position lacks players."""
+        elite = PerformanceVerdict.ELITE
+        full = [
+            ('GK', elite), ('D (C)', elite), ('D (C)', elite), ('D (C)', elite),
+            ('WB (R)', elite), ('WB (L)', elite), ('DM', elite), ('DM', elite),
+            ('M (C)', elite), ('M (C)', elite), ('AM (RL)', elite), ('AM (RL)', elite),
+            ('ST (C)', elite), ('ST (C)', elite),
+        ]
+
+        suggestions = squad_audit_service.suggest_formations(self._result(full), top_n=20)
+
+        # No wingers, so every formation with W slots is left out; ties keep list order
+        assert [s['name'] for s in suggestions] == [
+            '4-3-2-1 DM AM Narrow', '5-2-2-1 DM AM', '4-4-2 Diamond Narrow',
+            '4-2-2-2 DM AM Narrow', '5-3-2 DM WB',
+        ]
+        assert all(type(s['score']) is int and s['score'] == 110 for s in suggestions)
+        assert squad_audit_service.suggest_formations(self._result(full), top_n=2) == suggestions[:2]
+
+        assert squad_audit_service.suggest_formations(self._result(full[1:]), top_n=20) == []
+
+    def test_best_xi_parses_each_player_once(self, squad_audit_service, monkeypatch):
+        """Test that the best XI fills each slot from one position lookup per player."""
+        good, poor = PerformanceVerdict.GOOD, PerformanceVerdict.POOR
+        result = self._result([
+            ('GK', good), ('D (C)', good), ('D (C), DM', good), ('DM', poor), ('ST (C)', good),
+        ])
+        evaluator = squad_audit_service.player_evaluator
+        original = evaluator.get_all_possible_positions
+        lookups = []
+
+        def counting(player):
+            lookups.append(player.name)
+            return original(player)
+
+        monkeypatch.setattr(evaluator, 'get_all_possible_positions', counting)
+        xi = squad_audit_service.generate_best_xi({
+            'name': 'Test',
+            'positions': {PositionCategory.GK: 1, PositionCategory.CB: 2, PositionCategory.DM: 1}
+        }, result)
+
+        assert sorted(lookups) == sorted(a.player.name for a in result.player_analyses)
+        assert {
+            position: [assignment.player_analysis.player.name for assignment in assignments]
+            for position, assignments in xi.starting_xi.items()
+        } == {
+            PositionCategory.GK: ['Player 0'],
+            PositionCategory.CB: ['Player 1', 'Player 2'],
+            PositionCategory.DM: ['Player 3'],
+        }
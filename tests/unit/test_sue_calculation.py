@@ -0,0 +1,75 @@
+"""
+Unit Tests for SUECalculationService
+
+Tests the seasonal random walk helpers from
+services/sue_calculation_service.py.
+"""
+
+import statistics
+import pytest
+from collections import namedtuple
+from services.sue_calculation_service import SUECalculationService
+
+
+Report = namedtuple('Report', 'reporting_period period_type actual_eps')
+
+
+class TestPriorPeriodLookup:
+    """Test same-period-last-year label shifting."""
+
+    @pytest.mark.parametrize('period,expected', [
+        ('H1-24', 'H1-23'),
+        ('Q4-23', 'Q4-22'),
+        ('FY-00', 'FY-99'),
+        ('bad', None),
+        ('Q1-xx', None),
+    ])
+    def test_find_same_period_last_year(self, period, expected):
+        """Test: year suffix decremented, invalid formats rejected."""
+        assert SUECalculationService._find_same_period_last_year(period, 'HALF') == expected
+
+
+class TestForecastErrorStddev:
+    """Test standard deviation of historical seasonal forecast errors."""
+
+    def test_uses_nearest_prior_match(self):
+        """Test: each report is compared with the next older same-period report."""
+        history = [
+            Report('H1-23', 'HALF', 1.5),
+            Report('H2-22', 'HALF', 1.0),
+            Report('H1-22', 'HALF', 1.2),
+            Report('H1-22', 'HALF', 9.9),  # older duplicate must be ignored
+            Report('H2-21', 'HALF', 0.7),
+            Report('H1-21', 'HALF', 1.1),
+        ]
+
+        stddev = SUECalculationService.calculate_forecast_error_stddev(history)
+
+        errors = [1.5 - 1.2, 1.0 - 0.7, 1.2 - 1.1, 9.9 - 1.1]
+        assert stddev == statistics.stdev(errors)
+
+    def test_insufficient_matches(self):
+        """Test: fewer than two forecast errors gives None."""
+        history = [Report(f'Q{q}-23', 'QUARTER', 1.0) for q in range(1, 5)]
+
+        assert SUECalculationService.calculate_forecast_error_stddev(history) is None
+
+
+class TestDecileRanks:
+    """Test rank-to-decile conversion."""
+
+    def test_ten_distinct_scores(self):
+        """Test: rank r of n maps to int(r / n * 10) + 1, capped at 10."""
+        scores = [5.0, -3.0, 0.5, 9.0, -1.0, 2.0, 7.5, -8.0, 1.0, 3.0]
+
+        deciles = SUECalculationService._decile_ranks(scores)
+
+        assert deciles == [9, 3, 5, 10, 4, 7, 10, 2, 6, 8]
+
+    def test_ties_keep_input_order(self):
+        """Test: equal scores are ranked in input order (stable)."""
+        assert SUECalculationService._decile_ranks([1.0, 1.0, 1.0, 1.0]) == [3, 6, 8, 10]
+
+    def test_single_score(self):
+        """Test: a lone score lands in the top decile."""
+        assert SUECalculationService._decile_ranks([0.3]) == [10]
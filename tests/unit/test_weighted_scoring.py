@@ -316,6 +316,20 @@ class TestTierBoundaries:
             'mins': 2700
         }
 
+    @pytest.mark.parametrize('score,tier', [
+        (0.0, 'POOR'),
+        (49.99, 'POOR'),
+        (50.0, 'AVERAGE'),
+        (69.99, 'AVERAGE'),
+        (70.0, 'GOOD'),
+        (84.99, 'GOOD'),
+        (85.0, 'ELITE'),
+        (120.0, 'ELITE'),
+    ])
+    def test_score_to_tier_boundaries(self, evaluator, score, tier):
+        """Lower bound of each band belongs to the higher tier."""
+        assert evaluator._score_to_tier(score) == tier
+
     def test_elite_tier_threshold(self, evaluator, base_player_data):
         """Score >= 85 should be ELITE tier."""
         # Create player that scores exactly at ELITE boundary
@@ -0,0 +1,76 @@
+"""
+Process Pool Helpers
+
+Shared worker-count handling for the services that can spread independent
+work (players, stocks, divisions) over worker processes. Worker counts
+follow one convention everywhere: 1 runs serially in the calling process,
+-1 starts one worker per CPU, and any other positive integer starts that
+many workers.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, List, Optional, Sequence, Union
+from flask import current_app
+
+
+def parse_n_jobs(value: Union[int, str]) -> int:
+    """
+    Validate a worker count, e.g. from config or the environment.
+
+    Args:
+        value: Worker count as an int or a numeric string
+
+    Returns:
+        The worker count as an int
+
+    Raises:
+        ValueError: If the value is not 1, -1 or a positive integer
+    """
+    n_jobs = value
+    if isinstance(n_jobs, str) and n_jobs.strip().lstrip('-').isdigit():
+        n_jobs = int(n_jobs)
+
+    if isinstance(n_jobs, bool) or not isinstance(n_jobs, int) or not (n_jobs == -1 or n_jobs >= 1):
+        raise ValueError(f"Worker count must be 1, -1 or a positive integer, got {value!r}")
+
+    return n_jobs
+
+
+def configured_n_jobs(n_jobs: Optional[int] = None) -> int:
+    """
+    Worker count to use: the explicit value, else the app's ANALYSIS_WORKERS.
+
+    Args:
+        n_jobs: Explicit worker count, or None to read the app config
+
+    Returns:
+        Validated worker count
+    """
+    if n_jobs is None:
+        n_jobs = current_app.config.get('ANALYSIS_WORKERS', 1)
+    return parse_n_jobs(n_jobs)
+
+
+def process_map(func: Callable, *sequences: Sequence, n_jobs: int = 1) -> List[Any]:
+    """
+    Map ``func`` over ``sequences``, in worker processes when n_jobs != 1.
+
+    Runs serially when n_jobs is 1 or there is at most one item, since
+    starting a pool would only add overhead. ``func`` and the items must be
+    picklable for the parallel path.
+
+    Args:
+        func: Module-level function to apply
+        *sequences: Argument sequences, all the same length
+        n_jobs: Worker processes (1 = serial, -1 = one per CPU)
+
+    Returns:
+        Results in input order
+    """
+    n_jobs = parse_n_jobs(n_jobs)
+    if n_jobs == 1 or len(sequences[0]) < 2:
+        return list(map(func, *sequences))
+
+    max_workers = None if n_jobs == -1 else n_jobs
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(func, *sequences))